@@ -1,19 +1,284 @@
+import argparse
+import os
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
+
 import pandas as pd  # type: ignore
+from loguru import logger  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+
+from classes.dag import DagRunner
+from classes.data_extractor import PARSER_ENGINES, DataExtractor
+from classes.file_manifest import FileManifest
+from classes.stage_pipeline import StagePipeline
+from decorators.decorators import (configure_logging, enable_profiling,
+                                   log_decorator, time_decorador)
+from decorators.metrics import METRICS
+from funcs.extract import (deduplicate_orders, extract_and_consolidate,
+                           extract_and_consolidate_arrow,
+                           extract_changed_files, extract_chunks)
+from funcs.load import load_data, load_data_concurrent
+from funcs.transform import (CUBE_COLUMNS, TRANSFORM_COLUMNS, aggregate_chunk,
+                             build_daily_cube, merge_partial_aggregates,
+                             rollup_cube, summarize_sketches,
+                             transform_arrow_table, transform_chunks,
+                             transform_data, transform_incremental,
+                             transform_parallel)
+
+CUBE_TABLE: str = 'sales_cube'
+PARTIALS_TABLE: str = 'sales_consolidated_partials'
+
+
+def _collect_daily_cubes(chunks: Iterable[pd.DataFrame], daily_cubes: list[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+    """
+    Repassa os blocos recebidos, guardando o cubo diário de cada um (`build_daily_cube`).
+
+    Parameters:
+        chunks (Iterable[pd.DataFrame]): Blocos validados de `extract_chunks`.
+        daily_cubes (list[pd.DataFrame]): Lista que recebe o cubo diário de cada bloco.
+
+    Returns:
+        Iterator[pd.DataFrame]: Os mesmos blocos, na ordem em que foram recebidos.
+    """
+    for chunk in chunks:
+        daily_cubes.append(build_daily_cube(chunk))
+        yield chunk
+
+def build_stage_pipeline(daily_cubes: list[pd.DataFrame] | None = None, sketches: bool = False,
+                         raw_table: str | None = None, queue_size: int = 4,
+                         partials_table: str | None = None, engine: Engine | None = None) -> StagePipeline:
+    """
+    Declara as etapas por bloco da pipeline em estágios (ver `StagePipeline`).
+
+    Cada etapa roda em sua própria thread, ligada à anterior por uma fila limitada: a gravação dos
+    blocos brutos no banco (se `raw_table` for informado), o cubo diário de cada bloco (se
+    `daily_cubes` for informado), o resultado parcial da transformação (`aggregate_chunk`) e a
+    gravação de cada parcial no banco (se `partials_table` for informado). Assim, a análise dos
+    arquivos, a agregação e as escritas no banco acontecem ao mesmo tempo, e ao final resta gravar
+    apenas o total, com uma linha por método de pagamento.
+
+    Parameters:
+        daily_cubes (list[pd.DataFrame] | None): Lista que recebe o cubo diário de cada bloco.
+            Se None, o cubo não é calculado. Padrão: None.
+        sketches (bool): Se True, os parciais incluem os sketches. Padrão: False.
+        raw_table (str | None): Tabela que recebe os blocos brutos, recriada pelo primeiro bloco.
+            Se None, os blocos não são gravados. Padrão: None.
+        queue_size (int): Número máximo de blocos em cada fila entre etapas. Padrão: 4.
+        partials_table (str | None): Tabela que recebe o parcial de cada bloco, recriada pelo
+            primeiro parcial, como `PARTIALS_TABLE`. Se None, os parciais não são gravados. Padrão: None.
+        engine (Engine | None): Engine usada nas gravações. Se None, usa a engine compartilhada
+            do processo. Padrão: None.
+
+    Returns:
+        StagePipeline: Etapas prontas para serem executadas com `run`, que entrega os parciais.
+    """
+    stages = StagePipeline(maxsize = queue_size)
+
+    def appender(table_name: str) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        written_chunks = []
+
+        def load(chunk: pd.DataFrame) -> pd.DataFrame:
+            if not chunk.empty:
+                load_data(chunk, bulk = True, engine = engine, mode = 'append' if written_chunks else 'replace',
+                          table_name = table_name)
+                written_chunks.append(len(chunk))
+            return chunk
+        return load
+
+    if raw_table:
+        stages.add_stage('load_raw', appender(raw_table))
+
+    if daily_cubes is not None:
+        def collect_cube(chunk: pd.DataFrame) -> pd.DataFrame:
+            daily_cubes.append(build_daily_cube(chunk))
+            return chunk
+        stages.add_stage('cube', collect_cube)
 
-from decorators.decorators import log_decorator, time_decorador
-from funcs.extract import extract_and_consolidate
-from funcs.load import load_data
-from funcs.transform import transform_data
+    stages.add_stage('transform', partial(aggregate_chunk, sketches = sketches))
+    if partials_table:
+        stages.add_stage('load_partial', appender(partials_table))
+    return stages
 
+def build_pipeline_dag(input_path: str, columns: list[str] | None = None,
+                       filters: list[tuple[str, str, Any]] | None = None, build_cube: bool = False,
+                       sketches: bool = False, deduplicate: str | None = None, parser_engine: str = 'c',
+                       checkpoint_dir: str | None = './data/checkpoints', max_workers: int = 4,
+                       load_mode: str = 'replace') -> DagRunner:
+    """
+    Declara a pipeline como um grafo de etapas para o `DagRunner`.
+
+    As leituras de CSV, JSON e Parquet são nós independentes, executados ao mesmo tempo. A
+    consolidação depende das três leituras, e a transformação e o cubo de vendas dependem apenas
+    da consolidação, de modo que também são executados ao mesmo tempo. Cada carga depende apenas
+    do resultado que grava. Se uma carga falhar, a próxima execução retoma a partir dos
+    checkpoints, sem reler os arquivos. Os parâmetros de cada etapa e os arquivos lidos fazem parte
+    da impressão digital dos checkpoints: se mudarem, as etapas afetadas são executadas novamente.
+
+    Parameters:
+        input_path (str): Diretório dos arquivos de entrada.
+        columns (list[str] | None): Colunas lidas pelo `DataExtractor`. Padrão: None (todas).
+        filters (list[tuple[str, str, Any]] | None): Predicados repassados aos leitores. Padrão: None.
+        build_cube (bool): Se True, inclui o cubo de vendas e a sua carga. Padrão: False.
+        sketches (bool): Se True, inclui os sketches na transformação. Padrão: False.
+        deduplicate (str | None): Política de deduplicação por 'order_id' aplicada na consolidação.
+            Padrão: None.
+        parser_engine (str): Motor de leitura de CSV e JSON: 'c' ou 'pyarrow'. Padrão: 'c'.
+        checkpoint_dir (str | None): Diretório dos checkpoints. Padrão: './data/checkpoints'.
+        max_workers (int): Número máximo de etapas executadas simultaneamente. Padrão: 4.
+        load_mode (str): Modo de carga de 'sales_consolidated' (ver `load_data`). Padrão: 'replace'.
+
+    Returns:
+        DagRunner: Grafo pronto para ser executado com `run`.
+    """
+    drop_order_id = bool(deduplicate and columns is not None and 'order_id' not in columns)
+    if drop_order_id:
+        columns = [*columns, 'order_id']
+    extractor = DataExtractor(columns = columns, filters = filters, parser_engine = parser_engine)
+
+    def consolidate(*frames: pd.DataFrame) -> pd.DataFrame:
+        data = pd.concat(frames, ignore_index=True)
+        if deduplicate:
+            data = deduplicate_orders(data, deduplicate)
+        return data.drop(columns='order_id') if drop_order_id else data
+
+    def transform(data: pd.DataFrame) -> pd.DataFrame:
+        transformed_data = transform_data(data.copy(deep=False), sketches = sketches)
+        return summarize_sketches(transformed_data) if sketches else transformed_data
+
+    read_params = {'columns': columns, 'filters': filters, 'parser_engine': parser_engine}
+
+    dag = DagRunner(checkpoint_dir = checkpoint_dir, max_workers = max_workers)
+    for file_format, read in [('csv', extractor.read_csv_data), ('json', extractor.read_json_data),
+                              ('parquet', extractor.read_parquet_data)]:
+        dag.add_node(f'extract_{file_format}', partial(read, input_path), params = read_params,
+                     inputs = [os.path.join(input_path, f'*.{file_format}')])
+    dag.add_node('consolidate', consolidate, depends_on = ['extract_csv', 'extract_json', 'extract_parquet'],
+                 params = {'deduplicate': deduplicate, 'drop_order_id': drop_order_id})
+    dag.add_node('transform', transform, depends_on = ['consolidate'], params = {'sketches': sketches})
+    dag.add_node('load', partial(load_data, mode = load_mode), depends_on = ['transform'],
+                 params = {'mode': load_mode})
+    if build_cube:
+        dag.add_node('cube', lambda data: rollup_cube(build_daily_cube(data)), depends_on = ['consolidate'])
+        dag.add_node('load_cube', partial(load_data, table_name = CUBE_TABLE), depends_on = ['cube'])
+    return dag
 
 @time_decorador
 @log_decorator
-def main():
-    input_path: str = './data/raw'
+def main(input_path: str = './data/raw', streaming: bool = False, chunksize: int = 100_000,
+         incremental: bool = False, manifest_path: str = './data/manifest.json', backend: str = 'pandas',
+         project_columns: bool = False, filters: list[tuple[str, str, Any]] | None = None,
+         build_cube: bool = False, sketches: bool = False, deduplicate: str | None = None,
+         parser_engine: str = 'c', dag: bool = False, checkpoint_dir: str = './data/checkpoints',
+         pipelined: bool = False, queue_size: int = 4, raw_table: str | None = None,
+         partials_table: str | None = None, transform_workers: int | None = None, async_load: bool = False,
+         load_concurrency: int = 4, load_mode: str | None = None):
+    columns = TRANSFORM_COLUMNS if project_columns else None
+    if columns is not None and build_cube:
+        columns = list(dict.fromkeys([*columns, *CUBE_COLUMNS]))
+    if columns is not None and sketches:
+        columns = [*columns, 'customer_id']
+    daily_cubes: list[pd.DataFrame] = []
 
-    data: pd.DataFrame = extract_and_consolidate(input_path)
-    transformed_data: pd.DataFrame = transform_data(data)
-    load_data(transformed_data)
+    if incremental:
+        if build_cube:
+            logger.warning('O cubo de vendas não é construído no modo incremental.')
+        manifest = FileManifest(manifest_path)
+        changed_data = extract_changed_files(input_path, manifest, deduplicate = deduplicate,
+                                             parser_engine = parser_engine)
+
+        if changed_data or manifest.partials_changed:
+            totals = transform_incremental(changed_data, manifest, sketches = sketches)
+            load_data(summarize_sketches(totals) if sketches else totals, mode = load_mode or 'replace')
+        else:
+            logger.info('Nenhum arquivo novo ou modificado. Carga ignorada.')
+
+        if manifest.modified:
+            manifest.save()
+        return
+
+    if dag:
+        build_pipeline_dag(input_path, columns = columns, filters = filters, build_cube = build_cube,
+                           sketches = sketches, deduplicate = deduplicate, parser_engine = parser_engine,
+                           checkpoint_dir = checkpoint_dir, load_mode = load_mode or 'replace').run()
+        return
+
+    if backend == 'arrow':
+        if sketches or deduplicate:
+            logger.warning('Os sketches e a deduplicação não são aplicados com o backend Arrow.')
+        table = extract_and_consolidate_arrow(input_path)
+        transformed_data: pd.DataFrame = transform_arrow_table(table)
+        if build_cube:
+            daily_cubes.append(build_daily_cube(table.select(CUBE_COLUMNS).to_pandas()))
+    elif pipelined:
+        chunks = extract_chunks(input_path, chunksize, columns = columns, filters = filters,
+                                deduplicate = deduplicate, parser_engine = parser_engine)
+        stages = build_stage_pipeline(daily_cubes if build_cube else None, sketches = sketches,
+                                      raw_table = raw_table, queue_size = queue_size,
+                                      partials_table = partials_table)
+        transformed_data = merge_partial_aggregates(stages.run(chunks))
+    elif streaming:
+        chunks = extract_chunks(input_path, chunksize, columns = columns, filters = filters,
+                                deduplicate = deduplicate, parser_engine = parser_engine)
+        if build_cube:
+            chunks = _collect_daily_cubes(chunks, daily_cubes)
+        transformed_data = transform_chunks(chunks, sketches = sketches)
+    elif transform_workers and not (build_cube or deduplicate):
+        transformed_data = transform_parallel(input_path, max_workers = transform_workers, filters = filters,
+                                              sketches = sketches, parser_engine = parser_engine)
+    else:
+        if transform_workers:
+            logger.warning('O cubo e a deduplicação exigem os dados consolidados. Usando transform_data.')
+        data: pd.DataFrame = extract_and_consolidate(input_path, columns = columns, filters = filters,
+                                                     deduplicate = deduplicate, parser_engine = parser_engine)
+        if build_cube:
+            daily_cubes.append(build_daily_cube(data))
+        transformed_data = transform_data(data, sketches = sketches)
+
+    if sketches and backend != 'arrow':
+        transformed_data = summarize_sketches(transformed_data)
+    if async_load and load_mode == 'upsert':
+        logger.warning("O modo 'upsert' não é suportado pela carga assíncrona. Usando load_data.")
+    if async_load and load_mode != 'upsert':
+        load_data_concurrent(transformed_data, mode = load_mode or 'swap', max_concurrency = load_concurrency)
+    else:
+        load_data(transformed_data, mode = load_mode or 'replace')
+    if daily_cubes:
+        load_data(rollup_cube(pd.concat(daily_cubes, ignore_index=True)), table_name = CUBE_TABLE)
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Executa a pipeline ETL de vendas.')
+    parser.add_argument('--profile', nargs='?', const='./data/profile', default=None, metavar='DIR',
+                        help='Grava um perfil (cProfile e tracemalloc) de cada etapa no diretório informado.')
+    parser.add_argument('--parser-engine', choices=PARSER_ENGINES, default='c',
+                        help="Motor de leitura de CSV e JSON: 'c' (pandas) ou 'pyarrow' (multithread).")
+    parser.add_argument('--dag', action='store_true',
+                        help='Executa as etapas como um grafo, com checkpoints para retomar execuções que falharam.')
+    parser.add_argument('--checkpoint-dir', default='./data/checkpoints', metavar='DIR',
+                        help='Diretório dos checkpoints do modo --dag.')
+    parser.add_argument('--pipelined', action='store_true',
+                        help='Lê, transforma e grava os blocos ao mesmo tempo, em etapas ligadas por filas limitadas.')
+    parser.add_argument('--raw-table', default=None, metavar='TABLE',
+                        help='No modo --pipelined, grava também os blocos brutos nesta tabela.')
+    parser.add_argument('--partials-table', nargs='?', const=PARTIALS_TABLE, default=None, metavar='TABLE',
+                        help='No modo --pipelined, grava também o parcial de cada bloco nesta tabela (%(const)s).')
+    parser.add_argument('--transform-workers', type=int, default=None, metavar='N',
+                        help='Lê e agrega cada arquivo de entrada em um pool de N processos.')
+    parser.add_argument('--async-load', action='store_true',
+                        help='Carrega o resultado em partições gravadas ao mesmo tempo, com publicação atômica.')
+    parser.add_argument('--load-concurrency', type=int, default=4, metavar='N',
+                        help='Número máximo de partições gravadas ao mesmo tempo no modo --async-load.')
+    parser.add_argument('--load-mode', choices=['replace', 'upsert', 'swap'], default=None,
+                        help="Modo de carga de 'sales_consolidated'. Padrão: 'replace' ('swap' com --async-load).")
+    args = parser.parse_args()
+
+    configure_logging()
+    if args.profile:
+        enable_profiling(args.profile)
+
+    try:
+        main(parser_engine = args.parser_engine, dag = args.dag, checkpoint_dir = args.checkpoint_dir,
+             pipelined = args.pipelined, raw_table = args.raw_table, partials_table = args.partials_table,
+             transform_workers = args.transform_workers, async_load = args.async_load,
+             load_concurrency = args.load_concurrency, load_mode = args.load_mode)
+    finally:
+        METRICS.flush(os.getenv('METRICS_DIR', './data/metrics'))
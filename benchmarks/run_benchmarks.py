@@ -0,0 +1,370 @@
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterator
+
+import pandas as pd  # type: ignore
+import pandera as pa  # type: ignore
+from sqlalchemy import create_engine
+
+from classes.data_extractor import DataExtractor
+from decorators.decorators import configure_logging
+from decorators.metrics import peak_rss_bytes
+from funcs.extract import extract_chunks
+from funcs.generate_data import generate_scaled_data
+from funcs.load import load_data
+from funcs.transform import merge_partial_aggregates, transform_data
+
+BASELINE_PATH: str = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def _csv_chunks(data_dir: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Lê os arquivos CSV do diretório em blocos, sem validação.
+
+    Parameters:
+        data_dir (str): Diretório dos dados sintéticos.
+        chunksize (int): Número máximo de linhas por bloco.
+
+    Returns:
+        Iterator[pd.DataFrame]: Blocos de cada arquivo, em ordem alfabética dos arquivos.
+    """
+    for path in sorted(glob.glob(os.path.join(data_dir, '*.csv'))):
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def _timed_chunks(chunks: Iterator[pd.DataFrame], work: Callable[[pd.DataFrame], Any]) -> tuple[int, float, list[Any]]:
+    """
+    Aplica `work` a cada bloco, medindo apenas o tempo de `work` (sem a leitura dos blocos).
+
+    Parameters:
+        chunks (Iterator[pd.DataFrame]): Blocos de entrada.
+        work (Callable[[pd.DataFrame], Any]): Função aplicada a cada bloco.
+
+    Returns:
+        tuple[int, float, list[Any]]: Linhas processadas, segundos gastos em `work` e resultados de cada bloco.
+    """
+    rows, elapsed, results = 0, 0, []
+    for chunk in chunks:
+        start_time = time.perf_counter_ns()
+        results.append(work(chunk))
+        elapsed += time.perf_counter_ns() - start_time
+        rows += len(chunk)
+    return rows, elapsed / 1e9, results
+
+
+def _stage_generate(data_dir: str, n_rows: int, n_files: int, chunksize: int, dirty_ratio: float) -> tuple[int, float]:
+    """
+    Etapa 'generate': gera os dados sintéticos nos três formatos.
+
+    Parameters:
+        data_dir (str): Diretório onde os dados sintéticos são gravados.
+        n_rows (int): Número de linhas por formato.
+        n_files (int): Número de arquivos por formato.
+        chunksize (int): Número máximo de linhas gravadas por vez.
+        dirty_ratio (float): Fração das linhas com valores inválidos.
+
+    Returns:
+        tuple[int, float]: Linhas geradas (nos três formatos) e segundos gastos.
+    """
+    start_time = time.perf_counter_ns()
+    generate_scaled_data(data_dir, n_rows, n_files = n_files, chunksize = chunksize, dirty_ratio = dirty_ratio)
+    return n_rows * 3, (time.perf_counter_ns() - start_time) / 1e9
+
+
+def _stage_parse(data_dir: str, chunksize: int) -> tuple[int, float]:
+    """
+    Etapa 'parse': lê os arquivos CSV em blocos, sem validação.
+
+    Parameters:
+        data_dir (str): Diretório dos dados sintéticos.
+        chunksize (int): Número máximo de linhas por bloco.
+
+    Returns:
+        tuple[int, float]: Linhas lidas e segundos gastos.
+    """
+    start_time = time.perf_counter_ns()
+    rows = sum(len(chunk) for chunk in _csv_chunks(data_dir, chunksize))
+    return rows, (time.perf_counter_ns() - start_time) / 1e9
+
+
+def _stage_validate(data_dir: str, chunksize: int, validation: str) -> tuple[int, float]:
+    """
+    Etapa 'validate': valida cada bloco dos arquivos CSV com o esquema do `DataExtractor`.
+
+    Blocos inválidos não interrompem a etapa; apenas o tempo da validação é medido.
+
+    Parameters:
+        data_dir (str): Diretório dos dados sintéticos.
+        chunksize (int): Número máximo de linhas por bloco.
+        validation (str): Modo de validação do `DataExtractor`.
+
+    Returns:
+        tuple[int, float]: Linhas validadas e segundos gastos na validação.
+    """
+    extractor = DataExtractor(validation = validation)
+
+    def validate(chunk: pd.DataFrame) -> bool:
+        try:
+            extractor.validate_dataframe(chunk)
+            return True
+        except pa.errors.SchemaError:
+            return False
+
+    rows, seconds, _ = _timed_chunks(_csv_chunks(data_dir, chunksize), validate)
+    return rows, seconds
+
+
+def _stage_extract(data_dir: str, chunksize: int, validation: str) -> tuple[int, float]:
+    """
+    Etapa 'extract': extrai e valida em blocos os arquivos dos três formatos com `extract_chunks`.
+
+    Parameters:
+        data_dir (str): Diretório dos dados sintéticos.
+        chunksize (int): Número máximo de linhas por bloco.
+        validation (str): Modo de validação do `DataExtractor`.
+
+    Returns:
+        tuple[int, float]: Linhas extraídas e segundos gastos.
+    """
+    start_time = time.perf_counter_ns()
+    rows = sum(len(chunk) for chunk in extract_chunks(data_dir, chunksize, validation = validation))
+    return rows, (time.perf_counter_ns() - start_time) / 1e9
+
+
+def _source_chunks(data_dir: str, chunksize: int, validation: str, valid: bool) -> Iterator[pd.DataFrame]:
+    """
+    Retorna os blocos de entrada das etapas de transformação e de carga.
+
+    Parameters:
+        data_dir (str): Diretório dos dados sintéticos.
+        chunksize (int): Número máximo de linhas por bloco.
+        validation (str): Modo de validação do `DataExtractor`.
+        valid (bool): Se True, os blocos vêm de `extract_chunks`; caso contrário, dos CSV sem
+            validação, pois a extração falharia com as linhas inválidas.
+
+    Returns:
+        Iterator[pd.DataFrame]: Blocos de entrada.
+    """
+    if valid:
+        return extract_chunks(data_dir, chunksize, validation = validation)
+    return _csv_chunks(data_dir, chunksize)
+
+
+def _stage_transform(data_dir: str, chunksize: int, validation: str, valid: bool) -> tuple[int, float]:
+    """
+    Etapa 'transform': agrega cada bloco com `transform_data` e combina os parciais.
+
+    Parameters:
+        data_dir (str): Diretório dos dados sintéticos.
+        chunksize (int): Número máximo de linhas por bloco.
+        validation (str): Modo de validação do `DataExtractor`.
+        valid (bool): Se os dados não têm linhas inválidas (ver `_source_chunks`).
+
+    Returns:
+        tuple[int, float]: Linhas transformadas e segundos gastos, sem a leitura dos blocos.
+    """
+    rows, seconds, partials = _timed_chunks(_source_chunks(data_dir, chunksize, validation, valid), transform_data)
+    start_time = time.perf_counter_ns()
+    merge_partial_aggregates(partials)
+    return rows, seconds + (time.perf_counter_ns() - start_time) / 1e9
+
+
+def _stage_load(data_dir: str, chunksize: int, validation: str, valid: bool, database_url: str) -> tuple[int, float]:
+    """
+    Etapa 'load': grava cada bloco em lotes na tabela `benchmark_sales`.
+
+    Parameters:
+        data_dir (str): Diretório dos dados sintéticos.
+        chunksize (int): Número máximo de linhas por bloco.
+        validation (str): Modo de validação do `DataExtractor`.
+        valid (bool): Se os dados não têm linhas inválidas (ver `_source_chunks`).
+        database_url (str): URL SQLAlchemy do banco usado na carga.
+
+    Returns:
+        tuple[int, float]: Linhas gravadas e segundos gastos, sem a leitura dos blocos.
+    """
+    engine = create_engine(database_url)
+    written_chunks: list[int] = []
+
+    def load(chunk: pd.DataFrame) -> None:
+        load_data(chunk, bulk = True, engine = engine, mode = 'append' if written_chunks else 'replace',
+                  table_name = 'benchmark_sales')
+        written_chunks.append(len(chunk))
+
+    try:
+        rows, seconds, _ = _timed_chunks(_source_chunks(data_dir, chunksize, validation, valid), load)
+    finally:
+        engine.dispose()
+    return rows, seconds
+
+
+def _run_stage(log_path: str, stage: Callable[..., tuple[int, float]], *args: Any) -> dict[str, Any]:
+    """
+    Executa uma etapa no processo atual e calcula as suas métricas.
+
+    Parameters:
+        log_path (str): Arquivo de log do processo da etapa.
+        stage (Callable[..., tuple[int, float]]): Etapa que retorna as linhas processadas e os segundos gastos.
+        *args (Any): Argumentos da etapa.
+
+    Returns:
+        dict[str, Any]: Tempo, linhas, vazão e pico de memória residente do processo.
+    """
+    configure_logging(log_path = log_path, decorator_logs = False)
+    rows, seconds = stage(*args)
+    return {
+        'seconds': seconds,
+        'rows': rows,
+        'rows_per_second': rows / seconds if seconds else 0.0,
+        'peak_rss_bytes': peak_rss_bytes()
+    }
+
+
+def _measure(log_path: str, stage: Callable[..., tuple[int, float]], *args: Any) -> dict[str, Any]:
+    """
+    Executa uma etapa em um processo próprio, para que o pico de memória medido seja só o dela.
+
+    O pico de RSS (`ru_maxrss`) é o maior valor já atingido pelo processo; medido no processo do
+    benchmark, todas as etapas posteriores à de maior consumo repetiriam o mesmo valor.
+
+    Parameters:
+        log_path (str): Arquivo de log do processo da etapa.
+        stage (Callable[..., tuple[int, float]]): Etapa que retorna as linhas processadas e os segundos gastos.
+        *args (Any): Argumentos da etapa.
+
+    Returns:
+        dict[str, Any]: Métricas da etapa (ver `_run_stage`).
+    """
+    with ProcessPoolExecutor(max_workers = 1, mp_context = multiprocessing.get_context('spawn')) as executor:
+        return executor.submit(_run_stage, log_path, stage, *args).result()
+
+
+def run_benchmark(data_dir: str, n_rows: int, n_files: int = 1, chunksize: int = 1_000_000,
+                  dirty_ratio: float = 0.0, validation: str = 'full', database_url: str | None = None) -> dict[str, Any]:
+    """
+    Gera um conjunto de dados sintético e mede o tempo de cada etapa da pipeline.
+
+    As etapas medidas são: geração dos dados ('generate'), leitura dos CSV sem validação ('parse'),
+    validação ('validate'), extração em blocos dos três formatos ('extract', omitida quando há linhas
+    inválidas, pois a extração falharia), transformação ('transform') e carga em lotes ('load'). Todas
+    as etapas processam os dados em blocos de no máximo `chunksize` linhas, de modo que o benchmark
+    roda nas mesmas escalas de `generate_scaled_data`; nas etapas de validação, transformação e
+    carga, apenas o tempo da própria etapa é medido, sem a leitura dos blocos.
+
+    Cada etapa é executada em um processo próprio. Para cada uma são registrados o tempo, as linhas,
+    a vazão em linhas por segundo e o pico de memória residente do processo da etapa. Os logs das
+    etapas são gravados em `data_dir/benchmark.log`.
+
+    Parameters:
+        data_dir (str): Diretório onde os dados sintéticos são gravados.
+        n_rows (int): Número de linhas por formato.
+        n_files (int): Número de arquivos por formato. Padrão: 1.
+        chunksize (int): Número máximo de linhas gravadas e processadas por vez. Padrão: 1_000_000.
+        dirty_ratio (float): Fração das linhas com valores inválidos. Padrão: 0.0.
+        validation (str): Modo de validação do `DataExtractor`. Padrão: 'full'.
+        database_url (str | None): URL SQLAlchemy do banco usado na carga (SQLite ou PostgreSQL).
+            Se None, usa um SQLite em `data_dir`. Padrão: None.
+
+    Returns:
+        dict[str, Any]: Parâmetros da execução e métricas de cada etapa.
+    """
+    valid = dirty_ratio == 0
+    database_url = database_url or f"sqlite:///{os.path.join(data_dir, 'benchmark.db')}"
+    log_path = os.path.join(data_dir, 'benchmark.log')
+
+    stages: dict[str, dict[str, Any]] = {
+        'generate': _measure(log_path, _stage_generate, data_dir, n_rows, n_files, chunksize, dirty_ratio),
+        'parse': _measure(log_path, _stage_parse, data_dir, chunksize),
+        'validate': _measure(log_path, _stage_validate, data_dir, chunksize, validation)
+    }
+    stages['validate']['valid'] = valid
+
+    if valid:
+        stages['extract'] = _measure(log_path, _stage_extract, data_dir, chunksize, validation)
+    stages['transform'] = _measure(log_path, _stage_transform, data_dir, chunksize, validation, valid)
+    stages['load'] = _measure(log_path, _stage_load, data_dir, chunksize, validation, valid, database_url)
+
+    return {
+        'params': {'n_rows': n_rows, 'n_files': n_files, 'dirty_ratio': dirty_ratio, 'validation': validation},
+        'stages': stages
+    }
+
+
+def compare_with_baseline(results: dict[str, Any], baseline: dict[str, Any], tolerance: float = 0.2) -> list[str]:
+    """
+    Compara a vazão de cada etapa com a de uma execução de referência.
+
+    Parameters:
+        results (dict[str, Any]): Resultado de `run_benchmark`.
+        baseline (dict[str, Any]): Resultado de referência, no mesmo formato.
+        tolerance (float): Queda relativa de vazão tolerada antes de indicar uma regressão. Padrão: 0.2.
+
+    Returns:
+        list[str]: Uma mensagem por etapa com regressão. Etapas ausentes em algum dos resultados são ignoradas.
+    """
+    regressions: list[str] = []
+
+    for stage, metrics in results['stages'].items():
+        reference = baseline.get('stages', {}).get(stage)
+        if not reference or not reference['rows_per_second']:
+            continue
+
+        ratio = metrics['rows_per_second'] / reference['rows_per_second']
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{stage}: {metrics['rows_per_second']:,.0f} linhas/s contra {reference['rows_per_second']:,.0f} "
+                f"na referência ({ratio - 1:+.1%})."
+            )
+    return regressions
+
+
+def print_report(results: dict[str, Any]) -> None:
+    """
+    Exibe uma tabela com as métricas de cada etapa.
+
+    Parameters:
+        results (dict[str, Any]): Resultado de `run_benchmark`.
+    """
+    print(f"{'etapa':<10} {'segundos':>10} {'linhas':>12} {'linhas/s':>14} {'pico RSS (MB)':>14}")
+    for stage, metrics in results['stages'].items():
+        print(f"{stage:<10} {metrics['seconds']:>10.3f} {metrics['rows']:>12,} "
+              f"{metrics['rows_per_second']:>14,.0f} {metrics['peak_rss_bytes'] / 1024 ** 2:>14.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Executa os benchmarks da pipeline com dados sintéticos.')
+    parser.add_argument('--rows', type=int, default=100_000, help='Número de linhas por formato.')
+    parser.add_argument('--files', type=int, default=1, help='Número de arquivos por formato.')
+    parser.add_argument('--chunksize', type=int, default=1_000_000, help='Linhas gravadas e processadas por bloco.')
+    parser.add_argument('--dirty-ratio', type=float, default=0.0, help='Fração das linhas com valores inválidos.')
+    parser.add_argument('--validation', default='full', help="Modo de validação: 'full', 'fast' ou 'sample'.")
+    parser.add_argument('--data-dir', default=None, help='Diretório dos dados gerados. Padrão: diretório temporário.')
+    parser.add_argument('--database-url', default=None, help='URL SQLAlchemy do banco de carga. Padrão: SQLite local.')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Arquivo JSON com os resultados de referência.')
+    parser.add_argument('--save-baseline', action='store_true', help='Grava os resultados como nova referência.')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Queda de vazão tolerada (0.2 = 20%%).')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = run_benchmark(args.data_dir or temp_dir, args.rows, n_files = args.files,
+                                chunksize = args.chunksize, dirty_ratio = args.dirty_ratio,
+                                validation = args.validation, database_url = args.database_url)
+    print_report(results)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+        print(f"Referência gravada em '{args.baseline}'.")
+    elif os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as file:
+            regressions = compare_with_baseline(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f'Regressão em {regression}')
+        sys.exit(1 if regressions else 0)
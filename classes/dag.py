@@ -0,0 +1,279 @@
+import glob
+import hashlib
+import json
+import os
+from concurrent.futures import (FIRST_COMPLETED, Future, ThreadPoolExecutor,
+                                wait)
+from typing import Any, Callable
+
+import pandas as pd  # type: ignore
+from loguru import logger  # type: ignore
+
+STATE_FILE: str = 'dag_state.json'
+
+
+class DagRunner:
+    """
+    Classe para executar etapas da pipeline declaradas como um grafo acíclico de dependências.
+
+    Cada nó é uma função que recebe, como argumentos posicionais, os resultados dos nós dos quais
+    depende, na ordem declarada. Nós independentes são executados ao mesmo tempo em um pool de
+    threads, e cada nó começa assim que todas as suas dependências terminam.
+
+    Quando `checkpoint_dir` é informado, o resultado de cada nó concluído é gravado nesse diretório:
+    DataFrames em arquivos Parquet e nós sem resultado (como as cargas) apenas como concluídos no
+    arquivo de estado. Se a execução falhar, a próxima execução retoma a partir dos nós que não
+    terminaram, lendo dos checkpoints apenas os resultados de que eles precisam. Resultados de outros
+    tipos não são gravados, e seus nós são executados novamente. Ao final de uma execução bem-sucedida,
+    os checkpoints são removidos, para que a execução seguinte comece do zero.
+
+    Cada nó pode declarar os parâmetros (`params`) e os arquivos de entrada (`inputs`) dos quais o
+    seu resultado depende. Uma impressão digital desses valores (e do tamanho e da data de modificação
+    dos arquivos) é gravada no estado, e o checkpoint de um nó só é reaproveitado se ela não mudou.
+    """
+    def __init__(self, checkpoint_dir: str | None = None, max_workers: int = 4):
+        """
+        Inicializa um grafo vazio.
+
+        Parameters:
+            checkpoint_dir : str | None
+                Diretório dos checkpoints. Se None, nenhum checkpoint é gravado. Padrão: None.
+            max_workers : int
+                Número máximo de nós executados simultaneamente. Padrão: 4.
+
+        Raises:
+            ValueError
+                Se `max_workers` for menor que 1.
+        """
+        if max_workers < 1:
+            raise ValueError(f'O número de workers deve ser maior que zero, mas recebeu {max_workers}.')
+
+        self.checkpoint_dir = checkpoint_dir
+        self.max_workers = max_workers
+        self.nodes: dict[str, tuple[Callable[..., Any], list[str]]] = {}
+        self.node_inputs: dict[str, tuple[dict[str, Any], list[str]]] = {}
+        self._fingerprints: dict[str, str] = {}
+
+    def add_node(self, name: str, func: Callable[..., Any], depends_on: list[str] | None = None,
+                 params: dict[str, Any] | None = None, inputs: list[str] | None = None) -> 'DagRunner':
+        """
+        Adiciona um nó ao grafo.
+
+        Parameters:
+            name : str
+                Nome único do nó, usado também no nome do checkpoint.
+            func : Callable[..., Any]
+                Função executada pelo nó.
+            depends_on : list[str] | None
+                Nomes dos nós cujos resultados são repassados a `func`, nessa ordem. Os nós
+                devem ter sido adicionados antes. Padrão: None.
+            params : dict[str, Any] | None
+                Parâmetros que determinam o resultado do nó, como colunas, filtros ou políticas.
+                Se mudarem, o checkpoint do nó é descartado. Padrão: None.
+            inputs : list[str] | None
+                Caminhos ou padrões `glob` dos arquivos lidos pelo nó. Se algum arquivo for
+                criado, removido ou modificado, o checkpoint do nó é descartado. Padrão: None.
+
+        Returns:
+            DagRunner
+                O próprio grafo, para encadear chamadas.
+
+        Raises:
+            ValueError
+                Se o nome já existir ou se alguma dependência não tiver sido adicionada.
+        """
+        dependencies = list(depends_on or [])
+        if name in self.nodes:
+            raise ValueError(f"O nó '{name}' já foi adicionado ao grafo.")
+        unknown = [dependency for dependency in dependencies if dependency not in self.nodes]
+        if unknown:
+            raise ValueError(f"Dependências desconhecidas do nó '{name}': {unknown}")
+
+        self.nodes[name] = (func, dependencies)
+        self.node_inputs[name] = (dict(params or {}), list(inputs or []))
+        return self
+
+    def _signature(self) -> dict[str, list[str]]:
+        return {name: dependencies for name, (_, dependencies) in self.nodes.items()}
+
+    def _fingerprint(self, name: str) -> str:
+        """
+        Calcula a impressão digital dos parâmetros e dos arquivos de entrada de um nó.
+
+        Parameters:
+            name : str
+                Nome do nó.
+
+        Returns:
+            str
+                Hash SHA-256 dos parâmetros e do caminho, tamanho e data de modificação de cada arquivo.
+        """
+        params, inputs = self.node_inputs[name]
+        files = []
+        for pattern in inputs:
+            for path in sorted(glob.glob(pattern, recursive=True)):
+                stat = os.stat(path)
+                files.append([os.path.normpath(path), stat.st_size, stat.st_mtime_ns])
+
+        content = json.dumps({'params': params, 'inputs': files}, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def _checkpoint_path(self, name: str) -> str:
+        return os.path.join(self.checkpoint_dir, f'{name}.parquet')
+
+    def _load_state(self) -> dict[str, str]:
+        """
+        Carrega os nós concluídos em uma execução anterior que falhou.
+
+        Returns:
+            dict[str, str]
+                Tipo do checkpoint ('parquet' ou 'none') de cada nó concluído. O estado é ignorado se
+                o grafo tiver mudado, e um nó é descartado se os seus parâmetros ou arquivos de
+                entrada tiverem mudado ou se o seu arquivo de checkpoint estiver faltando.
+        """
+        state_path = os.path.join(self.checkpoint_dir, STATE_FILE)
+        if not os.path.exists(state_path):
+            return {}
+
+        with open(state_path, encoding='utf-8') as file:
+            state = json.load(file)
+
+        if state.get('nodes') != self._signature():
+            logger.warning('O grafo mudou desde a última execução. Os checkpoints serão ignorados.')
+            return {}
+
+        fingerprints = state.get('fingerprints', {})
+        changed = [name for name in state['completed'] if fingerprints.get(name) != self._fingerprints[name]]
+        if changed:
+            logger.warning(f'Parâmetros ou entradas alterados desde a última execução. Checkpoints ignorados: {changed}')
+        return {
+            name: kind for name, kind in state['completed'].items()
+            if name not in changed and (kind == 'none' or os.path.exists(self._checkpoint_path(name)))
+        }
+
+    def _save_state(self, completed: dict[str, str]) -> None:
+        state_path = os.path.join(self.checkpoint_dir, STATE_FILE)
+        temp_path = f'{state_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump({'nodes': self._signature(), 'fingerprints': self._fingerprints, 'completed': completed},
+                      file, indent=2)
+        os.replace(temp_path, state_path)
+
+    def _write_checkpoint(self, name: str, result: Any) -> str | None:
+        """
+        Grava o resultado de um nó, se ele tiver um formato suportado.
+
+        Parameters:
+            name : str
+                Nome do nó.
+            result : Any
+                Resultado do nó.
+
+        Returns:
+            str | None
+                'parquet' para DataFrames, 'none' para nós sem resultado, ou None se o resultado
+                não puder ser gravado.
+        """
+        if result is None:
+            return 'none'
+        if not isinstance(result, pd.DataFrame):
+            return None
+
+        path = self._checkpoint_path(name)
+        temp_path = f'{path}.tmp'
+        result.to_parquet(temp_path, engine='fastparquet')
+        os.replace(temp_path, path)
+        return 'parquet'
+
+    def clear_checkpoints(self) -> None:
+        """
+        Remove o arquivo de estado e os checkpoints dos nós do grafo.
+        """
+        if self.checkpoint_dir is None:
+            return
+
+        for path in [os.path.join(self.checkpoint_dir, STATE_FILE), *map(self._checkpoint_path, self.nodes)]:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def run(self) -> dict[str, Any]:
+        """
+        Executa o grafo, retomando a partir dos checkpoints de uma execução anterior que falhou.
+
+        Um nó concluído anteriormente só é reaproveitado se os seus parâmetros e arquivos de entrada
+        não tiverem mudado e se todas as suas dependências também tiverem sido reaproveitadas; caso
+        contrário, ele é executado novamente com os novos resultados.
+        Quando um nó falha, nenhum outro nó é iniciado, os nós em execução terminam (e gravam seus
+        checkpoints) e o erro é relançado.
+
+        Returns:
+            dict[str, Any]
+                Resultado de cada nó executado. Nós reaproveitados aparecem apenas se algum nó
+                executado dependeu deles.
+
+        Raises:
+            Exception
+                O primeiro erro levantado por um nó.
+        """
+        completed: dict[str, str] = {}
+        if self.checkpoint_dir is not None:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            self._fingerprints = {name: self._fingerprint(name) for name in self.nodes}
+            completed = self._load_state()
+
+        skipped: set[str] = set()
+        for name, (_, dependencies) in self.nodes.items():
+            if name in completed and all(dependency in skipped for dependency in dependencies):
+                skipped.add(name)
+                logger.info(f"Nó '{name}' reaproveitado do checkpoint.")
+        completed = {name: kind for name, kind in completed.items() if name in skipped}
+
+        results: dict[str, Any] = {}
+
+        def dependency_result(name: str) -> Any:
+            if name not in results:
+                kind = completed[name]
+                results[name] = pd.read_parquet(self._checkpoint_path(name), engine='fastparquet') if kind == 'parquet' else None
+            return results[name]
+
+        pending = [name for name in self.nodes if name not in skipped]
+        done = set(skipped)
+        running: dict[Future, str] = {}
+        error: BaseException | None = None
+
+        with ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+            while pending or running:
+                if error is None:
+                    for name in [name for name in pending if all(dep in done for dep in self.nodes[name][1])]:
+                        func, dependencies = self.nodes[name]
+                        args = [dependency_result(dependency) for dependency in dependencies]
+                        logger.info(f"Nó '{name}' iniciado.")
+                        running[executor.submit(func, *args)] = name
+                        pending.remove(name)
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"Nó '{name}' falhou: {e}")
+                        error = error or e
+                        continue
+
+                    done.add(name)
+                    logger.info(f"Nó '{name}' concluído.")
+                    if self.checkpoint_dir is not None:
+                        kind = self._write_checkpoint(name, results[name])
+                        if kind is not None:
+                            completed[name] = kind
+                            self._save_state(completed)
+
+        if error is not None:
+            raise error
+
+        self.clear_checkpoints()
+        return results
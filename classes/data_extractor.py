@@ -1,10 +1,133 @@
+import csv
 import glob
+import operator
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
 
+import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 import pandera as pa  # type: ignore
+from fastparquet import ParquetFile  # type: ignore
 from loguru import logger  # type: ignore
 
+from classes.extract_cache import ExtractCache
+from decorators.decorators import profile_decorator
+from decorators.metrics import METRICS
+
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+    import pyarrow.csv as pa_csv  # type: ignore
+    import pyarrow.json as pa_json  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:  # pragma: no cover - dependência opcional
+    pyarrow = None
+
+
+FILE_EXTENSIONS: dict[str, str] = {
+    'csv': '.csv',
+    'json': '.json',
+    'parquet': '.parquet'
+}
+
+SALES_SCHEMA = pa.DataFrameSchema({
+    'order_id': pa.Column(int, checks = pa.Check.gt(0)),
+    'customer_id': pa.Column(int, checks = pa.Check.gt(0)),
+    'order_date': pa.Column(pa.DateTime),
+    'product_id': pa.Column(int, checks = pa.Check.gt(0)),
+    'quantity': pa.Column(int, checks = pa.Check.gt(0)),
+    'price': pa.Column(float, checks = pa.Check.gt(0)),
+    'payment_method': pa.Column(str, nullable = False),
+    'store_location': pa.Column(str, nullable = False)
+})
+
+SCHEMA_DTYPES: dict[str, str] = {
+    'order_id': 'int64',
+    'customer_id': 'int64',
+    'order_date': 'datetime64[ns]',
+    'product_id': 'int64',
+    'quantity': 'int64',
+    'price': 'float64',
+    'payment_method': 'object',
+    'store_location': 'object'
+}
+
+POSITIVE_COLUMNS: list[str] = ['order_id', 'customer_id', 'product_id', 'quantity', 'price']
+NOT_NULL_COLUMNS: list[str] = ['order_date', 'payment_method', 'store_location']
+VALIDATION_MODES: tuple[str, ...] = ('full', 'fast', 'sample')
+PARSER_ENGINES: tuple[str, ...] = ('c', 'pyarrow')
+
+FILTER_OPERATORS: dict[str, Any] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda series, values: series.isin(values),
+    'not in': lambda series, values: ~series.isin(values)
+}
+
+
+def require_pyarrow() -> None:
+    """
+    Verifica se a dependência opcional `pyarrow` está instalada.
+
+    Raises:
+        ImportError
+            Se o `pyarrow` não estiver instalado.
+    """
+    if pyarrow is None:
+        raise ImportError("O modo Arrow requer o pacote 'pyarrow'. Instale-o com 'poetry install --extras arrow'.")
+
+def arrow_schema() -> 'pyarrow.Schema':
+    """
+    Retorna o esquema Arrow equivalente ao esquema de validação `SALES_SCHEMA`.
+
+    Returns:
+        pyarrow.Schema
+            Esquema com os tipos esperados de cada coluna.
+    """
+    require_pyarrow()
+    return pyarrow.schema([
+        ('order_id', pyarrow.int64()),
+        ('customer_id', pyarrow.int64()),
+        ('order_date', pyarrow.timestamp('ns')),
+        ('product_id', pyarrow.int64()),
+        ('quantity', pyarrow.int64()),
+        ('price', pyarrow.float64()),
+        ('payment_method', pyarrow.string()),
+        ('store_location', pyarrow.string())
+    ])
+
+def cast_arrow_column(column: 'pyarrow.ChunkedArray', field: 'pyarrow.Field') -> 'pyarrow.ChunkedArray':
+    """
+    Converte uma coluna Arrow para o tipo de um campo de `arrow_schema`.
+
+    Datas inteiras em 'order_date', como as gravadas pelo `DataFrame.to_json`, são interpretadas
+    como milissegundos desde a época Unix, assim como em `DataExtractor.validate_dataframe`.
+
+    Parameters:
+        column : pyarrow.ChunkedArray
+            Coluna a ser convertida.
+        field : pyarrow.Field
+            Campo com o nome e o tipo esperados.
+
+    Returns:
+        pyarrow.ChunkedArray
+            Coluna convertida, ou a própria coluna se já estiver no tipo esperado.
+
+    Raises:
+        pyarrow.ArrowInvalid
+            Se algum valor não puder ser convertido.
+    """
+    if field.name == 'order_date' and pyarrow.types.is_integer(column.type):
+        return column.cast(pyarrow.int64()).cast(pyarrow.timestamp('ms')).cast(field.type)
+    if column.type != field.type:
+        return column.cast(field.type)
+    return column
+
 
 class DataExtractor:
     """
@@ -13,30 +136,231 @@ class DataExtractor:
     Esta classe oferece métodos para validar a existência do caminho de entrada
     e para ler dados de arquivos nos formatos suportados, retornando-os como DataFrames do pandas.
     """
-    def __init__(self):
+    def __init__(self, validation: str = 'full', sample_size: int = 10_000, columns: list[str] | None = None,
+                 filters: list[tuple[str, str, Any]] | None = None, cache: ExtractCache | None = None,
+                 parser_engine: str = 'c'):
         """
         Inicializa a classe DataExtractor com um esquema de validação Pandera para os dados extraídos.
 
         O esquema define as colunas esperadas e os tipos de dados, com verificações de integridade,
-        como valores não nulos e limites numéricos mínimos.
-        """
-        self.schema = pa.DataFrameSchema({
-            'order_id': pa.Column(int, checks = pa.Check.gt(0)),
-            'customer_id': pa.Column(int, checks = pa.Check.gt(0)),
-            'order_date': pa.Column(pa.DateTime),
-            'product_id': pa.Column(int, checks = pa.Check.gt(0)),
-            'quantity': pa.Column(int, checks = pa.Check.gt(0)),
-            'price': pa.Column(float, checks = pa.Check.gt(0)),
-            'payment_method': pa.Column(str, nullable = False),
-            'store_location': pa.Column(str, nullable = False)
-        })
+        como valores não nulos e limites numéricos mínimos. Ele é construído uma única vez, no
+        carregamento do módulo (`SALES_SCHEMA`), e compartilhado por todas as instâncias.
+
+        Opcionalmente, uma projeção (`columns`) e predicados (`filters`) podem ser informados. Eles
+        são repassados aos leitores: `usecols` no CSV, `columns` e `filters` no Parquet (que descarta
+        row groups pelas estatísticas de mínimo e máximo) e, nos blocos Parquet, ao `iter_row_groups`.
+        Após a validação, que passa a considerar apenas as colunas lidas, as linhas que não atendem aos
+        predicados são removidas e apenas as colunas projetadas são mantidas.
+
+        Os leitores de CSV e JSON recebem os tipos do esquema (`SCHEMA_DTYPES`), de modo que o pandas
+        não precisa inferi-los e `validate_dataframe` não precisa convertê-los depois. Com
+        `parser_engine='pyarrow'`, esses arquivos são lidos pelos leitores do `pyarrow`, que analisam
+        blocos do arquivo em paralelo, usando todos os núcleos. Os DataFrames resultantes são iguais
+        aos do motor padrão do pandas, inclusive na leitura em blocos.
+
+        Parameters:
+            validation : str
+                Modo de validação: 'full' (Pandera), 'fast' (verificações vetorizadas com NumPy sobre
+                todas as linhas) ou 'sample' (verificações vetorizadas sobre uma amostra aleatória de
+                `sample_size` linhas, indicado para fontes confiáveis). Padrão: 'full'.
+            sample_size : int
+                Número de linhas verificadas no modo 'sample'. Padrão: 10_000.
+            columns : list[str] | None
+                Colunas a serem lidas. Se None, todas as colunas do esquema são lidas. Padrão: None.
+            filters : list[tuple[str, str, Any]] | None
+                Predicados combinados com "E", no formato `(coluna, operador, valor)`, com os operadores
+                '==', '!=', '<', '<=', '>', '>=', 'in' e 'not in'.
+                Ex.: `[('order_date', '>=', '2023-06-01'), ('store_location', 'in', ['Houston'])]`.
+                Padrão: None.
+            cache : ExtractCache | None
+                Cache de extratos validados. Quando informado, arquivos já lidos com as mesmas opções
+                são carregados do cache, sem nova análise e validação. Padrão: None.
+            parser_engine : str
+                Motor de leitura de CSV e JSON: 'c' (leitores do pandas) ou 'pyarrow' (leitores
+                multithread do `pyarrow`). Padrão: 'c'.
+
+        Raises:
+            ValueError
+                Se o modo de validação, o motor de leitura, alguma coluna ou algum operador não for suportado.
+            ImportError
+                Se `parser_engine='pyarrow'` e o `pyarrow` não estiver instalado.
+        """
+        if validation not in VALIDATION_MODES:
+            raise ValueError(f"Modo de validação '{validation}' não suportado. Use 'full', 'fast' ou 'sample'.")
+        if parser_engine not in PARSER_ENGINES:
+            raise ValueError(f"Motor de leitura '{parser_engine}' não suportado. Use 'c' ou 'pyarrow'.")
+        if parser_engine == 'pyarrow':
+            require_pyarrow()
+
+        self.validation = validation
+        self.sample_size = sample_size
+        self.columns = list(columns) if columns else None
+        self.filters = [self._normalize_filter(*predicate) for predicate in filters or []]
+        self.read_columns = self._build_read_columns()
+        self.schema = SALES_SCHEMA if self.read_columns is None else SALES_SCHEMA.select_columns(self.read_columns)
+        self.cache = cache
+        self.parser_engine = parser_engine
+
+    def _normalize_filter(self, column: str, op: str, value: Any) -> tuple[str, str, Any]:
+        """
+        Valida um predicado e converte os valores da coluna 'order_date' para `pd.Timestamp`.
+
+        Parameters:
+            column : str
+                Coluna do predicado.
+            op : str
+                Operador do predicado.
+            value : Any
+                Valor (ou lista de valores, para 'in' e 'not in') do predicado.
+
+        Returns:
+            tuple[str, str, Any]
+                Predicado normalizado.
+
+        Raises:
+            ValueError
+                Se a coluna não pertencer ao esquema ou se o operador não for suportado.
+        """
+        if column not in SCHEMA_DTYPES:
+            raise ValueError(f"A coluna '{column}' do filtro não pertence ao esquema.")
+        if op not in FILTER_OPERATORS:
+            raise ValueError(f"Operador de filtro '{op}' não suportado.")
+
+        if column == 'order_date':
+            value = [pd.Timestamp(item) for item in value] if op in ('in', 'not in') else pd.Timestamp(value)
+        elif op in ('in', 'not in'):
+            value = list(value)
+        return column, op, value
+
+    def _build_read_columns(self) -> list[str] | None:
+        """
+        Calcula as colunas que precisam ser lidas: as projetadas e as usadas nos predicados.
+
+        Returns:
+            list[str] | None
+                Colunas a serem lidas, na ordem do esquema, ou None se não houver projeção.
+
+        Raises:
+            ValueError
+                Se alguma coluna projetada não pertencer ao esquema.
+        """
+        if self.columns is None:
+            return None
+
+        unknown_columns = [column for column in self.columns if column not in SCHEMA_DTYPES]
+        if unknown_columns:
+            raise ValueError(f'Colunas não pertencentes ao esquema: {unknown_columns}')
+
+        needed = set(self.columns) | {column for column, _, _ in self.filters}
+        return [column for column in SCHEMA_DTYPES if column in needed]
+
+    def _apply_filters(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Remove as linhas que não atendem aos predicados e mantém apenas as colunas projetadas.
+
+        Parameters:
+            df: pd.DataFrame
+                DataFrame validado.
+
+        Returns:
+            pd.DataFrame
+                DataFrame filtrado e projetado.
+        """
+        if self.filters:
+            mask = np.ones(len(df), dtype=bool)
+            for column, op, value in self.filters:
+                mask &= FILTER_OPERATORS[op](df[column], value).to_numpy()
+            df = df[mask].reset_index(drop=True)
+
+        if self.columns is not None:
+            df = df.reindex(columns=self.columns)
+        return df
+
+    def _validate_and_select(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Valida um DataFrame recém-lido e aplica os predicados e a projeção configurados.
+
+        Parameters:
+            df: pd.DataFrame
+                DataFrame com o conteúdo bruto lido.
+
+        Returns:
+            pd.DataFrame
+                DataFrame validado, filtrado e projetado.
+
+        Raises:
+            pandera.errors.SchemaError
+                Se o DataFrame não atender aos requisitos do esquema.
+        """
+        return self._apply_filters(self.validate_dataframe(df))
+
+    def _fast_validate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Valida um DataFrame com verificações vetorizadas equivalentes às do esquema Pandera.
+
+        A presença e o tipo de cada coluna são sempre verificados. As verificações de valores
+        (maior que zero e não nulo) são combinadas em uma única máscara booleana do NumPy, calculada
+        sobre todas as linhas ou, no modo 'sample', sobre uma amostra aleatória.
+
+        Parameters:
+            df: pd.DataFrame
+                DataFrame que será validado.
+
+        Returns:
+            pd.DataFrame
+                O mesmo DataFrame, se for válido.
+
+        Raises:
+            pandera.errors.SchemaError
+                Se alguma coluna estiver ausente, tiver o tipo incorreto ou se houver linhas inválidas.
+                Neste último caso, as linhas inválidas são informadas em `failure_cases`.
+        """
+        expected_dtypes = {column: dtype for column, dtype in SCHEMA_DTYPES.items() if column in self.schema.columns}
+
+        missing_columns = [column for column in expected_dtypes if column not in df.columns]
+        if missing_columns:
+            raise pa.errors.SchemaError(self.schema, df, f'Colunas ausentes no DataFrame: {missing_columns}')
+
+        for column, dtype in expected_dtypes.items():
+            if column == 'order_date':
+                valid_dtype = pd.api.types.is_datetime64_dtype(df[column])
+            else:
+                valid_dtype = df[column].dtype == dtype
+            if not valid_dtype:
+                raise pa.errors.SchemaError(
+                    self.schema, df, f"A coluna '{column}' deveria ter o tipo {dtype}, mas tem {df[column].dtype}."
+                )
+
+        checked_df = df
+        if self.validation == 'sample' and len(df) > self.sample_size:
+            positions = np.random.default_rng().choice(len(df), size=self.sample_size, replace=False)
+            checked_df = df.iloc[np.sort(positions)]
+
+        invalid = np.zeros(len(checked_df), dtype=bool)
+        for column in POSITIVE_COLUMNS:
+            if column in expected_dtypes:
+                invalid |= ~(checked_df[column].to_numpy() > 0)
+        for column in NOT_NULL_COLUMNS:
+            if column in expected_dtypes:
+                invalid |= pd.isna(checked_df[column].to_numpy())
+
+        if invalid.any():
+            failure_cases = checked_df[invalid]
+            raise pa.errors.SchemaError(
+                self.schema, df,
+                f'{len(failure_cases)} linha(s) inválida(s). Índices: {failure_cases.index[:10].tolist()}',
+                failure_cases = failure_cases
+            )
+        return df
 
     def validate_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Valida e ajusta um DataFrame com base no esquema pré-definido.
 
         As colunas que não estão no tipo correto, como 'order_date' e 'customer_id', são convertidas
-        para os tipos esperados (ex.: datetime para 'order_date' e int64 para IDs).
+        para os tipos esperados (ex.: datetime para 'order_date' e int64 para IDs). Datas inteiras, como
+        as gravadas pelo `DataFrame.to_json`, são interpretadas como milissegundos desde a época Unix.
+        Colunas que já estão no tipo esperado não são convertidas novamente.
 
         Parameters:
             df: pd.DataFrame
@@ -50,23 +374,365 @@ class DataExtractor:
             pandera.errors.SchemaError
                 Se o DataFrame não atender aos requisitos do esquema.
         """
-        if 'order_date' in df.columns:
+        if 'order_date' in df.columns and pd.api.types.is_integer_dtype(df['order_date']):
+            df['order_date'] = pd.to_datetime(df['order_date'], unit='ms', errors='coerce')
+        elif 'order_date' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['order_date']):
             df['order_date'] = pd.to_datetime(df['order_date'], errors='coerce')
-        if 'customer_id' in df.columns:
-            df['customer_id'] = df['customer_id'].astype('int64')
-        if 'product_id' in df.columns:
-            df['product_id'] = df['product_id'].astype('int64')
-        if 'quantity' in df.columns:
-            df['quantity'] = df['quantity'].astype('int64')
+        for column in ['customer_id', 'product_id', 'quantity']:
+            if column in df.columns and df[column].dtype != 'int64':
+                df[column] = df[column].astype('int64')
 
         try:
-            validated_df = self.schema.validate(df)
+            if self.validation == 'full':
+                validated_df = self.schema.validate(df)
+            else:
+                validated_df = self._fast_validate(df)
             logger.info('DataFrame validado com sucesso!')
             return validated_df
         except pa.errors.SchemaError as e:
             logger.error(f'Erro de validação: {e}')
             raise
 
+    def optimize_dtypes(self, df: pd.DataFrame, max_category_ratio: float = 0.5) -> pd.DataFrame:
+        """
+        Converte as colunas de um DataFrame validado para tipos mais compactos.
+
+        Colunas de texto com baixa cardinalidade (proporção de valores distintos menor ou igual a
+        `max_category_ratio`) são convertidas para `category`, e colunas inteiras são reduzidas ao
+        menor tipo inteiro que comporta seus valores (ex.: `int8` para 'quantity'). A coluna 'price'
+        é mantida em `float64` para não alterar a precisão das somas.
+
+        Deve ser aplicado após a validação e, quando houver concatenação, após o `pd.concat`, pois
+        colunas categóricas com categorias diferentes voltam a ser do tipo `object` ao serem concatenadas.
+
+        Parameters:
+            df: pd.DataFrame
+                DataFrame validado.
+            max_category_ratio: float
+                Proporção máxima de valores distintos para conversão em `category`. Padrão: 0.5.
+
+        Returns:
+            pd.DataFrame
+                DataFrame com os tipos otimizados.
+        """
+        optimized_df = df.copy(deep=False)
+
+        for column in optimized_df.columns:
+            series = optimized_df[column]
+            if pd.api.types.is_integer_dtype(series):
+                optimized_df[column] = pd.to_numeric(series, downcast='integer')
+            elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                if len(series) and series.nunique(dropna=False) / len(series) <= max_category_ratio:
+                    optimized_df[column] = series.astype('category')
+
+        return optimized_df
+
+    def _record_read(self, file_path: str) -> None:
+        """
+        Registra nas métricas a leitura de um arquivo e o seu tamanho em bytes.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo lido.
+        """
+        METRICS.increment('read_file', bytes_read=os.path.getsize(file_path), files_read=1)
+
+    def _parse_error(self, file_path: str, error: Exception) -> pa.errors.SchemaError:
+        """
+        Converte um erro de leitura de CSV ou JSON no erro de validação do esquema.
+
+        Como os tipos do esquema são repassados aos leitores, um valor de tipo inválido falha já na
+        leitura, com um `ValueError` do pandas ou um `pyarrow.ArrowInvalid`. O erro é registrado e
+        convertido em `SchemaError`, o mesmo erro levantado por `validate_dataframe`.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo lido.
+            error : Exception
+                Erro levantado pelo leitor.
+
+        Returns:
+            pandera.errors.SchemaError
+                Erro de validação com o nome do arquivo e a mensagem original.
+        """
+        message = f"O arquivo '{file_path}' não atende ao esquema: {error}"
+        logger.error(f'Erro de validação: {message}')
+        return pa.errors.SchemaError(self.schema, None, message)
+
+    def _read_dtypes(self) -> dict[str, str]:
+        """
+        Retorna os tipos do esquema das colunas lidas, exceto 'order_date', para os leitores do pandas.
+
+        Returns:
+            dict[str, str]
+                Tipo de cada coluna lida, indexado pelo nome da coluna.
+        """
+        return {
+            column: dtype for column, dtype in SCHEMA_DTYPES.items()
+            if column != 'order_date' and (self.read_columns is None or column in self.read_columns)
+        }
+
+    def _csv_columns(self, file_path: str) -> list[str]:
+        """
+        Lê o cabeçalho de um arquivo CSV e retorna as colunas a serem lidas, na ordem do arquivo.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo CSV.
+
+        Returns:
+            list[str]
+                Colunas do cabeçalho necessárias à projeção e aos predicados.
+        """
+        with open(file_path, encoding='utf-8', newline='') as file:
+            header = next(csv.reader(file), [])
+        return header if self.read_columns is None else [column for column in header if column in self.read_columns]
+
+    def _csv_options(self, file_path: str) -> dict[str, Any]:
+        """
+        Monta os parâmetros do `pd.read_csv`: colunas lidas, tipos do esquema e conversão de 'order_date'.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo CSV.
+
+        Returns:
+            dict[str, Any]
+                Parâmetros `usecols`, `dtype` e `parse_dates`.
+        """
+        columns = self._csv_columns(file_path)
+        return {
+            'usecols': self.read_columns,
+            'dtype': self._read_dtypes(),
+            'parse_dates': ['order_date'] if 'order_date' in columns else None
+        }
+
+    def _arrow_csv_options(self, file_path: str) -> dict[str, Any]:
+        """
+        Monta as opções dos leitores de CSV do `pyarrow` com as colunas lidas e os tipos do esquema.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo CSV.
+
+        Returns:
+            dict[str, Any]
+                Parâmetros `read_options` (leitura multithread) e `convert_options`.
+        """
+        columns = self._csv_columns(file_path)
+        schema = arrow_schema()
+        column_types = {
+            column: schema.field(column).type for column in columns
+            if column in SCHEMA_DTYPES and column != 'order_date'
+        }
+        convert_options = pa_csv.ConvertOptions(
+            column_types = column_types, include_columns = columns, strings_can_be_null = True
+        )
+        return {'read_options': pa_csv.ReadOptions(use_threads = True), 'convert_options': convert_options}
+
+    def _read_arrow_file(self, file_path: str, file_format: str) -> 'pyarrow.Table':
+        """
+        Lê um arquivo CSV ou JSON por inteiro com os leitores multithread do `pyarrow`.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv' ou 'json'.
+
+        Returns:
+            pyarrow.Table
+                Tabela com o conteúdo bruto do arquivo.
+        """
+        if file_format == 'csv':
+            return pa_csv.read_csv(file_path, **self._arrow_csv_options(file_path))
+        return pa_json.read_json(file_path, read_options=pa_json.ReadOptions(use_threads=True))
+
+    def _iter_arrow_batches(self, file_path: str, file_format: str) -> Iterator['pyarrow.RecordBatch']:
+        """
+        Lê um arquivo CSV ou JSON em lotes de registros com os leitores do `pyarrow`.
+
+        Arquivos JSON são lidos de forma incremental apenas nas versões do `pyarrow` que oferecem
+        `pyarrow.json.open_json`; nas demais, o arquivo é lido por inteiro e entregue em lotes.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv' ou 'json'.
+
+        Yields:
+            pyarrow.RecordBatch
+                Lotes com o conteúdo bruto do arquivo.
+        """
+        if file_format == 'csv':
+            yield from pa_csv.open_csv(file_path, **self._arrow_csv_options(file_path))
+        elif hasattr(pa_json, 'open_json'):
+            yield from pa_json.open_json(file_path)
+        else:
+            yield from pa_json.read_json(file_path).to_batches()
+
+    def _arrow_to_pandas(self, table: 'pyarrow.Table', start: int = 0) -> pd.DataFrame:
+        """
+        Converte uma tabela lida pelo `pyarrow` em um DataFrame igual ao dos leitores do pandas.
+
+        As colunas do esquema são convertidas para os tipos de `arrow_schema` ainda no Arrow. Colunas
+        que não puderem ser convertidas são mantidas como estão, para que a validação aponte o erro.
+        Apenas as colunas necessárias à projeção e aos predicados são mantidas, na ordem do arquivo.
+
+        Parameters:
+            table : pyarrow.Table
+                Tabela com o conteúdo bruto lido.
+            start : int
+                Posição da primeira linha no arquivo, usada como início do índice. Padrão: 0.
+
+        Returns:
+            pd.DataFrame
+                DataFrame com o conteúdo lido.
+        """
+        schema = arrow_schema()
+        names = [name for name in table.column_names if self.read_columns is None or name in self.read_columns]
+
+        columns = []
+        for name in names:
+            column = table.column(name)
+            if name in SCHEMA_DTYPES:
+                try:
+                    column = cast_arrow_column(column, schema.field(name))
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+                    pass
+            columns.append(column)
+
+        df = pyarrow.Table.from_arrays(columns, names=names).to_pandas()
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def _iter_arrow_chunks(self, file_path: str, file_format: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Lê um arquivo CSV ou JSON com o `pyarrow` em blocos de exatamente `chunksize` linhas.
+
+        Os lotes do `pyarrow` têm o tamanho dos blocos do arquivo, e não de `chunksize`. Eles são
+        acumulados e fatiados para que os blocos (e seus índices) sejam iguais aos dos leitores do pandas.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv' ou 'json'.
+            chunksize : int
+                Número máximo de linhas por bloco.
+
+        Yields:
+            pd.DataFrame
+                Blocos com o conteúdo bruto do arquivo.
+        """
+        start = 0
+        pending = None
+        for batch in self._iter_arrow_batches(file_path, file_format):
+            table = pyarrow.Table.from_batches([batch])
+            pending = table if pending is None else pyarrow.concat_tables([pending, table])
+            while pending.num_rows >= chunksize:
+                yield self._arrow_to_pandas(pending.slice(0, chunksize), start)
+                pending = pending.slice(chunksize)
+                start += chunksize
+
+        if pending is not None and pending.num_rows:
+            yield self._arrow_to_pandas(pending, start)
+
+    def _read_file(self, file_path: str, file_format: str) -> pd.DataFrame:
+        """
+        Lê um único arquivo no formato informado e retorna um DataFrame sem validação.
+
+        Apenas as colunas necessárias à projeção e aos predicados são lidas. No Parquet, os
+        predicados também são repassados ao leitor para descartar row groups. Arquivos CSV e JSON
+        são lidos com o motor configurado em `parser_engine`.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv', 'json' ou 'parquet'.
+
+        Returns:
+            pd.DataFrame
+                DataFrame com o conteúdo bruto do arquivo.
+
+        Raises:
+            ValueError
+                Se o formato informado não for suportado.
+            pandera.errors.SchemaError
+                Se um arquivo CSV ou JSON tiver valores que não podem ser lidos com os tipos do esquema.
+        """
+        self._record_read(file_path)
+
+        try:
+            if file_format in ('csv', 'json') and self.parser_engine == 'pyarrow':
+                return self._arrow_to_pandas(self._read_arrow_file(file_path, file_format))
+            if file_format == 'csv':
+                return pd.read_csv(file_path, encoding='utf-8', **self._csv_options(file_path))
+            if file_format == 'json':
+                df = pd.read_json(file_path, lines=True, encoding='utf-8', dtype=self._read_dtypes())
+                return df if self.read_columns is None else df.drop(columns=df.columns.difference(self.read_columns))
+        except ValueError as e:
+            raise self._parse_error(file_path, e) from e
+
+        if file_format == 'parquet':
+            return pd.read_parquet(file_path, columns=self.read_columns, filters=self.filters or None)
+        raise ValueError(f"Formato de arquivo '{file_format}' não suportado.")
+
+    def _load_file(self, file_path: str, file_format: str) -> pd.DataFrame:
+        """
+        Lê, valida e seleciona os dados de um arquivo, usando o cache de extratos se configurado.
+
+        O extrato armazenado no cache é o DataFrame validado, antes da aplicação dos predicados
+        em nível de linha e da projeção final.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv', 'json' ou 'parquet'.
+
+        Returns:
+            pd.DataFrame
+                DataFrame validado, filtrado e projetado.
+        """
+        if self.cache is None:
+            return self._validate_and_select(self._read_file(file_path, file_format))
+
+        signature = f'{self.validation}|{self.read_columns}|{self.filters}'
+        key = self.cache.make_key(file_path, signature)
+
+        validated_df = self.cache.get(key)
+        if validated_df is None:
+            validated_df = self.validate_dataframe(self._read_file(file_path, file_format))
+            self.cache.put(key, validated_df)
+
+        return self._apply_filters(validated_df)
+
+    @profile_decorator
+    def read_file(self, file_path: str, file_format: str) -> pd.DataFrame:
+        """
+        Lê e valida um único arquivo no formato informado.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv', 'json' ou 'parquet'.
+
+        Returns:
+            pd.DataFrame
+                DataFrame validado de acordo com o esquema.
+
+        Raises:
+            ValueError
+                Se o formato informado não for suportado.
+            pandera.errors.SchemaError
+                Se o arquivo não atender ao esquema de validação.
+        """
+        return self._load_file(file_path, file_format)
+
     def validate_input_path(self, input_path: str) -> str:
         """
         Valida se o caminho do diretório de entrada existe.
@@ -89,6 +755,7 @@ class DataExtractor:
             raise FileNotFoundError(f"O caminho '{input_path}' não existe.")
         return input_path
 
+    @profile_decorator
     def read_csv_data(self, input_path: str) -> pd.DataFrame:
         """
         Lê dados de um único arquivo CSV em um diretório e retorna um DataFrame.
@@ -116,9 +783,9 @@ class DataExtractor:
         if len(csv_files) != 1:
             raise FileNotFoundError(f"Esperado exatamente um arquivo CSV no diretório '{input_path}', mas encontrou {len(csv_files)}.")
 
-        validated_df: pd.DataFrame = pd.read_csv(csv_files[0], encoding='utf-8')
-        return self.validate_dataframe(validated_df)
+        return self._load_file(csv_files[0], 'csv')
 
+    @profile_decorator
     def read_json_data(self, input_path: str) -> pd.DataFrame:
         """
         Lê dados de um único arquivo JSON em um diretório e retorna um DataFrame.
@@ -146,9 +813,9 @@ class DataExtractor:
         if len(json_files) != 1:
             raise FileNotFoundError(f"Esperado exatamente um arquivo JSON no diretório '{input_path}', mas encontrou {len(json_files)}.")
 
-        validated_df: pd.DataFrame = pd.read_json(json_files[0], lines=True, encoding='utf-8')
-        return self.validate_dataframe(validated_df)
+        return self._load_file(json_files[0], 'json')
 
+    @profile_decorator
     def read_parquet_data(self, input_path: str) -> pd.DataFrame:
         """
         Lê dados de um único arquivo Parquet em um diretório e retorna um DataFrame.
@@ -176,5 +843,329 @@ class DataExtractor:
         if len(parquet_files) != 1:
             raise FileNotFoundError(f"Esperado exatamente um arquivo Parquet no diretório '{input_path}', mas encontrou {len(parquet_files)}.")
 
-        validated_df: pd.DataFrame = pd.read_parquet(parquet_files[0])
-        return self.validate_dataframe(validated_df)
+        return self._load_file(parquet_files[0], 'parquet')
+
+    def list_files(self, input_path: str, file_format: str) -> list[str]:
+        """
+        Lista, de forma recursiva e ordenada, todos os arquivos de um formato em um diretório.
+
+        Subdiretórios no estilo Hive (ex.: `year=2024/month=01`) são percorridos normalmente.
+
+        Parameters:
+            input_path : str
+                Caminho do diretório raiz.
+            file_format : str
+                Formato dos arquivos: 'csv', 'json' ou 'parquet'.
+
+        Returns:
+            list[str]
+                Caminhos dos arquivos encontrados.
+
+        Raises:
+            FileNotFoundError
+                Se o caminho do diretório não existir.
+            ValueError
+                Se o formato informado não for suportado.
+        """
+        ok_input_path = self.validate_input_path(input_path)
+
+        if file_format not in FILE_EXTENSIONS:
+            raise ValueError(f"Formato de arquivo '{file_format}' não suportado.")
+
+        pattern = os.path.join(ok_input_path, '**', f'*{FILE_EXTENSIONS[file_format]}')
+        return sorted(glob.glob(pattern, recursive=True))
+
+    def parse_partitions(self, file_path: str, input_path: str) -> dict[str, str]:
+        """
+        Extrai os valores de partição no estilo Hive a partir do caminho de um arquivo.
+
+        Cada diretório no formato `chave=valor` entre `input_path` e o arquivo gera uma entrada
+        no dicionário retornado. Diretórios fora desse padrão são ignorados.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo.
+            input_path : str
+                Diretório raiz a partir do qual as partições são consideradas.
+
+        Returns:
+            dict[str, str]
+                Mapeamento entre o nome de cada partição e seu valor.
+        """
+        relative_dir = os.path.dirname(os.path.relpath(file_path, input_path))
+
+        partitions: dict[str, str] = {}
+        for part in relative_dir.split(os.sep):
+            key, sep, value = part.partition('=')
+            if sep and key:
+                partitions[key] = value
+        return partitions
+
+    def select_files(self, input_path: str, file_format: str,
+                     partition_filter: dict[str, list[str]] | None = None) -> list[tuple[str, dict[str, str]]]:
+        """
+        Seleciona os arquivos de um formato cujas partições atendem ao filtro informado.
+
+        A seleção usa apenas os caminhos dos arquivos, sem abri-los.
+
+        Parameters:
+            input_path : str
+                Caminho do diretório raiz.
+            file_format : str
+                Formato dos arquivos: 'csv', 'json' ou 'parquet'.
+            partition_filter : dict[str, list[str]] | None
+                Valores aceitos para cada partição, ex.: `{'year': ['2024']}`. Padrão: None.
+
+        Returns:
+            list[tuple[str, dict[str, str]]]
+                Pares formados pelo caminho de cada arquivo selecionado e suas partições.
+        """
+        selected_files: list[tuple[str, dict[str, str]]] = []
+        for file_path in self.list_files(input_path, file_format):
+            partitions = self.parse_partitions(file_path, input_path)
+            if partition_filter and any(
+                partitions.get(key) not in [str(value) for value in values]
+                for key, values in partition_filter.items()
+            ):
+                continue
+            selected_files.append((file_path, partitions))
+        return selected_files
+
+    @profile_decorator
+    def read_partitioned_data(self, input_path: str, file_format: str, max_workers: int = 4,
+                              partition_filter: dict[str, list[str]] | None = None) -> pd.DataFrame:
+        """
+        Lê todos os arquivos de um formato em um diretório, inclusive em partições Hive aninhadas.
+
+        Os arquivos são lidos e validados em paralelo. Os valores de partição encontrados no caminho
+        de cada arquivo são adicionados como colunas (do tipo string) ao DataFrame resultante. Quando
+        `partition_filter` é informado, arquivos cujas partições não correspondem aos valores aceitos
+        são descartados sem serem abertos.
+
+        Parameters:
+            input_path : str
+                Caminho do diretório raiz dos arquivos.
+            file_format : str
+                Formato dos arquivos: 'csv', 'json' ou 'parquet'.
+            max_workers : int
+                Número máximo de arquivos lidos simultaneamente. Padrão: 4.
+            partition_filter : dict[str, list[str]] | None
+                Valores aceitos para cada partição, ex.: `{'year': ['2024']}`. Padrão: None.
+
+        Returns:
+            pd.DataFrame
+                DataFrame com os dados de todos os arquivos selecionados.
+
+        Raises:
+            FileNotFoundError
+                Se o caminho não existir ou se nenhum arquivo for selecionado.
+            pandera.errors.SchemaError
+                Se algum arquivo não atender ao esquema de validação.
+        """
+        selected_files = self.select_files(input_path, file_format, partition_filter)
+        if not selected_files:
+            raise FileNotFoundError(f"Nenhum arquivo {file_format.upper()} encontrado no diretório '{input_path}'.")
+
+        def read_one(file_path: str, partitions: dict[str, str]) -> pd.DataFrame:
+            validated_df = self.read_file(file_path, file_format)
+            for key, value in partitions.items():
+                validated_df[key] = value
+            return validated_df
+
+        with ThreadPoolExecutor(max_workers = max_workers) as executor:
+            frames = list(executor.map(lambda item: read_one(*item), selected_files))
+
+        return pd.concat(frames, ignore_index=True)
+
+    def _iter_text_chunks(self, file_path: str, file_format: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Lê um arquivo CSV ou JSON em blocos com o motor configurado em `parser_engine`.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv' ou 'json'.
+            chunksize : int
+                Número máximo de linhas por bloco.
+
+        Yields:
+            pd.DataFrame
+                Blocos com o conteúdo bruto do arquivo.
+        """
+        if self.parser_engine == 'pyarrow':
+            yield from self._iter_arrow_chunks(file_path, file_format, chunksize)
+        elif file_format == 'csv':
+            with pd.read_csv(file_path, encoding='utf-8', chunksize=chunksize, **self._csv_options(file_path)) as reader:
+                yield from reader
+        else:
+            with pd.read_json(file_path, lines=True, encoding='utf-8', chunksize=chunksize,
+                              dtype=self._read_dtypes()) as reader:
+                for chunk in reader:
+                    if self.read_columns is not None:
+                        chunk = chunk.drop(columns=chunk.columns.difference(self.read_columns))
+                    yield chunk
+
+    def _iter_file_chunks(self, file_path: str, file_format: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        """
+        Lê um único arquivo em blocos de no máximo `chunksize` linhas, sem validação.
+
+        Arquivos CSV e JSON (um registro por linha) são lidos com o parâmetro `chunksize` do pandas
+        ou, com `parser_engine='pyarrow'`, pelos leitores incrementais do `pyarrow`. Arquivos Parquet
+        são lidos um row group por vez, e cada row group é fatiado em blocos.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv', 'json' ou 'parquet'.
+            chunksize : int
+                Número máximo de linhas por bloco.
+
+        Yields:
+            pd.DataFrame
+                Blocos com o conteúdo bruto do arquivo.
+
+        Raises:
+            ValueError
+                Se o formato informado não for suportado.
+            pandera.errors.SchemaError
+                Se um arquivo CSV ou JSON tiver valores que não podem ser lidos com os tipos do esquema.
+        """
+        self._record_read(file_path)
+
+        if file_format in ('csv', 'json'):
+            try:
+                yield from self._iter_text_chunks(file_path, file_format, chunksize)
+            except ValueError as e:
+                raise self._parse_error(file_path, e) from e
+        elif file_format == 'parquet':
+            row_groups = ParquetFile(file_path).iter_row_groups(filters=self.filters or None, columns=self.read_columns)
+            for row_group in row_groups:
+                for start in range(0, len(row_group), chunksize):
+                    yield row_group.iloc[start:start + chunksize].reset_index(drop=True)
+        else:
+            raise ValueError(f"Formato de arquivo '{file_format}' não suportado.")
+
+    def iter_chunks(self, input_path: str, file_format: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Lê todos os arquivos de um formato em blocos validados de tamanho limitado.
+
+        Cada bloco é validado individualmente antes de ser entregue, de modo que o consumo de memória
+        depende apenas de `chunksize`, e não do tamanho total dos arquivos.
+
+        Parameters:
+            input_path : str
+                Caminho do diretório raiz dos arquivos.
+            file_format : str
+                Formato dos arquivos: 'csv', 'json' ou 'parquet'.
+            chunksize : int
+                Número máximo de linhas por bloco. Padrão: 100_000.
+
+        Yields:
+            pd.DataFrame
+                Blocos validados de acordo com o esquema.
+
+        Raises:
+            FileNotFoundError
+                Se o caminho do diretório não existir.
+            ValueError
+                Se `chunksize` for menor que 1.
+            pandera.errors.SchemaError
+                Se algum bloco não atender ao esquema de validação.
+        """
+        if chunksize < 1:
+            raise ValueError(f"O tamanho do bloco deve ser maior que zero, mas recebeu {chunksize}.")
+
+        for file_path in self.list_files(input_path, file_format):
+            for chunk in self._iter_file_chunks(file_path, file_format, chunksize):
+                yield self._validate_and_select(chunk)
+
+    @profile_decorator
+    def read_arrow_table(self, file_path: str, file_format: str) -> 'pyarrow.Table':
+        """
+        Lê e valida um único arquivo como uma tabela Arrow, sem passar pelo pandas.
+
+        Os arquivos são lidos pelos leitores nativos do `pyarrow` (CSV, JSON com um registro por
+        linha e Parquet) e validados com `validate_arrow_table`.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo a ser lido.
+            file_format : str
+                Formato do arquivo: 'csv', 'json' ou 'parquet'.
+
+        Returns:
+            pyarrow.Table
+                Tabela validada, com os tipos de `arrow_schema`.
+
+        Raises:
+            ImportError
+                Se o `pyarrow` não estiver instalado.
+            ValueError
+                Se o formato informado não for suportado.
+            pandera.errors.SchemaError
+                Se o arquivo não atender ao esquema de validação.
+        """
+        require_pyarrow()
+        self._record_read(file_path)
+
+        if file_format == 'csv':
+            table = pa_csv.read_csv(file_path)
+        elif file_format == 'json':
+            table = pa_json.read_json(file_path)
+        elif file_format == 'parquet':
+            table = pq.read_table(file_path)
+        else:
+            raise ValueError(f"Formato de arquivo '{file_format}' não suportado.")
+
+        return self.validate_arrow_table(table)
+
+    def validate_arrow_table(self, table: 'pyarrow.Table') -> 'pyarrow.Table':
+        """
+        Valida e ajusta uma tabela Arrow com as mesmas regras do esquema `SALES_SCHEMA`.
+
+        As colunas são convertidas para os tipos de `arrow_schema` (datas em texto ou inteiros viram
+        `timestamp[ns]`, como em `validate_dataframe`) e as verificações de valores maiores que zero
+        e não nulos são feitas com os kernels de `pyarrow.compute`.
+
+        Parameters:
+            table : pyarrow.Table
+                Tabela que será validada.
+
+        Returns:
+            pyarrow.Table
+                Tabela validada, com as colunas na ordem e nos tipos de `arrow_schema`.
+
+        Raises:
+            pandera.errors.SchemaError
+                Se alguma coluna estiver ausente, não puder ser convertida ou tiver valores inválidos.
+        """
+        schema = arrow_schema()
+
+        missing_columns = [name for name in schema.names if name not in table.column_names]
+        if missing_columns:
+            raise pa.errors.SchemaError(self.schema, table, f'Colunas ausentes na tabela: {missing_columns}')
+
+        columns = []
+        for field in schema:
+            column = table.column(field.name)
+            try:
+                column = cast_arrow_column(column, field)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError) as e:
+                raise pa.errors.SchemaError(
+                    self.schema, table, f"A coluna '{field.name}' não pôde ser convertida para {field.type}: {e}"
+                ) from e
+            columns.append(column)
+
+        validated_table = pyarrow.Table.from_arrays(columns, schema=schema)
+
+        for name in POSITIVE_COLUMNS:
+            if not pc.all(pc.fill_null(pc.greater(validated_table.column(name), 0), False)).as_py():
+                raise pa.errors.SchemaError(self.schema, table, f"A coluna '{name}' possui valores não positivos ou nulos.")
+        for name in NOT_NULL_COLUMNS:
+            if validated_table.column(name).null_count:
+                raise pa.errors.SchemaError(self.schema, table, f"A coluna '{name}' possui valores nulos.")
+
+        logger.info('Tabela Arrow validada com sucesso!')
+        return validated_table
@@ -0,0 +1,222 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd  # type: ignore
+from loguru import logger  # type: ignore
+
+from classes.file_manifest import compute_file_hash
+
+try:
+    import pyarrow  # type: ignore
+    import pyarrow.feather as feather  # type: ignore
+except ImportError:  # pragma: no cover - dependência opcional
+    pyarrow = None
+
+SCHEMA_VERSION: int = 1
+
+
+class ExtractCache:
+    """
+    Classe para armazenar localmente, em formato colunar, os extratos já validados.
+
+    Cada extrato é identificado pelo hash do conteúdo do arquivo de origem, pela versão do esquema
+    (`SCHEMA_VERSION`) e pelas opções de leitura. Em execuções seguintes, o extrato é lido do cache,
+    sem analisar novamente o texto do CSV ou do JSON e sem repetir a validação. Como em
+    `FileManifest.has_changed`, o hash de cada arquivo é guardado junto com o seu tamanho e a sua
+    data de modificação (`hashes.json`), e só é recalculado quando um deles muda.
+
+    Os extratos são gravados em Arrow IPC (Feather), lido com memory-map, quando o `pyarrow` está
+    instalado, ou em Parquet, caso contrário. As colunas numéricas e de datas do extrato lido com
+    memory-map não são copiadas: os arrays do DataFrame apontam para o arquivo e são somente
+    leitura. O tamanho total do cache é limitado por `max_bytes`, com remoção dos extratos usados há
+    mais tempo (LRU).
+    """
+    def __init__(self, cache_dir: str = './data/cache', max_bytes: int = 1024 ** 3):
+        """
+        Inicializa o cache, criando o diretório se necessário.
+
+        Parameters:
+            cache_dir : str
+                Diretório onde os extratos são armazenados. Padrão: './data/cache'.
+            max_bytes : int
+                Tamanho máximo, em bytes, ocupado pelo cache. Padrão: 1 GiB.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.extension = '.arrow' if pyarrow is not None else '.parquet'
+        self._lock = threading.Lock()
+        self._hashes_path = os.path.join(cache_dir, 'hashes.json')
+        self._hashes: dict[str, dict] = {}
+
+        os.makedirs(cache_dir, exist_ok=True)
+        if os.path.exists(self._hashes_path):
+            with open(self._hashes_path, encoding='utf-8') as file:
+                self._hashes = json.load(file)
+
+    def _file_hash(self, file_path: str) -> str:
+        """
+        Retorna o hash do conteúdo de um arquivo, reaproveitando o último hash calculado se o tamanho
+        e a data de modificação (em nanossegundos) não tiverem mudado.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo de origem.
+
+        Returns:
+            str
+                Hash SHA-256 do conteúdo do arquivo.
+        """
+        key = os.path.abspath(file_path)
+        stat = os.stat(file_path)
+        with self._lock:
+            entry = self._hashes.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['hash']
+
+        file_hash = compute_file_hash(file_path)
+        with self._lock:
+            self._hashes[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': file_hash}
+            temp_path = f'{self._hashes_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump(self._hashes, file)
+            os.replace(temp_path, self._hashes_path)
+        return file_hash
+
+    def make_key(self, file_path: str, signature: str = '') -> str:
+        """
+        Monta a chave de um extrato a partir do conteúdo do arquivo e das opções de leitura.
+
+        O conteúdo só é lido (para o cálculo do hash) se o tamanho ou a data de modificação do
+        arquivo mudarem desde o último cálculo (ver `_file_hash`).
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo de origem.
+            signature : str
+                Descrição das opções de leitura que alteram o extrato (projeção, predicados, etc.).
+
+        Returns:
+            str
+                Chave do extrato.
+        """
+        options_hash = hashlib.sha256(f'{SCHEMA_VERSION}|{signature}'.encode('utf-8')).hexdigest()[:16]
+        return f'{self._file_hash(file_path)}-v{SCHEMA_VERSION}-{options_hash}'
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}{self.extension}')
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """
+        Retorna o extrato armazenado com a chave informada, se existir.
+
+        A data de modificação do arquivo é atualizada a cada acesso, servindo como registro de uso
+        para a remoção LRU.
+
+        Parameters:
+            key : str
+                Chave do extrato.
+
+        Returns:
+            pd.DataFrame | None
+                Extrato armazenado ou None, se não estiver no cache.
+        """
+        path = self._path(key)
+        try:
+            if self.extension == '.arrow':
+                data = feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+            else:
+                data = pd.read_parquet(path)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+
+        logger.info(f"Extrato '{key}' lido do cache.")
+        return data
+
+    def put(self, key: str, data: pd.DataFrame) -> None:
+        """
+        Armazena um extrato no cache e remove os extratos mais antigos se o limite for excedido.
+
+        Parameters:
+            key : str
+                Chave do extrato.
+            data : pd.DataFrame
+                Extrato validado.
+        """
+        path = self._path(key)
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+
+        if self.extension == '.arrow':
+            feather.write_feather(data, temp_path, compression='uncompressed')
+        else:
+            data.to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+
+        self.evict()
+
+    def evict(self) -> list[str]:
+        """
+        Remove os extratos usados há mais tempo até que o cache respeite `max_bytes`.
+
+        Returns:
+            list[str]
+                Caminhos dos extratos removidos.
+        """
+        removed: list[str] = []
+
+        with self._lock:
+            entries = []
+            for path in glob.glob(os.path.join(self.cache_dir, f'*{self.extension}')):
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total_bytes = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_bytes <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total_bytes -= size
+                removed.append(path)
+
+        if removed:
+            logger.info(f'{len(removed)} extrato(s) removido(s) do cache.')
+        return removed
+
+    def invalidate(self) -> int:
+        """
+        Remove todos os extratos do cache.
+
+        Returns:
+            int
+                Número de extratos removidos.
+        """
+        removed = 0
+        with self._lock:
+            for path in glob.glob(os.path.join(self.cache_dir, '*.arrow')) + \
+                    glob.glob(os.path.join(self.cache_dir, '*.parquet')):
+                os.remove(path)
+                removed += 1
+
+        logger.info(f'Cache invalidado: {removed} extrato(s) removido(s).')
+        return removed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Gerencia o cache de extratos validados.')
+    parser.add_argument('--cache-dir', default='./data/cache', help='Diretório do cache.')
+    parser.add_argument('--invalidate', action='store_true', help='Remove todos os extratos do cache.')
+    args = parser.parse_args()
+
+    if args.invalidate:
+        count = ExtractCache(args.cache_dir).invalidate()
+        print(f'{count} extrato(s) removido(s) do cache.')
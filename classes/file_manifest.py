@@ -0,0 +1,214 @@
+import hashlib
+import json
+import os
+
+import pandas as pd  # type: ignore
+from loguru import logger  # type: ignore
+
+from classes.order_index import OrderIdIndex
+
+
+def compute_file_hash(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo de um arquivo, lendo-o em blocos.
+
+    Parameters:
+        file_path (str): Caminho do arquivo.
+        block_size (int): Tamanho, em bytes, de cada bloco lido. Padrão: 1 MiB.
+
+    Returns:
+        str: Hash hexadecimal do conteúdo do arquivo.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as file:
+        for block in iter(lambda: file.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileManifest:
+    """
+    Classe para registrar os arquivos já processados pela pipeline e detectar alterações.
+
+    O manifesto é persistido em um arquivo JSON e guarda, para cada arquivo, o tamanho, a data de
+    modificação, o hash do conteúdo, o número de linhas e o resultado parcial da transformação.
+    Com isso, execuções incrementais processam apenas arquivos novos ou modificados e reaproveitam
+    os parciais dos demais.
+
+    O atributo `modified` indica que o manifesto precisa ser salvo, e `partials_changed` indica que
+    algum parcial foi adicionado, alterado ou removido, ou seja, que os totais precisam ser recarregados.
+
+    Quando a deduplicação por `order_id` está ativa, cada entrada também guarda o índice (ver
+    `OrderIdIndex`) dos IDs mantidos do arquivo, registrado com `set_order_ids` antes de `update`.
+    """
+    def __init__(self, manifest_path: str):
+        """
+        Inicializa o manifesto, carregando o arquivo JSON existente, se houver.
+
+        Parameters:
+            manifest_path : str
+                Caminho do arquivo JSON do manifesto.
+        """
+        self.manifest_path = manifest_path
+        self.entries: dict[str, dict] = {}
+        self.modified = False
+        self.partials_changed = False
+        self._pending_hashes: dict[str, str] = {}
+        self._pending_order_ids: dict[str, str] = {}
+
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as file:
+                self.entries = json.load(file)
+
+    def has_changed(self, file_path: str) -> bool:
+        """
+        Verifica se um arquivo é novo ou foi modificado desde o último processamento.
+
+        Se o tamanho e a data de modificação forem iguais aos registrados, o arquivo é considerado
+        inalterado sem que seu conteúdo seja lido. Caso contrário, o hash do conteúdo é comparado,
+        evitando reprocessar arquivos apenas "tocados".
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo.
+
+        Returns:
+            bool
+                True se o arquivo for novo ou tiver conteúdo diferente do registrado.
+        """
+        key = os.path.normpath(file_path)
+        entry = self.entries.get(key)
+        stat = os.stat(file_path)
+
+        if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+            return False
+
+        file_hash = compute_file_hash(file_path)
+        if entry and entry['hash'] == file_hash:
+            entry['size'] = stat.st_size
+            entry['mtime'] = stat.st_mtime
+            self.modified = True
+            return False
+
+        self._pending_hashes[key] = file_hash
+        return True
+
+    def update(self, file_path: str, row_count: int, partial: pd.DataFrame) -> None:
+        """
+        Registra (ou atualiza) um arquivo processado e seu resultado parcial.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo.
+            row_count : int
+                Número de linhas lidas do arquivo.
+            partial : pd.DataFrame
+                Resultado parcial da transformação do arquivo.
+        """
+        key = os.path.normpath(file_path)
+        stat = os.stat(file_path)
+        file_hash = self._pending_hashes.pop(key, None) or compute_file_hash(file_path)
+
+        self.entries[key] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'hash': file_hash,
+            'row_count': row_count,
+            'partial': partial.to_dict(orient='records')
+        }
+        if key in self._pending_order_ids:
+            self.entries[key]['order_ids'] = self._pending_order_ids.pop(key)
+        self.modified = True
+        self.partials_changed = True
+
+    def set_order_ids(self, file_path: str, order_index: OrderIdIndex) -> None:
+        """
+        Registra os `order_id` mantidos de um arquivo, gravados na entrada pelo próximo `update`.
+
+        Parameters:
+            file_path : str
+                Caminho do arquivo.
+            order_index : OrderIdIndex
+                Índice com os IDs mantidos do arquivo após a deduplicação.
+        """
+        self._pending_order_ids[os.path.normpath(file_path)] = order_index.serialize()
+
+    def order_index(self, exclude: list[str]) -> OrderIdIndex:
+        """
+        Combina os índices de `order_id` de todos os arquivos registrados, exceto os informados.
+
+        Parameters:
+            exclude : list[str]
+                Caminhos dos arquivos ignorados (normalmente, os arquivos alterados, que serão relidos).
+
+        Returns:
+            OrderIdIndex
+                Índice com os IDs de todos os demais arquivos.
+
+        Raises:
+            ValueError
+                Se algum arquivo considerado tiver sido registrado sem índice de `order_id`.
+        """
+        excluded = {os.path.normpath(path) for path in exclude}
+        index = OrderIdIndex()
+
+        for path, entry in self.entries.items():
+            if path in excluded:
+                continue
+            if 'order_ids' not in entry:
+                raise ValueError(
+                    f"O arquivo '{path}' foi registrado sem deduplicação. Remova o manifesto para reprocessar todos os arquivos."
+                )
+            index.merge(OrderIdIndex.deserialize(entry['order_ids']))
+        return index
+
+    def remove_missing(self, existing_paths: list[str]) -> list[str]:
+        """
+        Remove do manifesto os arquivos que não existem mais no diretório de entrada.
+
+        Parameters:
+            existing_paths : list[str]
+                Caminhos dos arquivos atualmente presentes.
+
+        Returns:
+            list[str]
+                Caminhos removidos do manifesto.
+        """
+        existing = {os.path.normpath(path) for path in existing_paths}
+        removed = [path for path in self.entries if path not in existing]
+
+        for path in removed:
+            del self.entries[path]
+            logger.info(f"Arquivo '{path}' removido do manifesto.")
+
+        if removed:
+            self.modified = True
+            self.partials_changed = True
+        return removed
+
+    def partials(self) -> list[pd.DataFrame]:
+        """
+        Retorna os resultados parciais de todos os arquivos registrados.
+
+        Returns:
+            list[pd.DataFrame]
+                Um DataFrame parcial por arquivo registrado.
+        """
+        return [pd.DataFrame.from_records(entry['partial']) for entry in self.entries.values()]
+
+    def save(self) -> None:
+        """
+        Persiste o manifesto em disco de forma atômica.
+
+        O conteúdo é gravado em um arquivo temporário que, em seguida, substitui o manifesto
+        anterior, evitando arquivos corrompidos em caso de falha durante a escrita.
+        """
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temp_path = f'{self.manifest_path}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.entries, file, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.manifest_path)
+        self.modified = False
@@ -0,0 +1,173 @@
+import pandas as pd  # type: ignore
+
+AGGREGATION_STATS: dict[str, list[str]] = {
+    'sum': ['sum'],
+    'count': ['count'],
+    'mean': ['sum', 'count'],
+    'min': ['min'],
+    'max': ['max']
+}
+
+MERGE_FUNCTIONS: dict[str, str] = {
+    'sum': 'sum',
+    'count': 'sum',
+    'min': 'min',
+    'max': 'max'
+}
+
+DERIVED_MEASURES: dict[str, list[str]] = {
+    'revenue': ['quantity', 'price']
+}
+
+
+class MultiAggregator:
+    """
+    Classe para calcular vários agregados, com chaves e medidas diferentes, em uma única passada.
+
+    Cada agregado é descrito por uma especificação declarativa com as chaves de agrupamento (`by`)
+    e as medidas, associadas às funções desejadas ('sum', 'count', 'mean', 'min' e 'max'). Além das
+    colunas dos dados, a medida derivada 'revenue' (`quantity * price`) pode ser usada.
+
+    Os dados podem ser entregues de uma vez ou em blocos: cada bloco atualiza estados parciais
+    combináveis (somas, contagens, mínimos e máximos), e a média é obtida apenas no resultado final.
+    Dessa forma, os arquivos ou blocos são lidos uma única vez, independentemente do número de
+    agregados. Em memória, cada bloco é agrupado uma vez por conjunto distinto de chaves: agregados
+    com o mesmo `by` compartilham o mesmo `groupby` e o mesmo estado parcial.
+
+    Exemplo de especificação:
+
+        {
+            'revenue_by_store': {'by': ['store_location'], 'measures': {'revenue': ['sum']}},
+            'quantity_by_product': {'by': ['product_id'], 'measures': {'quantity': ['sum', 'mean']}}
+        }
+    """
+    def __init__(self, specs: dict[str, dict]):
+        """
+        Inicializa o agregador, validando as especificações.
+
+        Parameters:
+            specs : dict[str, dict]
+                Especificações indexadas pelo nome do agregado, cada uma com as chaves 'by'
+                (lista de colunas) e 'measures' (dicionário de medida para lista de funções).
+
+        Raises:
+            ValueError
+                Se alguma especificação não tiver chaves ou medidas, ou usar uma função não suportada.
+        """
+        for name, spec in specs.items():
+            if not spec.get('by') or not spec.get('measures'):
+                raise ValueError(f"A especificação '{name}' deve informar 'by' e 'measures'.")
+            for measure, functions in spec['measures'].items():
+                unsupported = [function for function in functions if function not in AGGREGATION_STATS]
+                if unsupported:
+                    raise ValueError(f"Funções de agregação não suportadas em '{name}.{measure}': {unsupported}")
+
+        self.specs = specs
+        self.groupings: dict[tuple[str, ...], dict[str, list[str]]] = {}
+        for spec in specs.values():
+            required = self.groupings.setdefault(tuple(spec['by']), {})
+            for measure, stats in self._required_stats(spec).items():
+                merged = required.setdefault(measure, [])
+                merged.extend(stat for stat in stats if stat not in merged)
+        self.states: dict[tuple[str, ...], pd.DataFrame | None] = {keys: None for keys in self.groupings}
+
+    def _required_stats(self, spec: dict) -> dict[str, list[str]]:
+        """
+        Calcula as estatísticas parciais necessárias para cada medida de uma especificação.
+
+        Parameters:
+            spec : dict
+                Especificação de um agregado.
+
+        Returns:
+            dict[str, list[str]]
+                Estatísticas parciais ('sum', 'count', 'min', 'max') de cada medida.
+        """
+        required: dict[str, list[str]] = {}
+        for measure, functions in spec['measures'].items():
+            stats = required.setdefault(measure, [])
+            for function in functions:
+                stats.extend(stat for stat in AGGREGATION_STATS[function] if stat not in stats)
+        return required
+
+    def _add_derived_measures(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adiciona ao bloco as medidas derivadas usadas nas especificações.
+
+        Parameters:
+            chunk : pd.DataFrame
+                Bloco de dados.
+
+        Returns:
+            pd.DataFrame
+                Bloco com as colunas derivadas necessárias.
+        """
+        used_measures = {measure for spec in self.specs.values() for measure in spec['measures']}
+        derived = {
+            measure: chunk[sources[0]] * chunk[sources[1]]
+            for measure, sources in DERIVED_MEASURES.items()
+            if measure in used_measures and measure not in chunk.columns
+        }
+        return chunk.assign(**derived) if derived else chunk
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Atualiza os estados parciais de todos os agregados com um bloco de dados.
+
+        Parameters:
+            chunk : pd.DataFrame
+                Bloco de dados com as colunas usadas nas especificações.
+
+        Raises:
+            KeyError
+                Se alguma coluna usada nas especificações não estiver presente no bloco.
+        """
+        chunk = self._add_derived_measures(chunk)
+
+        for name, spec in self.specs.items():
+            required = self._required_stats(spec)
+            missing_columns = [column for column in [*spec['by'], *required] if column not in chunk.columns]
+            if missing_columns:
+                raise KeyError(f"Colunas ausentes para o agregado '{name}': {missing_columns}")
+
+        for keys, required in self.groupings.items():
+            partial = chunk.groupby(list(keys), observed=True).agg(required)
+            partial.columns = [f'{measure}__{stat}' for measure, stat in partial.columns]
+
+            state = self.states[keys]
+            if state is not None:
+                merge_functions = {column: MERGE_FUNCTIONS[column.rsplit('__', 1)[1]] for column in partial.columns}
+                combined = pd.concat([state, partial])
+                partial = combined.groupby(level=list(range(combined.index.nlevels))).agg(merge_functions)
+            self.states[keys] = partial
+
+    def result(self) -> dict[str, pd.DataFrame]:
+        """
+        Calcula os agregados finais a partir dos estados parciais.
+
+        Returns:
+            dict[str, pd.DataFrame]
+                Um DataFrame por agregado, com as chaves de agrupamento e uma coluna
+                `<medida>_<função>` para cada função solicitada, ordenado pelas chaves.
+                Agregados sem dados resultam em DataFrames vazios.
+        """
+        results: dict[str, pd.DataFrame] = {}
+
+        for name, spec in self.specs.items():
+            state = self.states[tuple(spec['by'])]
+            if state is None:
+                results[name] = pd.DataFrame()
+                continue
+
+            output = pd.DataFrame(index=state.index)
+            for measure, functions in spec['measures'].items():
+                for function in functions:
+                    if function == 'mean':
+                        values = state[f'{measure}__sum'] / state[f'{measure}__count']
+                    else:
+                        values = state[f'{measure}__{function}']
+                    output[f'{measure}_{function}'] = values
+
+            results[name] = output.sort_index().reset_index()
+
+        return results
@@ -0,0 +1,287 @@
+import json
+
+import numpy as np  # type: ignore
+
+from classes.sketches import _decode_array, _encode_array
+
+DEDUP_POLICIES: tuple[str, ...] = ('first', 'last', 'error')
+
+MIN_BITMAP_BYTES: int = 1 << 20
+
+
+def _bitmap_fits(min_id: int, max_id: int, count: int) -> bool:
+    """
+    Verifica se um bitmap sobre o intervalo de IDs é a representação mais compacta do conjunto.
+
+    Parameters:
+        min_id : int
+            Menor ID do conjunto.
+        max_id : int
+            Maior ID do conjunto.
+        count : int
+            Número (ou limite superior do número) de IDs do conjunto.
+
+    Returns:
+        bool
+            True se o bitmap ocupar até `MIN_BITMAP_BYTES` ou até os 8 bytes por ID do array ordenado.
+    """
+    return (max_id - min_id) // 8 + 1 <= max(MIN_BITMAP_BYTES, 8 * count)
+
+
+class OrderIdIndex:
+    """
+    Classe que mantém o conjunto de `order_id` já vistos em um bitmap sobre o intervalo de IDs.
+
+    Cada ID ocupa um único bit, a partir de `offset`, de modo que 100 milhões de pedidos com IDs
+    sequenciais ocupam cerca de 12 MB. As consultas e inserções são vetorizadas com NumPy e o
+    bitmap cresce automaticamente quando aparecem IDs fora do intervalo atual. Para IDs maiores que
+    o intervalo, a capacidade é ao menos dobrada, de modo que IDs sequenciais lidos em blocos não
+    realocam o bitmap a cada bloco. O número de IDs (`count`) é mantido a cada inserção, sem
+    percorrer o bitmap.
+
+    Quando os IDs são esparsos (por exemplo, `[1, 2 ** 40]`), o bitmap ocuparia mais memória do que
+    os próprios IDs. Nesse caso, o índice passa a guardar os IDs em um array ordenado de `int64`
+    (`ids`), consultado com `np.searchsorted`, e volta ao bitmap se o intervalo ficar denso.
+
+    O índice pode ser serializado, para ser guardado no manifesto de arquivos entre execuções
+    incrementais, e combinado com outros índices por `merge`.
+    """
+    def __init__(self):
+        """
+        Inicializa um índice vazio.
+        """
+        self.offset = 0
+        self.bits = np.zeros(0, dtype=np.uint8)
+        self.ids: np.ndarray | None = None
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _to_array(self) -> np.ndarray:
+        if self.ids is not None:
+            return self.ids
+        return np.flatnonzero(np.unpackbits(self.bits)).astype(np.int64) + self.offset
+
+    def _store(self, ids: np.ndarray) -> None:
+        """
+        Substitui o conteúdo do índice, escolhendo entre o bitmap e o array ordenado.
+
+        Parameters:
+            ids : np.ndarray
+                IDs ordenados e sem repetição.
+        """
+        self.offset = 0
+        self.bits = np.zeros(0, dtype=np.uint8)
+        self.ids = None
+        self.count = 0
+
+        if ids.size and not _bitmap_fits(int(ids[0]), int(ids[-1]), ids.size):
+            self.ids = ids
+            self.count = int(ids.size)
+        elif ids.size:
+            self._grow(int(ids[0]), int(ids[-1]))
+            self._set_bits(ids)
+
+    def _grow(self, min_id: int, max_id: int) -> None:
+        """
+        Amplia o bitmap para cobrir o intervalo `[min_id, max_id]`, preservando os bits atuais.
+
+        Quando o intervalo cresce para IDs maiores, a capacidade acima de `offset` é ao menos
+        dobrada, de modo que o custo das realocações fica proporcional ao tamanho final do bitmap.
+
+        Parameters:
+            min_id : int
+                Menor ID que o bitmap deve cobrir.
+            max_id : int
+                Maior ID que o bitmap deve cobrir.
+        """
+        if self.bits.size:
+            end = self.offset + self.bits.size * 8 - 1
+            if max_id > end:
+                max_id = max(max_id, self.offset + self.bits.size * 16 - 1)
+            min_id = min(min_id, self.offset)
+            max_id = max(max_id, end)
+
+        offset = min_id - min_id % 8
+        bits = np.zeros((max_id - offset) // 8 + 1, dtype=np.uint8)
+        if self.bits.size:
+            start = (self.offset - offset) // 8
+            bits[start:start + self.bits.size] = self.bits
+
+        self.offset = offset
+        self.bits = bits
+
+    def _set_bits(self, ids: np.ndarray) -> None:
+        """
+        Marca os IDs no bitmap, que já deve cobrir o intervalo, e atualiza `count`.
+
+        Parameters:
+            ids : np.ndarray
+                IDs inteiros a serem marcados.
+        """
+        positions = ids - self.offset
+        touched = np.unique(positions >> 3)
+        before = int(np.bitwise_count(self.bits[touched]).sum())
+        np.bitwise_or.at(self.bits, positions >> 3, (np.uint8(128) >> (positions & 7).astype(np.uint8)))
+        self.count += int(np.bitwise_count(self.bits[touched]).sum()) - before
+
+    def contains(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Verifica quais IDs já estão no índice.
+
+        Parameters:
+            ids : np.ndarray
+                IDs inteiros a serem consultados.
+
+        Returns:
+            np.ndarray
+                Máscara booleana, True para os IDs presentes no índice.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if self.ids is not None:
+            positions = np.minimum(np.searchsorted(self.ids, ids), self.ids.size - 1)
+            return self.ids[positions] == ids
+
+        positions = ids - self.offset
+        inside = (positions >= 0) & (positions < self.bits.size * 8)
+
+        found = np.zeros(ids.size, dtype=bool)
+        inside_positions = positions[inside]
+        found[inside] = (self.bits[inside_positions >> 3] >> (7 - (inside_positions & 7)).astype(np.uint8)) & 1 == 1
+        return found
+
+    def add(self, ids: np.ndarray) -> None:
+        """
+        Adiciona IDs ao índice.
+
+        Parameters:
+            ids : np.ndarray
+                IDs inteiros a serem adicionados.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if ids.size == 0:
+            return
+
+        min_id, max_id = int(ids.min()), int(ids.max())
+        if self.ids is None and self.offset <= min_id and max_id < self.offset + self.bits.size * 8:
+            self._set_bits(ids)
+            return
+
+        if self.ids is None:
+            if self.bits.size:
+                min_id = min(min_id, self.offset)
+                max_id = max(max_id, self.offset + self.bits.size * 8 - 1)
+            if _bitmap_fits(min_id, max_id, len(self) + ids.size):
+                self._grow(min_id, max_id)
+                self._set_bits(ids)
+                return
+
+        self._store(np.union1d(self._to_array(), ids))
+
+    def keep_mask(self, ids: np.ndarray, policy: str = 'first') -> np.ndarray:
+        """
+        Calcula quais linhas devem ser mantidas e registra os IDs mantidos no índice.
+
+        Uma linha é mantida se o seu ID ainda não estiver no índice e se for a primeira ocorrência
+        do ID no próprio lote.
+
+        Parameters:
+            ids : np.ndarray
+                IDs das linhas do lote, na ordem em que foram lidas.
+            policy : str
+                Política de conflito: 'first' mantém a primeira ocorrência e 'error' levanta um erro
+                se houver IDs repetidos. A política 'last' exige o conjunto completo dos dados e não
+                é suportada pelo índice. Padrão: 'first'.
+
+        Returns:
+            np.ndarray
+                Máscara booleana das linhas mantidas.
+
+        Raises:
+            ValueError
+                Se a política for inválida ou 'last', ou se `policy='error'` e houver IDs repetidos.
+        """
+        if policy not in ('first', 'error'):
+            raise ValueError(f"Política de deduplicação '{policy}' não suportada pelo índice. Use 'first' ou 'error'.")
+
+        ids = np.asarray(ids, dtype=np.int64)
+        unique_ids, first_positions = np.unique(ids, return_index=True)
+        keep = np.zeros(ids.size, dtype=bool)
+        keep[first_positions[~self.contains(unique_ids)]] = True
+
+        if policy == 'error' and not keep.all():
+            duplicated_ids = np.unique(ids[~keep])
+            raise ValueError(
+                f'{duplicated_ids.size} order_id(s) repetido(s). Exemplos: {duplicated_ids[:10].tolist()}'
+            )
+
+        self.add(ids[keep])
+        return keep
+
+    def merge(self, other: 'OrderIdIndex') -> 'OrderIdIndex':
+        """
+        Adiciona a este índice todos os IDs de outro índice.
+
+        Parameters:
+            other : OrderIdIndex
+                Índice a ser combinado.
+
+        Returns:
+            OrderIdIndex
+                O próprio índice, atualizado.
+        """
+        if other.ids is None and other.bits.size == 0:
+            return self
+
+        if self.ids is None and other.ids is None:
+            min_id, max_id = other.offset, other.offset + other.bits.size * 8 - 1
+            if self.bits.size:
+                min_id, max_id = min(min_id, self.offset), max(max_id, self.offset + self.bits.size * 8 - 1)
+            if _bitmap_fits(min_id, max_id, len(self) + len(other)):
+                self._grow(other.offset, other.offset + other.bits.size * 8 - 1)
+                start = (other.offset - self.offset) // 8
+                target = self.bits[start:start + other.bits.size]
+                before = int(np.bitwise_count(target).sum())
+                target |= other.bits
+                self.count += int(np.bitwise_count(target).sum()) - before
+                return self
+
+        self._store(np.union1d(self._to_array(), other._to_array()))
+        return self
+
+    def serialize(self) -> str:
+        """
+        Serializa o índice em uma string JSON, com o bitmap (ou o array de IDs) comprimido em base64.
+
+        Returns:
+            str
+                Representação JSON do índice.
+        """
+        if self.ids is not None:
+            return json.dumps({'ids': _encode_array(self.ids)})
+        return json.dumps({'offset': self.offset, 'bits': _encode_array(self.bits)})
+
+    @classmethod
+    def deserialize(cls, data: str) -> 'OrderIdIndex':
+        """
+        Reconstrói um índice serializado com `serialize`.
+
+        Parameters:
+            data : str
+                Representação JSON do índice.
+
+        Returns:
+            OrderIdIndex
+                Índice reconstruído.
+        """
+        content = json.loads(data)
+        index = cls()
+        if 'ids' in content:
+            index.ids = _decode_array(content['ids'], 'int64')
+            index.count = int(index.ids.size)
+        else:
+            index.offset = content['offset']
+            index.bits = _decode_array(content['bits'], 'uint8')
+            index.count = int(np.bitwise_count(index.bits).sum())
+        return index
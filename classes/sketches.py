@@ -0,0 +1,291 @@
+import base64
+import json
+import zlib
+
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+
+
+def _encode_array(values: np.ndarray) -> str:
+    return base64.b64encode(zlib.compress(values.tobytes())).decode('ascii')
+
+def _decode_array(data: str, dtype: str) -> np.ndarray:
+    return np.frombuffer(zlib.decompress(base64.b64decode(data)), dtype=dtype).copy()
+
+
+class HyperLogLog:
+    """
+    Classe que implementa o sketch HyperLogLog para contagem aproximada de valores distintos.
+
+    Cada valor é convertido em um hash de 64 bits com `pd.util.hash_array`. Os `precision` bits
+    mais significativos escolhem um dos `2 ** precision` registradores, que guarda a maior posição
+    do primeiro bit 1 observada nos bits restantes. Todo o processamento é vetorizado com NumPy.
+
+    Sketches com a mesma precisão podem ser combinados com `merge` (máximo dos registradores), o
+    que permite contar distintos entre blocos, arquivos e execuções. O erro relativo esperado é de
+    aproximadamente `1.04 / sqrt(2 ** precision)` (cerca de 0,8% com a precisão padrão).
+    """
+    def __init__(self, precision: int = 14):
+        """
+        Inicializa um sketch vazio.
+
+        Parameters:
+            precision : int
+                Número de bits usados para escolher o registrador, entre 4 e 18. Padrão: 14.
+
+        Raises:
+            ValueError
+                Se a precisão estiver fora do intervalo suportado.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError(f'A precisão deve estar entre 4 e 18, mas recebeu {precision}.')
+
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def add(self, values) -> None:
+        """
+        Adiciona valores ao sketch.
+
+        Parameters:
+            values : array-like
+                Valores a serem contados. Valores nulos também são contados como um valor distinto.
+        """
+        values = np.asarray(values)
+        if values.size == 0:
+            return
+
+        hashes = pd.util.hash_array(values)
+        remaining_bits = 64 - self.precision
+        indexes = (hashes >> np.uint64(remaining_bits)).astype(np.intp)
+
+        # Apenas os 52 bits seguintes são usados, para que a conversão para float64 seja exata.
+        used_bits = min(remaining_bits, 52)
+        suffixes = (hashes & np.uint64((1 << remaining_bits) - 1)) >> np.uint64(remaining_bits - used_bits)
+        _, exponents = np.frexp(suffixes.astype(np.float64))
+        ranks = (used_bits - exponents + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, indexes, ranks)
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """
+        Combina outro sketch a este, como se todos os valores tivessem sido adicionados aqui.
+
+        Parameters:
+            other : HyperLogLog
+                Sketch com a mesma precisão.
+
+        Returns:
+            HyperLogLog
+                O próprio sketch, atualizado.
+
+        Raises:
+            ValueError
+                Se as precisões forem diferentes.
+        """
+        if other.precision != self.precision:
+            raise ValueError('Não é possível combinar sketches HyperLogLog com precisões diferentes.')
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """
+        Estima o número de valores distintos adicionados ao sketch.
+
+        Returns:
+            float
+                Estimativa do número de valores distintos, com correção de linear counting para
+                cardinalidades pequenas.
+        """
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw_estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int32)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw_estimate <= 2.5 * m and zeros:
+            return float(m * np.log(m / zeros))
+        return float(raw_estimate)
+
+    def serialize(self) -> str:
+        """
+        Serializa o sketch em uma string JSON, adequada para o manifesto de arquivos.
+
+        Returns:
+            str
+                Representação JSON do sketch, com os registradores comprimidos em base64.
+        """
+        return json.dumps({'precision': self.precision, 'registers': _encode_array(self.registers)})
+
+    @classmethod
+    def deserialize(cls, data: str) -> 'HyperLogLog':
+        """
+        Reconstrói um sketch serializado com `serialize`.
+
+        Parameters:
+            data : str
+                Representação JSON do sketch.
+
+        Returns:
+            HyperLogLog
+                Sketch reconstruído.
+        """
+        content = json.loads(data)
+        sketch = cls(content['precision'])
+        sketch.registers = _decode_array(content['registers'], 'uint8')
+        return sketch
+
+
+class TDigest:
+    """
+    Classe que implementa o sketch t-digest (variante com fusão) para quantis aproximados.
+
+    Os valores são resumidos em centróides (média e peso), menores nas caudas da distribuição e
+    maiores no centro, segundo a função de escala `k(q) = delta / (2 * pi) * asin(2q - 1)`. A
+    compressão é vetorizada: os centróides são ordenados e agrupados pelo valor inteiro de `k` no
+    início de cada um, de modo que quantis extremos, como p99, mantêm boa precisão.
+
+    Sketches podem ser combinados com `merge`, o que permite calcular quantis entre blocos,
+    arquivos e execuções sem reler os dados.
+    """
+    def __init__(self, delta: float = 200.0):
+        """
+        Inicializa um sketch vazio.
+
+        Parameters:
+            delta : float
+                Parâmetro de compressão; o número de centróides fica em torno de `delta / 2`. Padrão: 200.
+        """
+        self.delta = delta
+        self.means = np.empty(0, dtype=np.float64)
+        self.weights = np.empty(0, dtype=np.float64)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        """
+        Retorna o número de valores adicionados ao sketch.
+        """
+        return float(self.weights.sum())
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+
+        total = weights.sum()
+        left_quantiles = (np.cumsum(weights) - weights) / total
+        scale = self.delta / (2 * np.pi) * np.arcsin(2 * left_quantiles - 1)
+        clusters = np.floor(scale).astype(np.int64)
+        clusters -= clusters[0]
+
+        cluster_weights = np.bincount(clusters, weights=weights)
+        cluster_sums = np.bincount(clusters, weights=means * weights)
+        used = cluster_weights > 0
+
+        self.weights = cluster_weights[used]
+        self.means = cluster_sums[used] / self.weights
+
+    def add(self, values) -> None:
+        """
+        Adiciona valores ao sketch. Valores nulos são ignorados.
+
+        Parameters:
+            values : array-like
+                Valores numéricos.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._compress(np.concatenate([self.means, values]),
+                       np.concatenate([self.weights, np.ones(values.size)]))
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        """
+        Combina outro sketch a este, como se todos os valores tivessem sido adicionados aqui.
+
+        Parameters:
+            other : TDigest
+                Sketch a ser combinado.
+
+        Returns:
+            TDigest
+                O próprio sketch, atualizado.
+        """
+        if other.weights.size == 0:
+            return self
+
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(np.concatenate([self.means, other.means]),
+                       np.concatenate([self.weights, other.weights]))
+        return self
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima o quantil `q` dos valores adicionados ao sketch.
+
+        Parameters:
+            q : float
+                Quantil desejado, entre 0 e 1.
+
+        Returns:
+            float
+                Estimativa do quantil, ou NaN se o sketch estiver vazio.
+
+        Raises:
+            ValueError
+                Se `q` estiver fora do intervalo [0, 1].
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f'O quantil deve estar entre 0 e 1, mas recebeu {q}.')
+        if self.weights.size == 0:
+            return float('nan')
+
+        total = self.weights.sum()
+        centers = np.cumsum(self.weights) - self.weights / 2
+        positions = np.concatenate([[0.0], centers, [total]])
+        values = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * total, positions, values))
+
+    def serialize(self) -> str:
+        """
+        Serializa o sketch em uma string JSON, adequada para o manifesto de arquivos.
+
+        Returns:
+            str
+                Representação JSON do sketch, com os centróides comprimidos em base64.
+        """
+        return json.dumps({
+            'delta': self.delta,
+            'min': self.min if self.weights.size else None,
+            'max': self.max if self.weights.size else None,
+            'means': _encode_array(self.means),
+            'weights': _encode_array(self.weights)
+        })
+
+    @classmethod
+    def deserialize(cls, data: str) -> 'TDigest':
+        """
+        Reconstrói um sketch serializado com `serialize`.
+
+        Parameters:
+            data : str
+                Representação JSON do sketch.
+
+        Returns:
+            TDigest
+                Sketch reconstruído.
+        """
+        content = json.loads(data)
+        sketch = cls(content['delta'])
+        sketch.means = _decode_array(content['means'], 'float64')
+        sketch.weights = _decode_array(content['weights'], 'float64')
+        if sketch.weights.size:
+            sketch.min = content['min']
+            sketch.max = content['max']
+        return sketch
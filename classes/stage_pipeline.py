@@ -0,0 +1,159 @@
+import contextlib
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+from loguru import logger  # type: ignore
+
+from decorators.metrics import METRICS, count_rows
+
+_END = object()
+
+
+class _StageError:
+    """
+    Envelope usado para repassar, pelas filas, a exceção de uma etapa até o consumidor final.
+    """
+    def __init__(self, stage: str, error: BaseException):
+        self.stage = stage
+        self.error = error
+
+
+class StagePipeline:
+    """
+    Classe para executar etapas encadeadas ao mesmo tempo, cada uma em sua própria thread.
+
+    A fonte (por exemplo, os blocos de `extract_chunks`) é consumida por uma thread produtora, e
+    cada etapa recebe os itens da etapa anterior por uma fila limitada a `maxsize` itens. Quando uma
+    fila enche, a etapa anterior espera (backpressure), de modo que no máximo `maxsize` itens por
+    etapa ficam em memória. Com as etapas sobrepostas, o tempo total se aproxima do tempo da etapa
+    mais lenta, e não da soma de todas. A leitura e a análise dos arquivos e as escritas no banco
+    liberam o GIL na maior parte do tempo, o que permite essa sobreposição com threads.
+
+    O tempo de cada item em cada etapa é acumulado no registro `METRICS`, com o nome da etapa. Se
+    uma etapa falhar, as demais são interrompidas e a exceção é relançada para quem consome `run`.
+    """
+    def __init__(self, maxsize: int = 4):
+        """
+        Inicializa a sequência de etapas vazia.
+
+        Parameters:
+            maxsize : int
+                Número máximo de itens em cada fila entre etapas. Padrão: 4.
+
+        Raises:
+            ValueError
+                Se `maxsize` for menor que 1.
+        """
+        if maxsize < 1:
+            raise ValueError(f'O tamanho das filas deve ser maior que zero, mas recebeu {maxsize}.')
+
+        self.maxsize = maxsize
+        self.stages: list[tuple[str, Callable[[Any], Any]]] = []
+
+    def add_stage(self, name: str, func: Callable[[Any], Any]) -> 'StagePipeline':
+        """
+        Adiciona uma etapa ao final da sequência.
+
+        Parameters:
+            name : str
+                Nome da etapa, usado nos logs e nas métricas.
+            func : Callable[[Any], Any]
+                Função aplicada a cada item. Se retornar None, o item não é repassado adiante.
+
+        Returns:
+            StagePipeline
+                A própria sequência, para encadear chamadas.
+        """
+        self.stages.append((name, func))
+        return self
+
+    def _put(self, output: queue.Queue, item: Any, stop: threading.Event) -> bool:
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, source: Iterable[Any], output: queue.Queue, stop: threading.Event) -> None:
+        try:
+            for item in source:
+                if not self._put(output, item, stop):
+                    return
+        except BaseException as e:
+            self._put(output, _StageError('source', e), stop)
+            return
+        self._put(output, _END, stop)
+
+    def _consume(self, name: str, func: Callable[[Any], Any], source: queue.Queue, output: queue.Queue,
+                 stop: threading.Event) -> None:
+        while True:
+            item = source.get()
+            if item is _END or isinstance(item, _StageError):
+                self._put(output, item, stop)
+                return
+
+            start = time.perf_counter_ns()
+            try:
+                result = func(item)
+            except BaseException as e:
+                METRICS.record(name, time.perf_counter_ns() - start, rows_in=count_rows(item), failed=True)
+                self._put(output, _StageError(name, e), stop)
+                return
+            METRICS.record(name, time.perf_counter_ns() - start, rows_in=count_rows(item), rows_out=count_rows(result))
+
+            if result is not None and not self._put(output, result, stop):
+                return
+
+    def run(self, source: Iterable[Any]) -> Iterator[Any]:
+        """
+        Executa as etapas sobre os itens da fonte e entrega os resultados da última etapa.
+
+        As threads são iniciadas na primeira iteração. Se o consumidor interromper a iteração antes
+        do fim, as threads são encerradas e os itens pendentes descartados.
+
+        Parameters:
+            source : Iterable[Any]
+                Itens de entrada, consumidos por uma thread produtora.
+
+        Yields:
+            Any
+                Resultados da última etapa, na ordem da fonte.
+
+        Raises:
+            Exception
+                A exceção levantada pela fonte ou por alguma das etapas.
+        """
+        stop = threading.Event()
+        queues = [queue.Queue(maxsize = self.maxsize) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._produce, args=(source, queues[0], stop), daemon=True)]
+        threads += [
+            threading.Thread(target=self._consume, args=(name, func, queues[position], queues[position + 1], stop),
+                             daemon=True)
+            for position, (name, func) in enumerate(self.stages)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                item = queues[-1].get()
+                if item is _END:
+                    break
+                if isinstance(item, _StageError):
+                    logger.error(f"Etapa '{item.stage}' falhou: {item.error}")
+                    raise item.error
+                yield item
+        finally:
+            stop.set()
+            for stage_queue in queues:
+                with contextlib.suppress(queue.Empty):
+                    while True:
+                        stage_queue.get_nowait()
+                with contextlib.suppress(queue.Full):
+                    stage_queue.put_nowait(_END)
+            for thread in threads:
+                thread.join()
@@ -1,11 +1,111 @@
+import cProfile
+import itertools
+import os
+import threading
 import time
+import tracemalloc
 from functools import wraps
 
 from loguru import logger  # type: ignore
 
-logger.remove()
+from decorators.metrics import METRICS, count_rows
 
-logger.add('./app.log', colorize=True, format="{time:DD/MM/YYYY HH:mm:ss} {message} {level}", level="INFO")
+LOG_FORMAT: str = '{time:DD/MM/YYYY HH:mm:ss} {message} {level}'
+
+_decorator_logs: bool = True
+_profile_dir: str | None = None
+_profile_top_n: int = 20
+_profile_lock = threading.Lock()
+_profile_active: bool = False
+_tracing_stages: int = 0
+_tracing_owned: bool = False
+_profile_counter = itertools.count(1)
+
+
+def configure_logging(log_path: str | None = None, level: str | None = None, log_format: str | None = None,
+                      rotation: str | None = None, compression: str | None = None,
+                      decorator_logs: bool | None = None) -> None:
+    """
+    Configura o destino dos logs da pipeline.
+
+    A função não é chamada na importação do módulo, para que testes e scripts não gravem logs no
+    diretório de trabalho; a linha de comando da pipeline a chama antes de executar `main`. Até
+    lá, as mensagens seguem para o destino padrão do loguru (`stderr`).
+
+    As mensagens são colocadas em uma fila (`enqueue=True`) e gravadas no arquivo por uma thread
+    em segundo plano, de modo que as funções decoradas não esperam pela escrita em disco. O arquivo
+    é rotacionado por tamanho e os arquivos antigos são comprimidos. Os parâmetros não informados
+    são lidos das variáveis de ambiente indicadas abaixo.
+
+    Parameters:
+    -----------
+    log_path : str | None
+        Caminho do arquivo de log (`LOG_PATH`). Padrão: './app.log'.
+    level : str | None
+        Nível mínimo das mensagens (`LOG_LEVEL`). Padrão: 'INFO'.
+    log_format : str | None
+        'text' para texto simples, sem códigos de cor, ou 'json' para uma mensagem JSON por linha
+        (`LOG_FORMAT`). Padrão: 'text'.
+    rotation : str | None
+        Tamanho a partir do qual o arquivo é rotacionado (`LOG_ROTATION`). Padrão: '10 MB'.
+    compression : str | None
+        Formato de compressão dos arquivos rotacionados (`LOG_COMPRESSION`). Padrão: 'zip'.
+    decorator_logs : bool | None
+        Se False, `log_decorator` e `time_decorador` deixam de registrar uma mensagem por chamada
+        (apenas as falhas continuam registradas), o que é indicado para execuções de alto volume
+        (`LOG_DECORATORS=0`). Padrão: True.
+
+    Raises:
+    -------
+    ValueError
+        Se o formato informado não for 'text' nem 'json'.
+    """
+    global _decorator_logs
+
+    log_format = log_format or os.getenv('LOG_FORMAT', 'text')
+    if log_format not in ('text', 'json'):
+        raise ValueError(f"Formato de log '{log_format}' inválido. Use 'text' ou 'json'.")
+    if decorator_logs is None:
+        decorator_logs = os.getenv('LOG_DECORATORS', '1').lower() not in ('0', 'false', 'no')
+
+    logger.remove()
+    logger.add(
+        log_path or os.getenv('LOG_PATH', './app.log'),
+        level=level or os.getenv('LOG_LEVEL', 'INFO'),
+        format=LOG_FORMAT,
+        serialize=log_format == 'json',
+        colorize=False,
+        enqueue=True,
+        rotation=rotation or os.getenv('LOG_ROTATION', '10 MB'),
+        compression=compression or os.getenv('LOG_COMPRESSION', 'zip')
+    )
+    _decorator_logs = decorator_logs
+
+def enable_profiling(output_dir: str | None = './data/profile', top_n: int = 20) -> None:
+    """
+    Ativa (ou desativa) o modo de perfilamento das etapas decoradas com `profile_decorator`.
+
+    O modo também é ativado na importação do módulo se a variável de ambiente `PIPELINE_PROFILE`
+    estiver definida, com o diretório de saída como valor ('1' usa o diretório padrão).
+
+    Parameters:
+    -----------
+    output_dir : str | None
+        Diretório onde os arquivos `.prof` e os relatórios de alocação são gravados. Se None, o
+        modo é desativado. Padrão: './data/profile'.
+    top_n : int
+        Número de linhas de código listadas no relatório de alocação. Padrão: 20.
+    """
+    global _profile_dir, _profile_top_n
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    _profile_dir = output_dir
+    _profile_top_n = top_n
+
+_profile_env = os.getenv('PIPELINE_PROFILE', '')
+if _profile_env not in ('', '0'):
+    enable_profiling('./data/profile' if _profile_env == '1' else _profile_env)
 
 def log_decorator(func):
     """
@@ -15,6 +115,8 @@ def log_decorator(func):
     da execução de uma função, além de capturar e registrar quaisquer
     exceções que possam ocorrer durante a execução da função. As mensagens
     de log são gravadas em um arquivo especificado no formato configurado.
+    As mensagens de início e de sucesso são omitidas quando os logs dos
+    decoradores estão desativados (ver `configure_logging`).
 
     Parameters:
     -----------
@@ -34,10 +136,12 @@ def log_decorator(func):
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger.info(f'Executando a função {func.__name__}.')
+        if _decorator_logs:
+            logger.info(f'Executando a função {func.__name__}.')
         try:
             result = func(*args, **kwargs)
-            logger.info(f'A função {func.__name__} finalizou com sucesso.')
+            if _decorator_logs:
+                logger.info(f'A função {func.__name__} finalizou com sucesso.')
             return result
         except Exception as e:
             logger.error(f'A função {func.__name__} falhou com a exceção: {e}')
@@ -52,6 +156,10 @@ def time_decorador(func):
     e registra esse tempo em segundos usando o log configurado. Além disso,
     captura e registra exceções que possam ocorrer durante a execução.
 
+    O tempo é medido com `time.perf_counter_ns` e também é acumulado, junto com as
+    linhas recebidas e produzidas, no registro de métricas `METRICS` (ver
+    `decorators/metrics.py`), usando o nome da função como etapa.
+
     Parameters:
     -----------
     func : callable
@@ -70,14 +178,85 @@ def time_decorador(func):
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        rows_in = count_rows(args[0]) if args else 0
+        start_time = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
-            end_time = time.time()
-            total_time = end_time - start_time
-            logger.info(f'A função {func.__name__} levou {total_time:.4f} segundos para ser processada.')
+            total_time = time.perf_counter_ns() - start_time
+            METRICS.record(func.__name__, total_time, rows_in, count_rows(result))
+            if _decorator_logs:
+                logger.info(f'A função {func.__name__} levou {total_time / 1e9:.4f} segundos para ser processada.')
             return result
         except Exception as e:
+            METRICS.record(func.__name__, time.perf_counter_ns() - start_time, rows_in, failed=True)
             logger.error(f'A função {func.__name__} falhou com a exceção: {e}')
             raise
     return wrapper
+
+def profile_decorator(func):
+    """
+    Decorador para perfilar uma etapa da pipeline quando o modo de perfilamento está ativo.
+
+    Com o modo ativo (ver `enable_profiling`), cada chamada é executada sob o `cProfile` e entre
+    dois snapshots do `tracemalloc`. Ao final, são gravados no diretório de saída um arquivo
+    `<função>-<pid>-<n>.prof` (para `pstats` ou `snakeviz`) e um relatório
+    `<função>-<pid>-<n>.alloc.txt` com as linhas que mais alocaram memória durante a chamada.
+
+    Como apenas um `cProfile` pode estar ativo por vez no processo, etapas executadas dentro de
+    outra etapa perfilada (ou em paralelo a ela) aparecem no `.prof` da etapa externa e geram
+    apenas o relatório de alocação.
+
+    Com o modo desativado, o custo é apenas a verificação de uma variável global.
+
+    Parameters:
+    -----------
+    func : callable
+        A função que será decorada.
+
+    Returns:
+    --------
+    callable
+        A função decorada com o perfilamento opcional.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        global _profile_active, _tracing_stages, _tracing_owned
+
+        if _profile_dir is None:
+            return func(*args, **kwargs)
+
+        base_path = os.path.join(_profile_dir, f'{func.__name__}-{os.getpid()}-{next(_profile_counter)}')
+
+        with _profile_lock:
+            profiler = None if _profile_active else cProfile.Profile()
+            _profile_active = _profile_active or profiler is not None
+            if _tracing_stages == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                _tracing_owned = True
+            _tracing_stages += 1
+        before = tracemalloc.take_snapshot()
+
+        if profiler is not None:
+            profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(f'{base_path}.prof')
+
+            statistics = tracemalloc.take_snapshot().compare_to(before, 'lineno')
+            with _profile_lock:
+                if profiler is not None:
+                    _profile_active = False
+                _tracing_stages -= 1
+                if _tracing_stages == 0 and _tracing_owned:
+                    tracemalloc.stop()
+                    _tracing_owned = False
+
+            with open(f'{base_path}.alloc.txt', 'w', encoding='utf-8') as file:
+                file.write(f'Top {_profile_top_n} alocações de {func.__name__}:\n')
+                for statistic in statistics[:_profile_top_n]:
+                    file.write(f'{statistic}\n')
+            logger.info(f'Perfil da função {func.__name__} gravado em {base_path}.')
+    return wrapper
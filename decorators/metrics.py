@@ -0,0 +1,192 @@
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - indisponível no Windows
+    resource = None
+
+STAGE_COUNTERS: tuple[str, ...] = (
+    'calls', 'failures', 'duration_ns', 'max_duration_ns', 'rows_in', 'rows_out', 'bytes_read', 'files_read'
+)
+
+PROMETHEUS_METRICS: dict[str, tuple[str, str, str]] = {
+    'calls': ('pipeline_stage_calls_total', 'counter', 'Número de execuções da etapa.'),
+    'failures': ('pipeline_stage_failures_total', 'counter', 'Número de execuções da etapa que falharam.'),
+    'duration_seconds': ('pipeline_stage_duration_seconds_total', 'counter', 'Tempo total de execução da etapa.'),
+    'max_duration_seconds': ('pipeline_stage_duration_seconds_max', 'gauge', 'Maior tempo de uma execução da etapa.'),
+    'rows_in': ('pipeline_stage_rows_in_total', 'counter', 'Linhas recebidas pela etapa.'),
+    'rows_out': ('pipeline_stage_rows_out_total', 'counter', 'Linhas produzidas pela etapa.'),
+    'bytes_read': ('pipeline_stage_bytes_read_total', 'counter', 'Bytes lidos dos arquivos de entrada.'),
+    'files_read': ('pipeline_stage_files_read_total', 'counter', 'Arquivos de entrada lidos.'),
+    'peak_rss_bytes': ('pipeline_stage_peak_rss_bytes', 'gauge', 'Pico de memória residente ao final da etapa.')
+}
+
+
+def count_rows(value: Any) -> int:
+    """
+    Conta as linhas de um resultado da pipeline sem percorrê-lo.
+
+    Parameters:
+        value (Any): DataFrame, tabela Arrow ou dicionário de DataFrames (como os de `extract_changed_files`).
+
+    Returns:
+        int: Número de linhas, ou 0 se o valor não tiver linhas (por exemplo, geradores e None).
+    """
+    if isinstance(value, dict):
+        return sum(count_rows(item) for item in value.values())
+    if hasattr(value, 'num_rows'):
+        return int(value.num_rows)
+    if hasattr(value, 'columns') and hasattr(value, '__len__'):
+        return len(value)
+    return 0
+
+def peak_rss_bytes() -> int:
+    """
+    Retorna o pico de memória residente (RSS) do processo, em bytes.
+
+    Returns:
+        int: Pico de RSS, ou 0 se o módulo `resource` não estiver disponível.
+    """
+    if resource is None:  # pragma: no cover - indisponível no Windows
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class MetricsRegistry:
+    """
+    Classe que acumula, em memória, contadores por etapa da pipeline.
+
+    Cada chamada registrada apenas soma inteiros em um dicionário (tempos em nanossegundos, obtidos
+    com `time.perf_counter_ns`), sem formatar mensagens nem escrever em arquivos. Os contadores são
+    gravados de uma só vez por `flush`, ao final da execução, em um resumo JSON e em um arquivo
+    texto no formato do Prometheus (para o textfile collector do node_exporter).
+    """
+    def __init__(self):
+        """
+        Inicializa o registro sem nenhuma etapa.
+        """
+        self.stages: dict[str, dict[str, int]] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def _stage(self, stage: str) -> dict[str, int]:
+        counters = self.stages.get(stage)
+        if counters is None:
+            counters = self.stages.setdefault(stage, dict.fromkeys(STAGE_COUNTERS, 0) | {'peak_rss_bytes': 0})
+        return counters
+
+    def record(self, stage: str, duration_ns: int, rows_in: int = 0, rows_out: int = 0, failed: bool = False) -> None:
+        """
+        Registra uma execução de uma etapa.
+
+        Parameters:
+            stage (str): Nome da etapa.
+            duration_ns (int): Duração da execução, em nanossegundos.
+            rows_in (int): Linhas recebidas pela etapa. Padrão: 0.
+            rows_out (int): Linhas produzidas pela etapa. Padrão: 0.
+            failed (bool): Se True, a execução terminou com uma exceção. Padrão: False.
+        """
+        peak = peak_rss_bytes()
+        with self._lock:
+            counters = self._stage(stage)
+            counters['calls'] += 1
+            counters['failures'] += failed
+            counters['duration_ns'] += duration_ns
+            counters['max_duration_ns'] = max(counters['max_duration_ns'], duration_ns)
+            counters['rows_in'] += rows_in
+            counters['rows_out'] += rows_out
+            counters['peak_rss_bytes'] = max(counters['peak_rss_bytes'], peak)
+
+    def increment(self, stage: str, **counters: int) -> None:
+        """
+        Soma valores a contadores de uma etapa (por exemplo, `bytes_read` e `files_read`).
+
+        Parameters:
+            stage (str): Nome da etapa.
+            **counters (int): Valores a serem somados, indexados pelo nome do contador.
+        """
+        with self._lock:
+            stage_counters = self._stage(stage)
+            for name, value in counters.items():
+                stage_counters[name] = stage_counters.get(name, 0) + value
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Monta o resumo dos contadores acumulados.
+
+        Returns:
+            dict[str, Any]: Resumo com o início da execução, o pico de RSS do processo e, para cada
+                etapa, os contadores com as durações convertidas para segundos.
+        """
+        with self._lock:
+            stages = {stage: dict(counters) for stage, counters in self.stages.items()}
+
+        for counters in stages.values():
+            counters['duration_seconds'] = counters.pop('duration_ns') / 1e9
+            counters['max_duration_seconds'] = counters.pop('max_duration_ns') / 1e9
+
+        return {'started_at': self.started_at, 'peak_rss_bytes': peak_rss_bytes(), 'stages': stages}
+
+    def to_prometheus(self) -> str:
+        """
+        Converte os contadores acumulados para o formato texto do Prometheus.
+
+        Returns:
+            str: Métricas no formato de exposição do Prometheus, com o rótulo `stage`.
+        """
+        summary = self.summary()
+        lines: list[str] = []
+
+        for key, (name, metric_type, description) in PROMETHEUS_METRICS.items():
+            lines.append(f'# HELP {name} {description}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            for stage, counters in sorted(summary['stages'].items()):
+                lines.append(f'{name}{{stage="{stage}"}} {counters.get(key, 0)}')
+
+        lines.append('# HELP pipeline_peak_rss_bytes Pico de memória residente do processo.')
+        lines.append('# TYPE pipeline_peak_rss_bytes gauge')
+        lines.append(f"pipeline_peak_rss_bytes {summary['peak_rss_bytes']}")
+        return '\n'.join(lines) + '\n'
+
+    def flush(self, output_dir: str, prefix: str = 'pipeline') -> tuple[str, str]:
+        """
+        Grava os contadores acumulados em `<prefix>.json` e `<prefix>.prom`.
+
+        Os arquivos são escritos de forma atômica (arquivo temporário seguido de `os.replace`), para
+        que o coletor do Prometheus nunca leia um arquivo incompleto.
+
+        Parameters:
+            output_dir (str): Diretório onde os arquivos são gravados.
+            prefix (str): Nome base dos arquivos. Padrão: 'pipeline'.
+
+        Returns:
+            tuple[str, str]: Caminhos do resumo JSON e do arquivo do Prometheus.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        json_path = os.path.join(output_dir, f'{prefix}.json')
+        prom_path = os.path.join(output_dir, f'{prefix}.prom')
+
+        for path, content in ((json_path, json.dumps(self.summary(), indent=2)), (prom_path, self.to_prometheus())):
+            temp_path = f'{path}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                file.write(content)
+            os.replace(temp_path, path)
+
+        return json_path, prom_path
+
+    def reset(self) -> None:
+        """
+        Remove todos os contadores acumulados e reinicia o horário de início.
+        """
+        with self._lock:
+            self.stages = {}
+            self.started_at = time.time()
+
+
+METRICS = MetricsRegistry()
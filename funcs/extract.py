@@ -1,12 +1,109 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterator
+
 import pandas as pd  # type: ignore
+from loguru import logger  # type: ignore
+
+from classes.data_extractor import (FILE_EXTENSIONS, DataExtractor,
+                                    require_pyarrow)
+from classes.extract_cache import ExtractCache
+from classes.file_manifest import FileManifest
+from classes.order_index import DEDUP_POLICIES, OrderIdIndex
+from decorators.decorators import (log_decorator, profile_decorator,
+                                   time_decorador)
+
+try:
+    import pyarrow  # type: ignore
+except ImportError:  # pragma: no cover - dependência opcional
+    pyarrow = None
+
+
+def _run_readers(readers: list[Callable[..., pd.DataFrame]], data_path: str, parallel: bool, max_workers: int,
+                 use_processes: bool) -> list[pd.DataFrame]:
+    """
+    Executa uma lista de leitores sobre o mesmo diretório, em sequência ou em paralelo.
+
+    No modo paralelo, as leituras são submetidas a um pool de threads (ou de processos) e os
+    resultados são coletados na mesma ordem dos leitores. Qualquer exceção levantada por um leitor,
+    como `FileNotFoundError` ou `SchemaError`, é relançada sem alterações.
+
+    Parameters:
+        readers (list[Callable[..., pd.DataFrame]]): Leitores que recebem o argumento `input_path`.
+        data_path (str): Caminho do diretório onde os arquivos estão localizados.
+        parallel (bool): Se True, executa as leituras simultaneamente.
+        max_workers (int): Número máximo de workers do pool.
+        use_processes (bool): Se True, usa um pool de processos em vez de threads.
+
+    Returns:
+        list[pd.DataFrame]: DataFrames lidos, na ordem dos leitores.
+    """
+    if not parallel:
+        return [reader(input_path = data_path) for reader in readers]
+
+    if max_workers < 1:
+        raise ValueError(f"O número de workers deve ser maior que zero, mas recebeu {max_workers}.")
+
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers = max_workers) as executor:
+        futures = [executor.submit(reader, input_path = data_path) for reader in readers]
+        return [future.result() for future in futures]
+
+def deduplicate_orders(data: pd.DataFrame, policy: str = 'first', index: OrderIdIndex | None = None) -> pd.DataFrame:
+    """
+    Remove as linhas com `order_id` repetido, de acordo com a política de conflito.
 
-from classes.data_extractor import DataExtractor
-from decorators.decorators import log_decorator, time_decorador
+    Com as políticas 'first' e 'error', os IDs mantidos são registrados em um `OrderIdIndex`
+    (um bitmap sobre o intervalo de IDs). Ao reutilizar o mesmo índice entre chamadas, a
+    deduplicação vale entre blocos e entre execuções incrementais.
 
+    Parameters:
+        data (pd.DataFrame): DataFrame com a coluna 'order_id'.
+        policy (str): Política de conflito: 'first' mantém a primeira ocorrência, 'last' mantém a
+            última (apenas sem índice, pois exige o conjunto completo dos dados) e 'error' levanta um
+            erro se houver IDs repetidos. Padrão: 'first'.
+        index (OrderIdIndex | None): Índice dos IDs já vistos. Se None, apenas as repetições dentro
+            de `data` são consideradas. Padrão: None.
+
+    Returns:
+        pd.DataFrame: DataFrame sem `order_id` repetidos. Se alguma linha for removida, o índice é
+            reiniciado.
+
+    Raises:
+        KeyError: Se a coluna 'order_id' não estiver presente.
+        ValueError: Se a política for inválida, se 'last' for usada com um índice ou se
+            `policy='error'` e houver IDs repetidos.
+    """
+    if policy not in DEDUP_POLICIES:
+        raise ValueError(f"Política de deduplicação '{policy}' inválida. Use uma de {list(DEDUP_POLICIES)}.")
+    if 'order_id' not in data.columns:
+        raise KeyError("A coluna 'order_id' não foi encontrada.")
+
+    if policy == 'last':
+        if index is not None:
+            raise ValueError("A política 'last' não é suportada em blocos nem em execuções incrementais.")
+        keep = ~data['order_id'].duplicated(keep='last').to_numpy()
+    else:
+        keep = (index if index is not None else OrderIdIndex()).keep_mask(data['order_id'].to_numpy(), policy)
+
+    removed = int(len(data) - keep.sum())
+    if not removed:
+        return data
+
+    logger.info(f'{removed} linha(s) com order_id repetido removida(s).')
+    return data[keep].reset_index(drop=True)
 
 @time_decorador
 @log_decorator
-def extract_and_consolidate(data_path: str) -> pd.DataFrame:
+@profile_decorator
+def extract_and_consolidate(data_path: str, parallel: bool = False, max_workers: int = 3,
+                            use_processes: bool = False, partitioned: bool = False,
+                            partition_filter: dict[str, list[str]] | None = None,
+                            validation: str = 'full', optimize_dtypes: bool = False,
+                            columns: list[str] | None = None,
+                            filters: list[tuple[str, str, Any]] | None = None,
+                            cache_dir: str | None = None, deduplicate: str | None = None,
+                            parser_engine: str = 'c') -> pd.DataFrame:
     """
     Extrai e consolida dados de arquivos CSV, JSON e Parquet em um único DataFrame.
 
@@ -14,20 +111,215 @@ def extract_and_consolidate(data_path: str) -> pd.DataFrame:
     de arquivos (CSV, JSON e Parquet) presentes em um diretório específico. Após a extração, os
     dados são concatenados em um único DataFrame.
 
+    Com `parallel=True`, as três leituras (incluindo a validação de cada arquivo) são executadas ao
+    mesmo tempo, de modo que o tempo total se aproxima do tempo do formato mais lento.
+
+    Com `partitioned=True`, a regra de um único arquivo por formato deixa de valer: todos os arquivos
+    de cada formato, inclusive em subdiretórios Hive (`year=/month=`), são lidos em paralelo e os
+    valores de partição viram colunas. Formatos sem nenhum arquivo selecionado são ignorados.
+
     Parameters:
         data_path (str): Caminho do diretório onde os arquivos CSV, JSON e Parquet estão localizados.
+        parallel (bool): Se True, lê os três formatos simultaneamente. Padrão: False.
+        max_workers (int): Número máximo de workers usados no modo paralelo. Padrão: 3.
+        use_processes (bool): Se True, usa um pool de processos em vez de threads no modo paralelo.
+            Padrão: False.
+        partitioned (bool): Se True, lê todos os arquivos de cada formato, de forma recursiva. Padrão: False.
+        partition_filter (dict[str, list[str]] | None): Valores de partição aceitos no modo particionado,
+            usados para descartar arquivos sem abri-los. Padrão: None.
+        validation (str): Modo de validação do `DataExtractor`: 'full', 'fast' ou 'sample'. Padrão: 'full'.
+        optimize_dtypes (bool): Se True, converte o DataFrame consolidado para tipos compactos
+            (ver `DataExtractor.optimize_dtypes`). Padrão: False.
+        columns (list[str] | None): Colunas a serem lidas (projeção). Padrão: None (todas).
+        filters (list[tuple[str, str, Any]] | None): Predicados `(coluna, operador, valor)` repassados
+            aos leitores. Padrão: None.
+        cache_dir (str | None): Diretório do cache de extratos validados (ver `ExtractCache`). Se None,
+            o cache não é usado. Padrão: None.
+        deduplicate (str | None): Política de deduplicação por 'order_id' ('first', 'last' ou 'error',
+            ver `deduplicate_orders`), aplicada após a consolidação, na ordem CSV, JSON e Parquet.
+            Se None, os dados não são deduplicados. Padrão: None.
+        parser_engine (str): Motor de leitura de CSV e JSON do `DataExtractor`: 'c' ou 'pyarrow'.
+            Padrão: 'c'.
 
     Returns:
         pd.DataFrame: DataFrame contendo os dados consolidados de todos os arquivos extraídos.
 
     Raises:
-        FileNotFoundError: Se algum dos arquivos CSV, JSON ou Parquet não for encontrado no diretório especificado.
+        FileNotFoundError: Se algum dos arquivos CSV, JSON ou Parquet não for encontrado no diretório especificado
+            (ou, no modo particionado, se nenhum arquivo for encontrado).
+        pandera.errors.SchemaError: Se algum dos arquivos não atender ao esquema de validação.
+        ValueError: Se `max_workers` for menor que 1 no modo paralelo, ou se `policy='error'` e houver
+            'order_id' repetidos.
     """
-    extractor = DataExtractor()
+    drop_order_id = bool(deduplicate and columns is not None and 'order_id' not in columns)
+    if drop_order_id:
+        columns = [*columns, 'order_id']
+
+    cache = ExtractCache(cache_dir) if cache_dir else None
+    extractor = DataExtractor(validation = validation, columns = columns, filters = filters, cache = cache,
+                              parser_engine = parser_engine)
+
+    if partitioned:
+        readers = [
+            partial(extractor.read_partitioned_data, file_format = file_format, max_workers = max_workers,
+                    partition_filter = partition_filter)
+            for file_format in FILE_EXTENSIONS
+            if extractor.select_files(data_path, file_format, partition_filter)
+        ]
+        if not readers:
+            raise FileNotFoundError(f"Nenhum arquivo CSV, JSON ou Parquet encontrado no diretório '{data_path}'.")
+    else:
+        readers = [extractor.read_csv_data, extractor.read_json_data, extractor.read_parquet_data]
 
-    csv_data: pd.DataFrame = extractor.read_csv_data(input_path = data_path)
-    json_data: pd.DataFrame = extractor.read_json_data(input_path = data_path)
-    parquet_data: pd.DataFrame = extractor.read_parquet_data(input_path = data_path)
+    frames = _run_readers(readers, data_path, parallel, max_workers, use_processes)
 
-    consolidate_data: pd.DataFrame = pd.concat([csv_data, json_data, parquet_data], ignore_index=True)
+    consolidate_data: pd.DataFrame = pd.concat(frames, ignore_index=True)
+    if deduplicate:
+        consolidate_data = deduplicate_orders(consolidate_data, deduplicate)
+    if drop_order_id:
+        consolidate_data = consolidate_data.drop(columns='order_id')
+    if optimize_dtypes:
+        consolidate_data = extractor.optimize_dtypes(consolidate_data)
     return consolidate_data
+
+def extract_chunks(data_path: str, chunksize: int = 100_000, validation: str = 'full',
+                   optimize_dtypes: bool = False, columns: list[str] | None = None,
+                   filters: list[tuple[str, str, Any]] | None = None,
+                   deduplicate: str | None = None, parser_engine: str = 'c') -> Iterator[pd.DataFrame]:
+    """
+    Extrai os dados de arquivos CSV, JSON e Parquet em blocos validados de tamanho limitado.
+
+    Diferente de `extract_and_consolidate`, esta função não concatena os dados: os blocos são
+    entregues um a um (primeiro os CSV, depois os JSON e por fim os Parquet), permitindo processar
+    volumes maiores que a memória disponível.
+
+    Parameters:
+        data_path (str): Caminho do diretório onde os arquivos CSV, JSON e Parquet estão localizados.
+        chunksize (int): Número máximo de linhas por bloco. Padrão: 100_000.
+        validation (str): Modo de validação do `DataExtractor`: 'full', 'fast' ou 'sample'. Padrão: 'full'.
+        optimize_dtypes (bool): Se True, converte cada bloco para tipos compactos. Padrão: False.
+        columns (list[str] | None): Colunas a serem lidas (projeção). Padrão: None (todas).
+        filters (list[tuple[str, str, Any]] | None): Predicados `(coluna, operador, valor)` repassados
+            aos leitores. Padrão: None.
+        deduplicate (str | None): Política de deduplicação por 'order_id' ('first' ou 'error'). Um único
+            `OrderIdIndex` é compartilhado entre os blocos. Se None, os blocos não são deduplicados.
+            Padrão: None.
+        parser_engine (str): Motor de leitura de CSV e JSON do `DataExtractor`: 'c' ou 'pyarrow'.
+            Padrão: 'c'.
+
+    Yields:
+        pd.DataFrame: Blocos validados de acordo com o esquema.
+
+    Raises:
+        FileNotFoundError: Se o caminho do diretório não existir.
+        pandera.errors.SchemaError: Se algum bloco não atender ao esquema de validação.
+        ValueError: Se a política de deduplicação não for suportada em blocos ou se `policy='error'`
+            e houver 'order_id' repetidos.
+    """
+    drop_order_id = bool(deduplicate and columns is not None and 'order_id' not in columns)
+    if drop_order_id:
+        columns = [*columns, 'order_id']
+
+    extractor = DataExtractor(validation = validation, columns = columns, filters = filters,
+                              parser_engine = parser_engine)
+    index = OrderIdIndex() if deduplicate else None
+
+    for file_format in FILE_EXTENSIONS:
+        for chunk in extractor.iter_chunks(data_path, file_format, chunksize):
+            if deduplicate:
+                chunk = deduplicate_orders(chunk, deduplicate, index)
+            if drop_order_id:
+                chunk = chunk.drop(columns='order_id')
+            yield extractor.optimize_dtypes(chunk) if optimize_dtypes else chunk
+
+@time_decorador
+@log_decorator
+def extract_changed_files(data_path: str, manifest: FileManifest,
+                          deduplicate: str | None = None, parser_engine: str = 'c') -> dict[str, pd.DataFrame]:
+    """
+    Extrai apenas os arquivos CSV, JSON e Parquet novos ou modificados desde a última execução.
+
+    Todos os arquivos do diretório (inclusive em subdiretórios) são comparados com o manifesto.
+    Arquivos inalterados não são lidos, e arquivos que deixaram de existir são removidos do manifesto.
+
+    Com `deduplicate`, os arquivos alterados são deduplicados por 'order_id' contra os IDs dos
+    demais arquivos registrados no manifesto (ver `FileManifest.order_index`), e os IDs mantidos de
+    cada arquivo são registrados para as próximas execuções.
+
+    Parameters:
+        data_path (str): Caminho do diretório onde os arquivos estão localizados.
+        manifest (FileManifest): Manifesto com o estado dos arquivos já processados.
+        deduplicate (str | None): Política de deduplicação por 'order_id' ('first' ou 'error'). Padrão: None.
+        parser_engine (str): Motor de leitura de CSV e JSON do `DataExtractor`: 'c' ou 'pyarrow'.
+            Padrão: 'c'.
+
+    Returns:
+        dict[str, pd.DataFrame]: DataFrames validados dos arquivos alterados, indexados pelo caminho.
+
+    Raises:
+        FileNotFoundError: Se o caminho do diretório não existir.
+        pandera.errors.SchemaError: Se algum arquivo alterado não atender ao esquema de validação.
+        ValueError: Se a política de deduplicação não for suportada, se `policy='error'` e houver
+            'order_id' repetidos ou se o manifesto tiver arquivos registrados sem deduplicação.
+    """
+    extractor = DataExtractor(parser_engine = parser_engine)
+
+    changed_data: dict[str, pd.DataFrame] = {}
+    all_files: list[str] = []
+
+    for file_format in FILE_EXTENSIONS:
+        for file_path in extractor.list_files(data_path, file_format):
+            all_files.append(file_path)
+            if manifest.has_changed(file_path):
+                changed_data[file_path] = extractor.read_file(file_path, file_format)
+
+    manifest.remove_missing(all_files)
+
+    if deduplicate:
+        index = manifest.order_index(exclude = list(changed_data))
+        for file_path, data in changed_data.items():
+            changed_data[file_path] = deduplicate_orders(data, deduplicate, index)
+            file_index = OrderIdIndex()
+            file_index.add(changed_data[file_path]['order_id'].to_numpy())
+            manifest.set_order_ids(file_path, file_index)
+
+    return changed_data
+
+@time_decorador
+@log_decorator
+def extract_and_consolidate_arrow(data_path: str, max_workers: int = 3) -> 'pyarrow.Table':
+    """
+    Extrai e consolida dados de arquivos CSV, JSON e Parquet em uma única tabela Arrow.
+
+    Versão Arrow de `extract_and_consolidate`: todos os arquivos de cada formato (inclusive em
+    subdiretórios) são lidos em paralelo pelos leitores nativos do `pyarrow` e validados com
+    `DataExtractor.validate_arrow_table`. A consolidação é feita com `pyarrow.concat_tables`,
+    que apenas referencia os blocos de memória de cada tabela, sem copiá-los.
+
+    Parameters:
+        data_path (str): Caminho do diretório onde os arquivos CSV, JSON e Parquet estão localizados.
+        max_workers (int): Número máximo de arquivos lidos simultaneamente. Padrão: 3.
+
+    Returns:
+        pyarrow.Table: Tabela contendo os dados consolidados de todos os arquivos extraídos.
+
+    Raises:
+        ImportError: Se o `pyarrow` não estiver instalado.
+        FileNotFoundError: Se o caminho não existir ou se nenhum arquivo for encontrado.
+        pandera.errors.SchemaError: Se algum arquivo não atender ao esquema de validação.
+    """
+    require_pyarrow()
+    extractor = DataExtractor()
+
+    files = [
+        (file_path, file_format)
+        for file_format in FILE_EXTENSIONS
+        for file_path in extractor.list_files(data_path, file_format)
+    ]
+    if not files:
+        raise FileNotFoundError(f"Nenhum arquivo CSV, JSON ou Parquet encontrado no diretório '{data_path}'.")
+
+    with ThreadPoolExecutor(max_workers = max_workers) as executor:
+        tables = list(executor.map(lambda item: extractor.read_arrow_table(*item), files))
+
+    return pyarrow.concat_tables(tables)
@@ -1,10 +1,15 @@
+import argparse
 import os
 
+import fastparquet  # type: ignore
 import numpy as np  # type: ignore
 import pandas as pd  # type: ignore
 
 np.random.seed(42)
 
+PAYMENT_METHODS: list[str] = ['Credit Card', 'Debit Card', 'Cash', 'PayPal']
+STORE_LOCATIONS: list[str] = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix']
+
 def generate_data(path: str) -> None:
     """
     Gera dados fictícios de vendas e salva em CSV, Parquet e JSON.
@@ -38,8 +43,8 @@ def generate_data(path: str) -> None:
         'product_id': np.random.randint(1000, 2000, size=n),
         'quantity': np.random.randint(1, 10, size=n),
         'price': np.round(np.random.uniform(10, 500, size=n), 2),
-        'payment_method': np.random.choice(['Credit Card', 'Debit Card', 'Cash', 'PayPal'], size=n),
-        'store_location': np.random.choice(['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix'], size=n)
+        'payment_method': np.random.choice(PAYMENT_METHODS, size=n),
+        'store_location': np.random.choice(STORE_LOCATIONS, size=n)
     })
 
     if not os.path.exists(path):
@@ -51,6 +56,143 @@ def generate_data(path: str) -> None:
 
     print('Arquivos criados com sucesso!')
 
+def _generate_chunk(rng: np.random.Generator, first_order_id: int, size: int, customer_cardinality: int,
+                    product_cardinality: int, store_cardinality: int, n_days: int, dirty_ratio: float) -> pd.DataFrame:
+    """
+    Gera um bloco de vendas fictícias com IDs consecutivos a partir de `first_order_id`.
+
+    Parameters:
+        rng (np.random.Generator): Gerador de números aleatórios compartilhado entre os blocos.
+        first_order_id (int): 'order_id' da primeira linha do bloco.
+        size (int): Número de linhas do bloco.
+        customer_cardinality (int): Número de clientes distintos.
+        product_cardinality (int): Número de produtos distintos.
+        store_cardinality (int): Número de lojas distintas.
+        n_days (int): Número de dias distintos em 'order_date', a partir de 01/01/2023.
+        dirty_ratio (float): Fração das linhas com valores inválidos.
+
+    Returns:
+        pd.DataFrame: Bloco de vendas com as colunas do esquema de validação.
+    """
+    order_ids = np.arange(first_order_id, first_order_id + size, dtype=np.int64)
+    stores = STORE_LOCATIONS + [f'Store {i}' for i in range(len(STORE_LOCATIONS), store_cardinality)]
+
+    data = pd.DataFrame({
+        'order_id': order_ids,
+        'customer_id': rng.integers(100, 100 + customer_cardinality, size=size),
+        'order_date': (np.datetime64('2023-01-01') + (order_ids - 1) % n_days).astype('datetime64[ns]'),
+        'product_id': rng.integers(1000, 1000 + product_cardinality, size=size),
+        'quantity': rng.integers(1, 10, size=size),
+        'price': np.round(rng.uniform(10, 500, size=size), 2),
+        'payment_method': rng.choice(PAYMENT_METHODS, size=size),
+        'store_location': rng.choice(stores[:store_cardinality], size=size)
+    })
+
+    if dirty_ratio:
+        dirty = rng.random(size) < dirty_ratio
+        data.loc[dirty, 'price'] = -data.loc[dirty, 'price']
+        data['payment_method'] = data['payment_method'].where(~dirty | (rng.random(size) < 0.5))
+
+    return data
+
+def generate_scaled_data(path: str, n_rows: int, n_files: int = 1, chunksize: int = 1_000_000,
+                         customer_cardinality: int = 400, product_cardinality: int = 1000,
+                         store_cardinality: int = 5, n_days: int = 1096, dirty_ratio: float = 0.0,
+                         formats: tuple[str, ...] = ('csv', 'json', 'parquet'), seed: int = 42) -> dict[str, int]:
+    """
+    Gera dados fictícios de vendas em escala, escrevendo-os em blocos.
+
+    Diferente de `generate_data`, o volume e o formato dos dados são parametrizados, e os dados são
+    gerados e gravados em blocos de no máximo `chunksize` linhas, de modo que o conjunto completo
+    nunca fica em memória (inclusive com centenas de milhões de linhas). Cada formato recebe as
+    mesmas `n_rows` linhas, divididas em `n_files` arquivos `vendas_ficticias_<n>.<formato>`; os
+    tamanhos dos arquivos diferem em no máximo uma linha.
+
+    Com `dirty_ratio` maior que zero, essa fração das linhas recebe um 'price' negativo e, em
+    metade delas, um 'payment_method' nulo, valores que a validação deve rejeitar.
+
+    Parameters:
+        path (str): Caminho da pasta onde os arquivos serão salvos.
+        n_rows (int): Número de linhas por formato.
+        n_files (int): Número de arquivos por formato. Padrão: 1.
+        chunksize (int): Número máximo de linhas geradas e gravadas por vez. Padrão: 1_000_000.
+        customer_cardinality (int): Número de clientes distintos. Padrão: 400.
+        product_cardinality (int): Número de produtos distintos. Padrão: 1000.
+        store_cardinality (int): Número de lojas distintas. Padrão: 5.
+        n_days (int): Número de dias distintos em 'order_date', a partir de 01/01/2023. Padrão: 1096.
+        dirty_ratio (float): Fração das linhas com valores inválidos. Padrão: 0.0.
+        formats (tuple[str, ...]): Formatos gravados: 'csv', 'json' e/ou 'parquet'.
+            Padrão: ('csv', 'json', 'parquet').
+        seed (int): Semente do gerador de números aleatórios. Padrão: 42.
+
+    Returns:
+        dict[str, int]: Número de linhas inválidas geradas por formato (igual em todos os formatos).
+
+    Raises:
+        ValueError: Se algum parâmetro numérico estiver fora do intervalo válido, se houver mais
+            arquivos do que linhas ou se algum formato não for suportado.
+    """
+    if n_rows < 1 or n_files < 1 or chunksize < 1:
+        raise ValueError('O número de linhas, de arquivos e o tamanho do bloco devem ser maiores que zero.')
+    if n_files > n_rows:
+        raise ValueError(f'O número de arquivos ({n_files}) não pode ser maior que o de linhas ({n_rows}).')
+    if not 0 <= dirty_ratio <= 1:
+        raise ValueError(f'A fração de linhas inválidas deve estar entre 0 e 1, mas recebeu {dirty_ratio}.')
+    unsupported = [file_format for file_format in formats if file_format not in ('csv', 'json', 'parquet')]
+    if unsupported:
+        raise ValueError(f'Formatos não suportados: {unsupported}')
+
+    os.makedirs(path, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    rows_per_file, extra_rows = divmod(n_rows, n_files)
+    dirty_rows = 0
+    next_order_id = 1
+
+    for file_number in range(n_files):
+        file_rows = rows_per_file + (file_number < extra_rows)
+        paths = {file_format: os.path.join(path, f'vendas_ficticias_{file_number:04d}.{file_format}')
+                 for file_format in formats}
+        for file_path in paths.values():
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+        written = 0
+        while written < file_rows:
+            size = min(chunksize, file_rows - written)
+            chunk = _generate_chunk(rng, next_order_id, size, customer_cardinality, product_cardinality,
+                                    store_cardinality, n_days, dirty_ratio)
+            dirty_rows += int((chunk['price'] < 0).sum())
+
+            if 'csv' in paths:
+                chunk.to_csv(paths['csv'], mode='a', header=written == 0, index=False)
+            if 'json' in paths:
+                with open(paths['json'], 'a', encoding='utf-8') as file:
+                    chunk.to_json(file, orient='records', lines=True)
+            if 'parquet' in paths:
+                fastparquet.write(paths['parquet'], chunk, write_index=False, append=written > 0)
+
+            written += size
+            next_order_id += size
+
+    return {file_format: dirty_rows for file_format in formats}
+
 if __name__ == '__main__':
-    output_path: str = './data/raw/'
-    generate_data(output_path)
+    parser = argparse.ArgumentParser(description='Gera dados fictícios de vendas.')
+    parser.add_argument('--path', default='./data/raw/', help='Pasta onde os arquivos serão salvos.')
+    parser.add_argument('--rows', type=int, default=None,
+                        help='Número de linhas por formato. Se omitido, gera os 1000 registros padrão.')
+    parser.add_argument('--files', type=int, default=1, help='Número de arquivos por formato.')
+    parser.add_argument('--chunksize', type=int, default=1_000_000, help='Linhas gravadas por bloco.')
+    parser.add_argument('--customers', type=int, default=400, help='Número de clientes distintos.')
+    parser.add_argument('--products', type=int, default=1000, help='Número de produtos distintos.')
+    parser.add_argument('--stores', type=int, default=5, help='Número de lojas distintas.')
+    parser.add_argument('--dirty-ratio', type=float, default=0.0, help='Fração das linhas com valores inválidos.')
+    args = parser.parse_args()
+
+    if args.rows is None:
+        generate_data(args.path)
+    else:
+        generate_scaled_data(args.path, args.rows, n_files = args.files, chunksize = args.chunksize,
+                             customer_cardinality = args.customers, product_cardinality = args.products,
+                             store_cardinality = args.stores, dirty_ratio = args.dirty_ratio)
+        print('Arquivos criados com sucesso!')
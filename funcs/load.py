@@ -1,18 +1,348 @@
+import asyncio
+import atexit
+import contextlib
+import csv
+import io
 import os
+import threading
+from typing import Iterable
 from urllib.parse import quote_plus
 
 import pandas as pd  # type: ignore
 from dotenv import load_dotenv  # type: ignore
 from loguru import logger  # type: ignore
-from sqlalchemy import create_engine, text  # type: ignore
+from sqlalchemy import create_engine, inspect, text  # type: ignore
+from sqlalchemy.engine import Connection, Engine  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncConnection  # type: ignore
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from decorators.decorators import log_decorator, time_decorador
+from decorators.decorators import (log_decorator, profile_decorator,
+                                   time_decorador)
 
 load_dotenv()
 
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
+
+def copy_insert(table, conn: Connection, keys: list[str], data_iter: Iterable[tuple]) -> None:
+    """
+    Insere um lote de linhas em uma tabela PostgreSQL usando `COPY FROM STDIN` no formato CSV.
+
+    Esta função segue a assinatura do parâmetro `method` de `pd.DataFrame.to_sql`, que a chama uma
+    vez por lote de `chunksize` linhas. O lote é serializado em CSV em memória e enviado ao banco
+    em um único comando `COPY`, evitando um `INSERT` por linha.
+
+    Parameters:
+        table : pandas.io.sql.SQLTable
+            Tabela de destino, fornecida pelo pandas.
+        conn : sqlalchemy.engine.Connection
+            Conexão SQLAlchemy com o banco de dados PostgreSQL.
+        keys : list[str]
+            Nomes das colunas, na ordem dos valores de cada linha.
+        data_iter : Iterable[tuple]
+            Linhas do lote a serem inseridas.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV)', buffer)
+
+async def copy_insert_async(conn: AsyncConnection, table_name: str, data: pd.DataFrame) -> None:
+    """
+    Insere um DataFrame em uma tabela PostgreSQL usando o `COPY` binário do asyncpg.
+
+    Equivalente assíncrono de `copy_insert`: as linhas são enviadas em um único comando `COPY` por
+    `copy_records_to_table`, na conexão asyncpg subjacente à conexão SQLAlchemy, evitando um
+    `INSERT` por linha. Os valores nulos (`NaN`, `NaT`) são enviados como `NULL`.
+
+    Parameters:
+        conn : AsyncConnection
+            Conexão SQLAlchemy assíncrona com o banco de dados PostgreSQL (driver asyncpg).
+        table_name : str
+            Nome da tabela de destino, que já deve existir.
+        data : pd.DataFrame
+            Linhas a serem inseridas, com as colunas na ordem da tabela.
+    """
+    raw_connection = await conn.get_raw_connection()
+    records = data.astype(object).where(data.notna(), None).itertuples(index=False, name=None)
+    await raw_connection.driver_connection.copy_records_to_table(
+        table_name, records=list(records), columns=list(data.columns)
+    )
+
+def _connection_url_from_env(driver: str) -> str:
+    """
+    Monta a URL de conexão com o banco PostgreSQL a partir das variáveis de ambiente `DB_*`.
+
+    Parameters:
+        driver : str
+            Driver SQLAlchemy do PostgreSQL, como 'psycopg2' ou 'asyncpg'.
+
+    Returns:
+        str
+            URL de conexão.
+
+    Raises:
+        ValueError:
+            Levantada se qualquer uma das variáveis de ambiente necessárias estiver ausente.
+    """
+    db_username = quote_plus(os.getenv('DB_USERNAME'))
+    db_password = quote_plus(os.getenv('DB_PASSWORD'))
+    db_hostname = os.getenv('DB_HOSTNAME')
+    db_port = os.getenv('DB_PORT')
+    db_name = os.getenv('DB_NAME')
+
+    if not all([db_username, db_password, db_hostname, db_port, db_name]):
+        logger.error("Algumas variáveis de ambiente estão ausentes.")
+        raise ValueError("Variáveis de ambiente necessárias para a conexão ao banco de dados não foram encontradas.")
+
+    return f"postgresql+{driver}://{db_username}:{db_password}@{db_hostname}:{db_port}/{db_name}"
+
+def create_engine_from_env() -> Engine:
+    """
+    Cria uma engine SQLAlchemy para o banco PostgreSQL a partir das variáveis de ambiente `DB_*`.
+
+    Além das credenciais, o pool de conexões pode ser configurado pelas variáveis opcionais
+    `DB_POOL_SIZE` (padrão: 5), `DB_MAX_OVERFLOW` (padrão: 10), `DB_POOL_RECYCLE` (em segundos,
+    padrão: 1800) e `DB_POOL_PRE_PING` (padrão: 'true').
+
+    Returns:
+        Engine
+            Engine conectada ao banco de dados configurado.
+
+    Raises:
+        ValueError:
+            Levantada se qualquer uma das variáveis de ambiente necessárias estiver ausente.
+    """
+    return create_engine(
+        _connection_url_from_env('psycopg2'),
+        connect_args={'client_encoding': 'utf8'},
+        pool_size=int(os.getenv('DB_POOL_SIZE') or 5),
+        max_overflow=int(os.getenv('DB_MAX_OVERFLOW') or 10),
+        pool_recycle=int(os.getenv('DB_POOL_RECYCLE') or 1800),
+        pool_pre_ping=(os.getenv('DB_POOL_PRE_PING') or 'true').lower() == 'true'
+    )
+
+def create_async_engine_from_env(pool_size: int = 4) -> AsyncEngine:
+    """
+    Cria uma engine assíncrona (driver `asyncpg`) para o banco PostgreSQL a partir das variáveis `DB_*`.
+
+    Diferente de `get_engine`, a engine não é compartilhada: suas conexões ficam presas ao laço de
+    eventos em que foram abertas, e cada chamada de `asyncio.run` cria um laço novo.
+
+    Parameters:
+        pool_size : int
+            Número de conexões do pool, normalmente igual à concorrência da carga. Padrão: 4.
+
+    Returns:
+        AsyncEngine
+            Engine assíncrona conectada ao banco de dados configurado.
+
+    Raises:
+        ValueError:
+            Levantada se qualquer uma das variáveis de ambiente necessárias estiver ausente.
+    """
+    return create_async_engine(
+        _connection_url_from_env('asyncpg'),
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_recycle=int(os.getenv('DB_POOL_RECYCLE') or 1800),
+        pool_pre_ping=(os.getenv('DB_POOL_PRE_PING') or 'true').lower() == 'true'
+    )
+
+def get_engine() -> Engine:
+    """
+    Retorna a engine compartilhada do processo, criando-a na primeira chamada.
+
+    A engine (e seu pool de conexões) é reutilizada por todas as cargas do processo, evitando
+    abrir um novo pool e refazer o handshake com o banco a cada chamada de `load_data`. Ela é
+    descartada automaticamente ao final do processo.
+
+    Returns:
+        Engine
+            Engine compartilhada.
+
+    Raises:
+        ValueError:
+            Levantada se qualquer uma das variáveis de ambiente necessárias estiver ausente.
+    """
+    global _engine
+
+    with _engine_lock:
+        if _engine is None:
+            _engine = create_engine_from_env()
+        return _engine
+
+@atexit.register
+def dispose_engine() -> None:
+    """
+    Fecha todas as conexões do pool da engine compartilhada e a descarta.
+
+    É executada automaticamente ao final do processo e pode ser chamada manualmente, por exemplo,
+    após alterar as variáveis de ambiente de conexão.
+    """
+    global _engine
+
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+            _engine = None
+
+def _write_frame(data: pd.DataFrame, table_name: str, connectable: Engine | Connection, bulk: bool,
+                 batch_size: int, if_exists: str = 'replace') -> None:
+    """
+    Grava um DataFrame em uma tabela, substituindo-a ou acrescentando linhas, com ou sem a carga em lotes.
+
+    Parameters:
+        data : pd.DataFrame
+            O DataFrame a ser gravado.
+        table_name : str
+            Nome da tabela de destino.
+        connectable : Engine | Connection
+            Engine ou conexão SQLAlchemy usada na gravação.
+        bulk : bool
+            Se True, grava em lotes de `batch_size` linhas, usando `COPY` no PostgreSQL.
+        batch_size : int
+            Número máximo de linhas por lote no modo `bulk`.
+        if_exists : str
+            Comportamento do `to_sql` se a tabela já existir: 'replace' ou 'append'. Padrão: 'replace'.
+    """
+    if bulk:
+        method = copy_insert if connectable.dialect.name == 'postgresql' else None
+        data.to_sql(table_name, connectable, if_exists=if_exists, index=False, method=method, chunksize=batch_size)
+    else:
+        data.to_sql(table_name, connectable, if_exists=if_exists, index=False)
+
+def _upsert_frame(data: pd.DataFrame, table_name: str, engine: Engine, key_columns: list[str], bulk: bool,
+                  batch_size: int) -> None:
+    """
+    Mescla um DataFrame em uma tabela existente com `INSERT ... ON CONFLICT DO UPDATE`.
+
+    Os dados são gravados em uma tabela temporária de staging e mesclados na tabela de destino dentro
+    de uma única transação. Apenas linhas novas ou com valores diferentes são escritas; linhas da
+    tabela de destino ausentes no DataFrame são mantidas. Se a tabela de destino não existir, ela é
+    criada com um índice único sobre `key_columns`.
+
+    A tabela de staging é temporária e, portanto, visível apenas para a conexão da carga: cargas
+    simultâneas na mesma tabela não disputam o mesmo nome. No PostgreSQL, ela é criada com
+    `ON COMMIT DROP` e removida pelo próprio banco ao final da transação, mesmo que o processo falhe.
+
+    Parameters:
+        data : pd.DataFrame
+            O DataFrame a ser mesclado.
+        table_name : str
+            Nome da tabela de destino.
+        engine : Engine
+            Engine SQLAlchemy de destino.
+        key_columns : list[str]
+            Colunas que identificam unicamente cada linha.
+        bulk : bool
+            Se True, grava a tabela de staging em lotes.
+        batch_size : int
+            Número máximo de linhas por lote no modo `bulk`.
+    """
+    with engine.begin() as conn:
+        quote = conn.dialect.identifier_preparer.quote
+        staging_table = f'{table_name}_staging'
+
+        if not inspect(conn).has_table(table_name):
+            data.head(0).to_sql(table_name, conn, index=False)
+
+        keys = ', '.join(quote(column) for column in key_columns)
+        conn.execute(text(
+            f'CREATE UNIQUE INDEX IF NOT EXISTS {quote(f"{table_name}_key")} ON {quote(table_name)} ({keys})'
+        ))
+
+        columns = ', '.join(quote(column) for column in data.columns)
+        on_commit = ' ON COMMIT DROP' if conn.dialect.name == 'postgresql' else ''
+        conn.execute(text(
+            f'CREATE TEMPORARY TABLE {quote(staging_table)}{on_commit} AS '
+            f'SELECT {columns} FROM {quote(table_name)} WHERE false'
+        ))
+        _write_frame(data, staging_table, conn, bulk, batch_size, if_exists = 'append')
+
+        value_columns = [column for column in data.columns if column not in key_columns]
+        if value_columns:
+            updates = ', '.join(f'{quote(column)} = excluded.{quote(column)}' for column in value_columns)
+            changed = ' OR '.join(
+                f'{quote(table_name)}.{quote(column)} IS DISTINCT FROM excluded.{quote(column)}'
+                for column in value_columns
+            )
+            conflict_action = f'DO UPDATE SET {updates} WHERE {changed}'
+        else:
+            conflict_action = 'DO NOTHING'
+
+        conn.execute(text(
+            f'INSERT INTO {quote(table_name)} ({columns}) '
+            f'SELECT {columns} FROM {quote(staging_table)} WHERE true '
+            f'ON CONFLICT ({keys}) {conflict_action}'
+        ))
+        if not on_commit:
+            conn.execute(text(f'DROP TABLE {quote(staging_table)}'))
+
+def _publish_table(conn: Connection, new_table: str, table_name: str) -> None:
+    """
+    Publica uma tabela já carregada no lugar da tabela de destino, trocando os nomes.
+
+    Deve ser chamada dentro de uma transação: a tabela atual é renomeada, a nova assume o nome de
+    destino e a antiga é removida, de modo que os leitores veem a versão anterior ou a nova, nunca
+    uma tabela vazia ou ausente.
+
+    Parameters:
+        conn : Connection
+            Conexão SQLAlchemy com uma transação aberta.
+        new_table : str
+            Nome da tabela já carregada.
+        table_name : str
+            Nome da tabela de destino.
+    """
+    quote = conn.dialect.identifier_preparer.quote
+    old_table = f'{table_name}_old'
+
+    conn.execute(text(f'DROP TABLE IF EXISTS {quote(old_table)}'))
+    if inspect(conn).has_table(table_name):
+        conn.execute(text(f'ALTER TABLE {quote(table_name)} RENAME TO {quote(old_table)}'))
+    conn.execute(text(f'ALTER TABLE {quote(new_table)} RENAME TO {quote(table_name)}'))
+    conn.execute(text(f'DROP TABLE IF EXISTS {quote(old_table)}'))
+
+def _swap_frame(data: pd.DataFrame, table_name: str, engine: Engine, bulk: bool, batch_size: int) -> None:
+    """
+    Substitui uma tabela de forma atômica, gravando os dados em uma tabela nova e trocando os nomes.
+
+    A tabela nova é preenchida fora da transação de publicação; em seguida, a tabela atual é
+    renomeada, a nova assume o nome de destino e a antiga é removida, tudo em uma única transação.
+    Assim, os leitores nunca encontram a tabela vazia, ausente ou parcialmente carregada.
+
+    Parameters:
+        data : pd.DataFrame
+            O DataFrame a ser publicado.
+        table_name : str
+            Nome da tabela de destino.
+        engine : Engine
+            Engine SQLAlchemy de destino.
+        bulk : bool
+            Se True, grava a tabela nova em lotes.
+        batch_size : int
+            Número máximo de linhas por lote no modo `bulk`.
+    """
+    new_table = f'{table_name}_new'
+
+    with engine.begin() as conn:
+        _write_frame(data, new_table, conn, bulk, batch_size)
+
+    with engine.begin() as conn:
+        _publish_table(conn, new_table, table_name)
+
 @time_decorador
 @log_decorator
-def load_data(data: pd.DataFrame) -> None:
+@profile_decorator
+def load_data(data: pd.DataFrame, bulk: bool = False, batch_size: int = 10_000, engine: Engine | None = None,
+              mode: str = 'replace', key_columns: list[str] | None = None,
+              table_name: str = 'sales_consolidated') -> None:
     """
     Carrega um DataFrame em uma tabela PostgreSQL chamada 'sales_consolidated' no Render.
 
@@ -21,13 +351,41 @@ def load_data(data: pd.DataFrame) -> None:
     os dados do DataFrame fornecido serão carregados na tabela 'sales_consolidated'. Caso a tabela
     já exista, ela será substituída.
 
+    Com `bulk=True`, os dados são enviados em lotes de `batch_size` linhas. Em bancos PostgreSQL,
+    cada lote é transmitido com `COPY FROM STDIN` (ver `copy_insert`); nos demais bancos, como o
+    SQLite, cada lote é inserido com `executemany`.
+
+    O parâmetro `mode` define como a tabela existente é tratada:
+
+    - 'replace': a tabela é removida e recriada (comportamento padrão).
+    - 'upsert': as linhas são mescladas por `key_columns` com `INSERT ... ON CONFLICT DO UPDATE`,
+      em uma única transação, escrevendo apenas as linhas novas ou alteradas.
+    - 'swap': os dados são gravados em uma tabela nova, publicada por uma troca atômica de nomes.
+    - 'append': as linhas são acrescentadas à tabela existente (criada, se necessário), como na
+      carga dos blocos brutos da pipeline em estágios.
+
     Parameters:
         data : pd.DataFrame
             O DataFrame contendo os dados que serão carregados no banco de dados.
+        bulk : bool
+            Se True, usa a carga em lotes descrita acima. Padrão: False.
+        batch_size : int
+            Número máximo de linhas por lote no modo `bulk`. Padrão: 10_000.
+        engine : Engine | None
+            Engine SQLAlchemy de destino. Se None, usa a engine compartilhada do processo
+            (ver `get_engine`). Padrão: None.
+        mode : str
+            Modo de carga: 'replace', 'upsert', 'swap' ou 'append'. Padrão: 'replace'.
+        key_columns : list[str] | None
+            Colunas-chave usadas no modo 'upsert'. Padrão: ['payment_method'].
+        table_name : str
+            Nome da tabela de destino, usado para carregar outras saídas da pipeline (como o cubo
+            de `rollup_cube`) ao lado de 'sales_consolidated'. Padrão: 'sales_consolidated'.
 
     Exceptions:
         ValueError:
-            Levantada se qualquer uma das variáveis de ambiente necessárias estiver ausente.
+            Levantada se qualquer uma das variáveis de ambiente necessárias estiver ausente, se o
+            modo de carga for inválido ou se `batch_size` for menor que 1.
         Exception:
             Levantada para qualquer erro ocorrido durante o processo de conexão ou inserção de dados no banco de dados,
             com um log detalhado do erro.
@@ -41,24 +399,163 @@ def load_data(data: pd.DataFrame) -> None:
         None
             A função não retorna nada, mas levanta exceções em caso de erro.
     """
-    db_username = quote_plus(os.getenv('DB_USERNAME'))
-    db_password = quote_plus(os.getenv('DB_PASSWORD'))
-    db_hostname = os.getenv('DB_HOSTNAME')
-    db_port = os.getenv('DB_PORT')
-    db_name = os.getenv('DB_NAME')
-
     try:
-        if not all([db_username, db_password, db_hostname, db_port, db_name]):
-            logger.error("Algumas variáveis de ambiente estão ausentes.")
-            raise ValueError("Variáveis de ambiente necessárias para a conexão ao banco de dados não foram encontradas.")
+        if mode not in ('replace', 'upsert', 'swap', 'append'):
+            raise ValueError(f"Modo de carga '{mode}' inválido. Use 'replace', 'upsert', 'swap' ou 'append'.")
+        if bulk and batch_size < 1:
+            raise ValueError(f"O tamanho do lote deve ser maior que zero, mas recebeu {batch_size}.")
 
-        connection_url = f"postgresql+psycopg2://{db_username}:{db_password}@{db_hostname}:{db_port}/{db_name}"
+        if engine is None:
+            engine = get_engine()
 
-        engine = create_engine(connection_url, connect_args={'client_encoding': 'utf8'})
-
-        data.to_sql('sales_consolidated', engine, if_exists='replace', index=False)
+        if mode == 'upsert':
+            _upsert_frame(data, table_name, engine, key_columns or ['payment_method'], bulk, batch_size)
+        elif mode == 'swap':
+            _swap_frame(data, table_name, engine, bulk, batch_size)
+        elif mode == 'append':
+            _write_frame(data, table_name, engine, bulk, batch_size, if_exists = 'append')
+        else:
+            _write_frame(data, table_name, engine, bulk, batch_size)
         logger.info("Tabela criada e dados carregados com sucesso!")
 
     except Exception as e:
         logger.error(f'Erro: {e}')
         raise
+
+async def load_data_async(data: pd.DataFrame, engine: AsyncEngine, table_name: str = 'sales_consolidated',
+                          mode: str = 'swap', partition_size: int = 50_000, max_concurrency: int = 4) -> None:
+    """
+    Carrega um DataFrame dividindo-o em partições gravadas ao mesmo tempo por várias conexões.
+
+    A tabela é criada com os tipos do DataFrame (como em `load_data`) e cada partição de
+    `partition_size` linhas é inserida em sua própria transação, por uma conexão do pool da engine
+    assíncrona. No máximo `max_concurrency` partições são gravadas ao mesmo tempo (`asyncio.Semaphore`),
+    de modo que a espera de uma conexão pelo banco é sobreposta ao envio das demais. No PostgreSQL
+    com o driver asyncpg, cada partição é enviada em um único comando `COPY` (ver `copy_insert_async`);
+    nos demais bancos, como o SQLite usado nos testes, as partições são inseridas com `to_sql`.
+
+    O parâmetro `mode` define como a tabela existente é tratada:
+
+    - 'swap': as partições são gravadas em uma tabela nova, publicada ao final por uma troca atômica
+      de nomes (ver `_publish_table`). Se alguma partição falhar, a tabela atual não é alterada.
+    - 'replace': a tabela é recriada e as partições são gravadas diretamente nela.
+    - 'append': as partições são acrescentadas à tabela existente (criada, se necessário).
+
+    Parameters:
+        data : pd.DataFrame
+            O DataFrame a ser carregado.
+        engine : AsyncEngine
+            Engine assíncrona de destino, como a de `create_async_engine_from_env` ou uma engine
+            `sqlite+aiosqlite` em testes. O pool deve ter ao menos `max_concurrency` conexões.
+        table_name : str
+            Nome da tabela de destino. Padrão: 'sales_consolidated'.
+        mode : str
+            Modo de carga: 'swap', 'replace' ou 'append'. Padrão: 'swap'.
+        partition_size : int
+            Número máximo de linhas por partição. Padrão: 50_000.
+        max_concurrency : int
+            Número máximo de partições gravadas ao mesmo tempo. Padrão: 4.
+
+    Raises:
+        ValueError:
+            Levantada se o modo de carga for inválido ou se `partition_size` ou `max_concurrency`
+            for menor que 1.
+        Exception:
+            Levantada para qualquer erro ocorrido na gravação de alguma partição ou na publicação.
+    """
+    if mode not in ('swap', 'replace', 'append'):
+        raise ValueError(f"Modo de carga '{mode}' inválido. Use 'swap', 'replace' ou 'append'.")
+    if partition_size < 1 or max_concurrency < 1:
+        raise ValueError('O tamanho das partições e a concorrência devem ser maiores que zero.')
+
+    target_table = f'{table_name}_new' if mode == 'swap' else table_name
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    use_copy = engine.dialect.name == 'postgresql' and engine.dialect.driver == 'asyncpg'
+
+    async def write_partition(partition: pd.DataFrame) -> None:
+        async with semaphore:
+            async with engine.begin() as conn:
+                if use_copy:
+                    await copy_insert_async(conn, target_table, partition)
+                else:
+                    await conn.run_sync(
+                        lambda sync_conn: partition.to_sql(target_table, sync_conn, if_exists='append', index=False)
+                    )
+
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: data.head(0).to_sql(
+                target_table, sync_conn, if_exists='append' if mode == 'append' else 'replace', index=False
+            ))
+
+        tasks = [
+            asyncio.create_task(write_partition(data.iloc[start:start + partition_size]))
+            for start in range(0, len(data), partition_size)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        if mode == 'swap':
+            async with engine.begin() as conn:
+                await conn.run_sync(_publish_table, target_table, table_name)
+        logger.info(f"Tabela '{table_name}' carregada em {len(tasks)} partição(ões) com sucesso!")
+
+    except Exception as e:
+        logger.error(f'Erro: {e}')
+        if mode == 'swap':
+            with contextlib.suppress(Exception):
+                async with engine.begin() as conn:
+                    quote = conn.dialect.identifier_preparer.quote
+                    await conn.execute(text(f'DROP TABLE IF EXISTS {quote(target_table)}'))
+        raise
+
+@time_decorador
+@log_decorator
+def load_data_concurrent(data: pd.DataFrame, database_url: str | None = None,
+                         table_name: str = 'sales_consolidated', mode: str = 'swap',
+                         partition_size: int = 50_000, max_concurrency: int = 4) -> None:
+    """
+    Executa `load_data_async` em um laço de eventos próprio, para uso em código síncrono.
+
+    A engine assíncrona é criada e descartada dentro do laço de eventos, com um pool de
+    `max_concurrency` conexões.
+
+    Parameters:
+        data : pd.DataFrame
+            O DataFrame a ser carregado.
+        database_url : str | None
+            URL SQLAlchemy com um driver assíncrono (ex.: 'sqlite+aiosqlite:///vendas.db'). Se None,
+            usa o PostgreSQL das variáveis de ambiente (ver `create_async_engine_from_env`). Padrão: None.
+        table_name : str
+            Nome da tabela de destino. Padrão: 'sales_consolidated'.
+        mode : str
+            Modo de carga: 'swap', 'replace' ou 'append'. Padrão: 'swap'.
+        partition_size : int
+            Número máximo de linhas por partição. Padrão: 50_000.
+        max_concurrency : int
+            Número máximo de partições gravadas ao mesmo tempo. Padrão: 4.
+
+    Raises:
+        ValueError:
+            Levantada se as variáveis de ambiente estiverem ausentes ou se algum parâmetro for inválido.
+        Exception:
+            Levantada para qualquer erro ocorrido durante a carga.
+    """
+    async def run() -> None:
+        if database_url is None:
+            engine = create_async_engine_from_env(max_concurrency)
+        else:
+            engine = create_async_engine(database_url, pool_size=max_concurrency, max_overflow=0)
+        try:
+            await load_data_async(data, engine, table_name = table_name, mode = mode,
+                                  partition_size = partition_size, max_concurrency = max_concurrency)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
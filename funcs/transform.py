@@ -1,11 +1,47 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterable
+
 import pandas as pd  # type: ignore
 
-from decorators.decorators import log_decorator, time_decorador
+from classes.data_extractor import FILE_EXTENSIONS, DataExtractor
+from classes.file_manifest import FileManifest
+from classes.multi_aggregator import MultiAggregator
+from classes.sketches import HyperLogLog, TDigest
+from decorators.decorators import (log_decorator, profile_decorator,
+                                   time_decorador)
+
+try:
+    import pyarrow  # type: ignore
+except ImportError:  # pragma: no cover - dependência opcional
+    pyarrow = None
+
+TRANSFORM_COLUMNS: list[str] = ['payment_method', 'price']
+SKETCH_COLUMNS: list[str] = ['customer_id_hll', 'price_tdigest']
+PRICE_QUANTILES: dict[str, float] = {'price_p50': 0.5, 'price_p95': 0.95, 'price_p99': 0.99}
+
+REPORT_AGGREGATIONS: dict[str, dict] = {
+    'revenue_by_store': {'by': ['store_location'], 'measures': {'revenue': ['sum']}},
+    'quantity_by_product': {'by': ['product_id'], 'measures': {'quantity': ['sum', 'count']}},
+    'daily_totals': {'by': ['order_date'], 'measures': {'price': ['sum', 'count', 'mean', 'min', 'max']}}
+}
+
+CUBE_DIMENSIONS: list[str] = ['payment_method', 'store_location']
+CUBE_COLUMNS: list[str] = ['order_date', *CUBE_DIMENSIONS, 'quantity', 'price']
+CUBE_SPEC: dict[str, dict] = {
+    'cube': {
+        'by': ['period_start', *CUBE_DIMENSIONS],
+        'measures': {'price': ['sum', 'count'], 'quantity': ['sum'], 'revenue': ['sum']}
+    }
+}
+CUBE_GRAINS: dict[str, str] = {'day': 'D', 'week': 'W', 'month': 'M'}
 
 
 @time_decorador
 @log_decorator
-def transform_data(data: pd.DataFrame) -> pd.DataFrame:
+@profile_decorator
+def transform_data(data: pd.DataFrame, sketches: bool = False) -> pd.DataFrame:
     """
     Transforma um DataFrame agrupando os valores de 'price' por 'payment_method'.
 
@@ -15,15 +51,23 @@ def transform_data(data: pd.DataFrame) -> pd.DataFrame:
     colunas: 'payment_method' e 'price', onde 'price' representa a soma total para cada
     método de pagamento.
 
+    Com `sketches=True`, o resultado também traz, para cada método de pagamento, os sketches
+    serializados de `SKETCH_COLUMNS` (HyperLogLog de 'customer_id' e t-digest de 'price'). Eles podem
+    ser combinados com `merge_partial_aggregates` e resumidos com `summarize_sketches`.
+
     Parameters:
         data : pd.DataFrame
-            DataFrame de entrada que deve conter as colunas 'payment_method' e 'price'.
+            DataFrame de entrada que deve conter as colunas 'payment_method' e 'price' (e
+            'customer_id', se `sketches=True`).
+        sketches : bool
+            Se True, inclui os sketches de clientes distintos e de quantis de preço. Padrão: False.
 
     Returns:
         pd.DataFrame
             DataFrame transformado com as colunas:
             - 'payment_method': Métodos de pagamento únicos.
             - 'price': Soma dos valores da coluna 'price' para cada método de pagamento.
+            - 'customer_id_hll' e 'price_tdigest': Sketches serializados, se `sketches=True`.
 
     Raises:
         KeyError: Se a coluna 'payment_method' ou 'price' não estiver presente no DataFrame.
@@ -48,11 +92,468 @@ def transform_data(data: pd.DataFrame) -> pd.DataFrame:
             print('Erro: Todos os valores de "price" são inválidos. Tente novamente.')
             return transform_data
 
-        transform_data = data.groupby('payment_method')['price'].sum().reset_index()
+        transform_data = data.groupby('payment_method', observed=True)['price'].sum().reset_index()
         transform_data.columns = ['payment_method', 'price']
 
+        if sketches:
+            transform_data = transform_data.merge(build_sketches(data), on='payment_method', how='left')
+
         return transform_data
 
     except Exception as e:
         print(f'Erro: {e} Tente novamente.')
         return transform_data
+
+def _aggregate_file(extractor: DataExtractor, file_path: str, file_format: str, sketches: bool) -> pd.DataFrame:
+    """
+    Lê, valida e agrega um único arquivo, retornando o seu resultado parcial.
+
+    Executada nos processos do pool de `transform_parallel`. Apenas o parcial, com uma linha por
+    método de pagamento, é serializado de volta ao processo principal.
+
+    Parameters:
+        extractor (DataExtractor): Extrator configurado com a projeção e os predicados da leitura.
+        file_path (str): Caminho do arquivo.
+        file_format (str): Formato do arquivo: 'csv', 'json' ou 'parquet'.
+        sketches (bool): Se True, inclui os sketches do arquivo no parcial.
+
+    Returns:
+        pd.DataFrame: Resultado parcial do arquivo, no formato de `aggregate_chunk`.
+    """
+    return aggregate_chunk(extractor.read_file(file_path, file_format), sketches = sketches)
+
+@time_decorador
+@log_decorator
+@profile_decorator
+def transform_parallel(data_path: str, max_workers: int | None = None, partitioned: bool = False,
+                       partition_filter: dict[str, list[str]] | None = None, validation: str = 'full',
+                       filters: list[tuple[str, str, Any]] | None = None, sketches: bool = False,
+                       parser_engine: str = 'c') -> pd.DataFrame:
+    """
+    Extrai e agrega os arquivos de entrada em um pool de processos, um arquivo por processo.
+
+    Versão paralela de `extract_and_consolidate` seguida de `transform_data`. Cada processo lê e
+    valida o seu próprio arquivo, apenas com as colunas necessárias, e calcula o parcial com
+    `aggregate_chunk`. Assim, a leitura, a validação e o agrupamento acontecem nos processos, e só
+    os parciais (uma linha por método de pagamento) voltam ao processo principal, onde são
+    combinados por `merge_partial_aggregates`. Como os parciais são combináveis, as linhas de um
+    mesmo método de pagamento não precisam ser redistribuídas entre os processos.
+
+    Sem `partitioned`, são lidos o único arquivo CSV, JSON e Parquet do diretório, como em
+    `extract_and_consolidate`. Com `partitioned=True`, todos os arquivos de cada formato, inclusive
+    em subdiretórios Hive, são distribuídos entre os processos. A deduplicação por 'order_id', que
+    exige comparar os arquivos entre si, não é aplicada.
+
+    Parameters:
+        data_path : str
+            Caminho do diretório onde os arquivos estão localizados.
+        max_workers : int | None
+            Número máximo de processos. Se None, usa o número de CPUs. Padrão: None.
+        partitioned : bool
+            Se True, lê todos os arquivos de cada formato, de forma recursiva. Padrão: False.
+        partition_filter : dict[str, list[str]] | None
+            Valores de partição aceitos no modo particionado. Padrão: None.
+        validation : str
+            Modo de validação do `DataExtractor`: 'full', 'fast' ou 'sample'. Padrão: 'full'.
+        filters : list[tuple[str, str, Any]] | None
+            Predicados `(coluna, operador, valor)` repassados aos leitores. Padrão: None.
+        sketches : bool
+            Se True, inclui os sketches de clientes distintos e de quantis de preço. Padrão: False.
+        parser_engine : str
+            Motor de leitura de CSV e JSON do `DataExtractor`: 'c' ou 'pyarrow'. Padrão: 'c'.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'payment_method' e 'price' (e os sketches, se solicitados),
+            ordenado por método de pagamento, no mesmo formato de `transform_data`.
+
+    Raises:
+        FileNotFoundError: Se algum dos arquivos CSV, JSON ou Parquet não for encontrado (ou, no modo
+            particionado, se nenhum arquivo for encontrado).
+        pandera.errors.SchemaError: Se algum dos arquivos não atender ao esquema de validação.
+        ValueError: Se `max_workers` for menor que 1.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError(f'O número de processos deve ser maior que zero, mas recebeu {max_workers}.')
+
+    columns = [*TRANSFORM_COLUMNS, 'customer_id'] if sketches else TRANSFORM_COLUMNS
+    extractor = DataExtractor(validation = validation, columns = columns, filters = filters,
+                              parser_engine = parser_engine)
+
+    files: list[tuple[str, str]] = []
+    for file_format, extension in FILE_EXTENSIONS.items():
+        if partitioned:
+            files.extend((file_path, file_format)
+                         for file_path, _ in extractor.select_files(data_path, file_format, partition_filter))
+            continue
+        found = glob.glob(os.path.join(extractor.validate_input_path(data_path), f'*{extension}'))
+        if len(found) != 1:
+            raise FileNotFoundError(
+                f"Esperado exatamente um arquivo {file_format.upper()} no diretório '{data_path}', mas encontrou {len(found)}."
+            )
+        files.append((found[0], file_format))
+
+    if not files:
+        raise FileNotFoundError(f"Nenhum arquivo CSV, JSON ou Parquet encontrado no diretório '{data_path}'.")
+
+    n_workers = min(max_workers, len(files))
+    if n_workers == 1:
+        return merge_partial_aggregates(_aggregate_file(extractor, file_path, file_format, sketches)
+                                        for file_path, file_format in files)
+
+    with ProcessPoolExecutor(max_workers = n_workers) as executor:
+        futures = [executor.submit(_aggregate_file, extractor, file_path, file_format, sketches)
+                   for file_path, file_format in files]
+        return merge_partial_aggregates(future.result() for future in futures)
+
+def build_sketches(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Constrói, para cada método de pagamento, os sketches de clientes distintos e de quantis de preço.
+
+    Parameters:
+        data : pd.DataFrame
+            DataFrame com as colunas 'payment_method', 'customer_id' e 'price'.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'payment_method', 'customer_id_hll' (HyperLogLog serializado)
+            e 'price_tdigest' (t-digest serializado).
+
+    Raises:
+        KeyError: Se alguma das colunas necessárias não estiver presente no DataFrame.
+    """
+    for column in ['payment_method', 'customer_id', 'price']:
+        if column not in data.columns:
+            raise KeyError(f"A coluna '{column}' não foi encontrada.")
+
+    prices = pd.to_numeric(data['price'], errors='coerce').to_numpy(dtype='float64')
+    records = []
+
+    for payment_method, positions in data.groupby('payment_method', observed=True).indices.items():
+        customers = HyperLogLog()
+        customers.add(data['customer_id'].to_numpy()[positions])
+        price_digest = TDigest()
+        price_digest.add(prices[positions])
+        records.append({
+            'payment_method': payment_method,
+            'customer_id_hll': customers.serialize(),
+            'price_tdigest': price_digest.serialize()
+        })
+
+    return pd.DataFrame(records, columns=['payment_method', *SKETCH_COLUMNS])
+
+def summarize_sketches(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Substitui os sketches serializados pelas estimativas de clientes distintos e de quantis de preço.
+
+    Parameters:
+        data : pd.DataFrame
+            DataFrame com as colunas de `SKETCH_COLUMNS`, como o retornado por `transform_data`
+            ou `merge_partial_aggregates`.
+
+    Returns:
+        pd.DataFrame
+            DataFrame sem as colunas de sketches e com as colunas 'unique_customers' (estimativa
+            arredondada de 'customer_id' distintos) e 'price_p50', 'price_p95' e 'price_p99'.
+    """
+    if data.empty:
+        return data
+
+    summary = data.drop(columns=SKETCH_COLUMNS)
+    customers = [HyperLogLog.deserialize(sketch) for sketch in data['customer_id_hll']]
+    price_digests = [TDigest.deserialize(sketch) for sketch in data['price_tdigest']]
+
+    summary['unique_customers'] = [round(sketch.estimate()) for sketch in customers]
+    for column, quantile in PRICE_QUANTILES.items():
+        summary[column] = [digest.quantile(quantile) for digest in price_digests]
+    return summary
+
+def merge_partial_aggregates(partials: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Combina resultados parciais de `transform_data` em um único total por método de pagamento.
+
+    Os parciais são somados um a um, de modo que apenas o total acumulado (uma linha por método
+    de pagamento) é mantido em memória. Se os parciais trazem as colunas de `SKETCH_COLUMNS`, os
+    sketches de cada método de pagamento também são combinados.
+
+    Parameters:
+        partials : Iterable[pd.DataFrame]
+            DataFrames com as colunas 'payment_method' e 'price', como os retornados por `transform_data`.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'payment_method' e 'price' (e os sketches combinados, se houver),
+            ordenado por método de pagamento. Se nenhum parcial for informado, um DataFrame vazio é retornado.
+    """
+    total: pd.Series | None = None
+    sketches: dict[str, tuple[HyperLogLog, TDigest]] = {}
+
+    for partial in partials:
+        if partial.empty:
+            continue
+        partial_sum = partial.set_index('payment_method')['price']
+        partial_sum.index = partial_sum.index.astype(object)
+        total = partial_sum if total is None else total.add(partial_sum, fill_value=0)
+
+        if all(column in partial.columns for column in SKETCH_COLUMNS):
+            for payment_method, customers, price_digest in zip(partial['payment_method'], partial['customer_id_hll'],
+                                                                partial['price_tdigest']):
+                customers, price_digest = HyperLogLog.deserialize(customers), TDigest.deserialize(price_digest)
+                if payment_method in sketches:
+                    sketches[payment_method][0].merge(customers)
+                    sketches[payment_method][1].merge(price_digest)
+                else:
+                    sketches[payment_method] = (customers, price_digest)
+
+    if total is None:
+        return pd.DataFrame()
+
+    merged = total.sort_index().reset_index()
+    merged.columns = ['payment_method', 'price']
+
+    if sketches:
+        merged['customer_id_hll'] = [sketches[method][0].serialize() for method in merged['payment_method']]
+        merged['price_tdigest'] = [sketches[method][1].serialize() for method in merged['payment_method']]
+    return merged
+
+def aggregate_chunk(chunk: pd.DataFrame, sketches: bool = False) -> pd.DataFrame:
+    """
+    Calcula o resultado parcial de um bloco: a soma de 'price' por 'payment_method'.
+
+    Os parciais de vários blocos são combinados com `merge_partial_aggregates`. A função não altera
+    o bloco recebido.
+
+    Parameters:
+        chunk : pd.DataFrame
+            Bloco que deve conter as colunas 'payment_method' e 'price'.
+        sketches : bool
+            Se True, inclui os sketches do bloco (ver `build_sketches`). Padrão: False.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'payment_method' e 'price' (e os sketches, se solicitados).
+
+    Raises:
+        KeyError: Se a coluna 'payment_method' ou 'price' não estiver presente no bloco.
+    """
+    if 'payment_method' not in chunk.columns:
+        raise KeyError("A coluna 'payment_method' não foi encontrada.")
+    if 'price' not in chunk.columns:
+        raise KeyError("A coluna 'price' não foi encontrada.")
+
+    prices = pd.to_numeric(chunk['price'], errors='coerce')
+    partial = prices.groupby(chunk['payment_method'], observed=True).sum().reset_index()
+    return partial.merge(build_sketches(chunk), on='payment_method', how='left') if sketches else partial
+
+@time_decorador
+@log_decorator
+def transform_chunks(chunks: Iterable[pd.DataFrame], sketches: bool = False) -> pd.DataFrame:
+    """
+    Agrupa os valores de 'price' por 'payment_method' a partir de blocos de dados.
+
+    Cada bloco é agregado individualmente com `aggregate_chunk` e o resultado parcial é somado ao
+    total acumulado, mantendo o uso de memória constante independentemente do volume de entrada.
+
+    Parameters:
+        chunks : Iterable[pd.DataFrame]
+            Blocos que devem conter as colunas 'payment_method' e 'price'.
+        sketches : bool
+            Se True, também constrói e combina os sketches de cada bloco (ver `transform_data`).
+            Padrão: False.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'payment_method' e 'price', no mesmo formato de `transform_data`.
+
+    Raises:
+        KeyError: Se a coluna 'payment_method' ou 'price' não estiver presente em algum bloco.
+    """
+    return merge_partial_aggregates(aggregate_chunk(chunk, sketches = sketches) for chunk in chunks)
+
+@time_decorador
+@log_decorator
+def transform_incremental(changed_data: dict[str, pd.DataFrame], manifest: FileManifest,
+                          sketches: bool = False) -> pd.DataFrame:
+    """
+    Atualiza os totais por método de pagamento a partir apenas dos arquivos alterados.
+
+    O resultado parcial de cada arquivo alterado é calculado com `aggregate_chunk` e registrado no
+    manifesto. Arquivos sem linhas (por exemplo, com todos os pedidos removidos pela deduplicação)
+    são registrados com um parcial vazio. Em seguida, os parciais de todos os arquivos registrados
+    são combinados, sem que os arquivos inalterados precisem ser lidos novamente.
+
+    Diferente de `transform_data`, `aggregate_chunk` não esconde as falhas: se a agregação de um
+    arquivo falhar, o erro é relançado e o arquivo não é registrado, de modo que ele é processado
+    novamente na próxima execução, em vez de ficar registrado com um parcial vazio.
+
+    Com `sketches=True`, os sketches serializados fazem parte do parcial de cada arquivo e são
+    combinados entre execuções, sem recalcular clientes distintos e quantis a partir das linhas.
+
+    Parameters:
+        changed_data : dict[str, pd.DataFrame]
+            DataFrames dos arquivos novos ou modificados, indexados pelo caminho do arquivo.
+        manifest : FileManifest
+            Manifesto onde os parciais são registrados.
+        sketches : bool
+            Se True, registra e combina os sketches de cada arquivo. Padrão: False.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'payment_method' e 'price', considerando todos os arquivos.
+
+    Raises:
+        KeyError: Se a coluna 'payment_method' ou 'price' não estiver presente em algum arquivo.
+        ValueError: Se `sketches=True` e algum arquivo do manifesto tiver sido registrado sem sketches.
+    """
+    for file_path, data in changed_data.items():
+        row_count = len(data)
+        partial = aggregate_chunk(data, sketches=sketches) if row_count else pd.DataFrame()
+        manifest.update(file_path, row_count, partial)
+
+    partials = manifest.partials()
+    if sketches and any(not partial.empty and SKETCH_COLUMNS[0] not in partial.columns for partial in partials):
+        raise ValueError('O manifesto possui arquivos registrados sem sketches. Remova-o para reprocessar todos os arquivos.')
+
+    return merge_partial_aggregates(partials)
+
+@time_decorador
+@log_decorator
+def transform_arrow_table(table: 'pyarrow.Table') -> pd.DataFrame:
+    """
+    Agrupa os valores de 'price' por 'payment_method' em uma tabela Arrow.
+
+    Versão Arrow de `transform_data`: a agregação é feita com os kernels de `pyarrow.compute`
+    (`Table.group_by(...).aggregate(...)`) e apenas o resultado, com uma linha por método de
+    pagamento, é convertido para pandas.
+
+    Parameters:
+        table : pyarrow.Table
+            Tabela de entrada que deve conter as colunas 'payment_method' e 'price'.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'payment_method' e 'price', no mesmo formato de `transform_data`.
+
+    Raises:
+        KeyError: Se a coluna 'payment_method' ou 'price' não estiver presente na tabela.
+    """
+    if 'payment_method' not in table.column_names:
+        raise KeyError("A coluna 'payment_method' não foi encontrada.")
+    if 'price' not in table.column_names:
+        raise KeyError("A coluna 'price' não foi encontrada.")
+
+    aggregated = table.group_by('payment_method').aggregate([('price', 'sum')]).sort_by('payment_method')
+
+    return pd.DataFrame({
+        'payment_method': aggregated.column('payment_method').to_pandas(),
+        'price': aggregated.column('price_sum').to_pandas()
+    })
+
+@time_decorador
+@log_decorator
+def transform_multi(data: pd.DataFrame | Iterable[pd.DataFrame],
+                    specs: dict[str, dict] | None = None) -> dict[str, pd.DataFrame]:
+    """
+    Calcula vários agregados em uma única passada sobre os dados consolidados ou sobre blocos deles.
+
+    Cada agregado é descrito por uma especificação declarativa (ver `MultiAggregator`), com as
+    chaves de agrupamento e as medidas desejadas ('sum', 'count', 'mean', 'min', 'max', além da
+    medida derivada 'revenue' = `quantity * price`).
+
+    Parameters:
+        data : pd.DataFrame | Iterable[pd.DataFrame]
+            DataFrame consolidado ou blocos de dados, como os retornados por `extract_chunks`.
+        specs : dict[str, dict] | None
+            Especificações indexadas pelo nome do agregado. Padrão: `REPORT_AGGREGATIONS`.
+
+    Returns:
+        dict[str, pd.DataFrame]
+            Um DataFrame por agregado, indexado pelo nome da especificação.
+
+    Raises:
+        KeyError: Se alguma coluna usada nas especificações não estiver presente nos dados.
+        ValueError: Se alguma especificação for inválida.
+    """
+    aggregator = MultiAggregator(specs or REPORT_AGGREGATIONS)
+
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    for chunk in chunks:
+        aggregator.update(chunk)
+
+    return aggregator.result()
+
+@time_decorador
+@log_decorator
+def build_daily_cube(data: pd.DataFrame | Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Constrói o cubo diário de vendas (dia × 'payment_method' × 'store_location').
+
+    Cada linha é associada ao dia de 'order_date' e as medidas aditivas (soma de 'price', número de
+    pedidos, soma de 'quantity' e receita) são calculadas em uma única passada com o `MultiAggregator`.
+    Como todas as medidas são aditivas, cubos diários de blocos diferentes podem ser combinados
+    por `rollup_cube` sem perda de precisão.
+
+    Parameters:
+        data : pd.DataFrame | Iterable[pd.DataFrame]
+            DataFrame consolidado ou blocos de dados com as colunas de `CUBE_COLUMNS`.
+
+    Returns:
+        pd.DataFrame
+            DataFrame com as colunas 'period_start', 'payment_method', 'store_location',
+            'price_sum', 'price_count', 'quantity_sum' e 'revenue_sum'.
+
+    Raises:
+        KeyError: Se alguma coluna de `CUBE_COLUMNS` não estiver presente nos dados.
+    """
+    aggregator = MultiAggregator(CUBE_SPEC)
+
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    for chunk in chunks:
+        if 'order_date' not in chunk.columns:
+            raise KeyError("A coluna 'order_date' não foi encontrada.")
+        aggregator.update(chunk.assign(period_start=pd.to_datetime(chunk['order_date']).dt.normalize()))
+
+    return aggregator.result()['cube']
+
+@time_decorador
+@log_decorator
+def rollup_cube(daily_cube: pd.DataFrame, grains: Iterable[str] = ('day', 'week', 'month')) -> pd.DataFrame:
+    """
+    Deriva as granularidades semanal e mensal a partir do cubo diário.
+
+    As granularidades mais grossas são obtidas somando as linhas do cubo diário, sem reler os dados
+    de origem. As semanas começam na segunda-feira e os meses no primeiro dia. Linhas repetidas de
+    um mesmo dia (por exemplo, cubos diários de blocos diferentes concatenados) também são somadas.
+
+    Parameters:
+        daily_cube : pd.DataFrame
+            Cubo diário, como o retornado por `build_daily_cube`.
+        grains : Iterable[str]
+            Granularidades desejadas, entre as chaves de `CUBE_GRAINS`. Padrão: ('day', 'week', 'month').
+
+    Returns:
+        pd.DataFrame
+            DataFrame com a coluna 'grain' seguida das colunas do cubo diário, ordenado por
+            granularidade, início do período e dimensões.
+
+    Raises:
+        ValueError: Se alguma granularidade não for suportada.
+    """
+    keys = ['period_start', *CUBE_DIMENSIONS]
+    measures = [column for column in daily_cube.columns if column not in keys]
+    frames: list[pd.DataFrame] = []
+
+    for grain in grains:
+        if grain not in CUBE_GRAINS:
+            raise ValueError(f"Granularidade '{grain}' inválida. Use uma de {list(CUBE_GRAINS)}.")
+
+        period_start = daily_cube['period_start'].dt.to_period(CUBE_GRAINS[grain]).dt.start_time
+        rolled = daily_cube.assign(period_start=period_start).groupby(keys, observed=True)[measures].sum()
+        frames.append(rolled.reset_index().assign(grain=grain))
+
+    if not frames:
+        return pd.DataFrame()
+
+    cube = pd.concat(frames, ignore_index=True)
+    return cube[['grain', *keys, *measures]]
@@ -0,0 +1,106 @@
+import threading
+
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from classes.dag import DagRunner
+
+
+def test_dag_runs_independent_nodes_concurrently():
+    """
+    Testa se nós independentes são executados ao mesmo tempo e se cada nó recebe os resultados
+    das suas dependências, na ordem declarada.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+
+    def extract(value: int) -> pd.DataFrame:
+        barrier.wait()
+        return pd.DataFrame({'value': [value]})
+
+    dag = DagRunner()
+    dag.add_node('left', lambda: extract(1))
+    dag.add_node('right', lambda: extract(2))
+    dag.add_node('concat', lambda left, right: pd.concat([left, right], ignore_index=True), depends_on=['left', 'right'])
+
+    assert dag.run()['concat']['value'].tolist() == [1, 2]
+
+def test_dag_resumes_from_checkpoints(tmp_path):
+    """
+    Testa se, após a falha de um nó, a próxima execução reaproveita os checkpoints dos nós
+    concluídos e executa apenas os nós restantes, removendo os checkpoints ao final.
+    """
+    calls = {'extract': 0, 'transform': 0, 'load': 0}
+    loaded: list[pd.DataFrame] = []
+
+    def extract() -> pd.DataFrame:
+        calls['extract'] += 1
+        return pd.DataFrame({'payment_method': ['Cash', 'Pix'], 'price': [10.0, 5.5]})
+
+    def transform(data: pd.DataFrame) -> pd.DataFrame:
+        calls['transform'] += 1
+        return data.assign(price=data['price'] * 2)
+
+    def load(data: pd.DataFrame) -> None:
+        calls['load'] += 1
+        if calls['load'] == 1:
+            raise ConnectionError('banco indisponível')
+        loaded.append(data)
+
+    def build_dag() -> DagRunner:
+        dag = DagRunner(checkpoint_dir=str(tmp_path))
+        dag.add_node('extract', extract)
+        dag.add_node('transform', transform, depends_on=['extract'])
+        dag.add_node('load', load, depends_on=['transform'])
+        return dag
+
+    with pytest.raises(ConnectionError):
+        build_dag().run()
+    build_dag().run()
+
+    assert calls == {'extract': 1, 'transform': 1, 'load': 2}
+    pd.testing.assert_frame_equal(
+        loaded[0], pd.DataFrame({'payment_method': ['Cash', 'Pix'], 'price': [20.0, 11.0]})
+    )
+    assert list(tmp_path.iterdir()) == []
+
+def test_dag_ignores_checkpoints_when_params_or_inputs_change(tmp_path):
+    """
+    Testa se, após uma falha, os checkpoints são descartados quando os parâmetros ou os arquivos de
+    entrada de um nó mudam, e se os nós que dependem dele também são executados novamente.
+    """
+    input_file = tmp_path / 'vendas.csv'
+    input_file.write_text('price\n10.0\n', encoding='utf-8')
+    calls = {'extract': 0, 'transform': 0}
+
+    def extract() -> pd.DataFrame:
+        calls['extract'] += 1
+        return pd.read_csv(input_file)
+
+    def transform(data: pd.DataFrame) -> pd.DataFrame:
+        calls['transform'] += 1
+        return data
+
+    def fail(data: pd.DataFrame) -> None:
+        raise ConnectionError('banco indisponível')
+
+    def build_dag(columns: list[str]) -> DagRunner:
+        dag = DagRunner(checkpoint_dir=str(tmp_path / 'checkpoints'))
+        dag.add_node('extract', extract, params={'columns': columns}, inputs=[str(tmp_path / '*.csv')])
+        dag.add_node('transform', transform, depends_on=['extract'])
+        dag.add_node('load', fail, depends_on=['transform'])
+        return dag
+
+    with pytest.raises(ConnectionError):
+        build_dag(['price']).run()
+    with pytest.raises(ConnectionError):
+        build_dag(['price']).run()
+    assert calls == {'extract': 1, 'transform': 1}
+
+    with pytest.raises(ConnectionError):
+        build_dag(['price', 'payment_method']).run()
+    assert calls == {'extract': 2, 'transform': 2}
+
+    input_file.write_text('price\n10.0\n20.0\n', encoding='utf-8')
+    with pytest.raises(ConnectionError):
+        build_dag(['price', 'payment_method']).run()
+    assert calls == {'extract': 3, 'transform': 3}
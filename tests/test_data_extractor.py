@@ -0,0 +1,246 @@
+import fastparquet  # type: ignore
+import pandas as pd  # type: ignore
+import pandera as pa  # type: ignore
+import pytest  # type: ignore
+
+from classes.data_extractor import DataExtractor
+
+
+@pytest.fixture
+def sales_data() -> pd.DataFrame:
+    """
+    Cria um DataFrame de vendas válido de acordo com o esquema da classe `DataExtractor`.
+
+    Returns:
+        pd.DataFrame: DataFrame com três vendas.
+    """
+    return pd.DataFrame({
+        'order_id': [1, 2, 3],
+        'customer_id': [202, 448, 370],
+        'order_date': ['2023-01-01', '2023-01-02', '2023-01-03'],
+        'product_id': [1484, 1027, 1713],
+        'quantity': [5, 4, 6],
+        'price': [99.68, 20.8, 362.8],
+        'payment_method': ['Cash', 'Debit Card', 'Credit Card'],
+        'store_location': ['Los Angeles', 'Houston', 'New York']
+    })
+
+@pytest.mark.parametrize('validation', ['fast', 'sample'])
+def test_fast_validation_matches_full_validation(sales_data, validation):
+    """
+    Testa se os modos de validação vetorizados ('fast' e 'sample') aceitam um DataFrame válido
+    e produzem o mesmo resultado da validação completa com Pandera.
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+        validation (str): Modo de validação testado.
+
+    Raises:
+        AssertionError: Se os DataFrames validados forem diferentes.
+    """
+    expected = DataExtractor().validate_dataframe(sales_data.copy())
+    result = DataExtractor(validation=validation, sample_size=2).validate_dataframe(sales_data.copy())
+
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_fast_validation_reports_invalid_rows(sales_data):
+    """
+    Testa se a validação vetorizada levanta um `SchemaError` listando as linhas inválidas
+    (valores não positivos ou nulos).
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se o erro não for levantado ou não listar as linhas esperadas.
+    """
+    sales_data.loc[0, 'price'] = -1.0
+    sales_data.loc[2, 'payment_method'] = None
+
+    with pytest.raises(pa.errors.SchemaError, match=r'2 linha\(s\) inválida\(s\)') as error:
+        DataExtractor(validation='fast').validate_dataframe(sales_data)
+
+    assert error.value.failure_cases.index.tolist() == [0, 2]
+
+def test_fast_validation_rejects_wrong_dtype(sales_data):
+    """
+    Testa se a validação vetorizada rejeita uma coluna com tipo diferente do esquema.
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se o `SchemaError` não for levantado.
+    """
+    sales_data['price'] = sales_data['price'].astype(str)
+
+    with pytest.raises(pa.errors.SchemaError, match="A coluna 'price' deveria ter o tipo float64"):
+        DataExtractor(validation='fast').validate_dataframe(sales_data)
+
+def test_optimize_dtypes(sales_data):
+    """
+    Testa o método `optimize_dtypes`, verificando que inteiros são reduzidos ao menor tipo seguro,
+    que textos de baixa cardinalidade viram `category` e que os valores são preservados.
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se algum tipo ou valor não corresponder ao esperado.
+    """
+    extractor = DataExtractor()
+    data = extractor.validate_dataframe(pd.concat([sales_data] * 4, ignore_index=True))
+
+    result = extractor.optimize_dtypes(data)
+
+    assert result['quantity'].dtype == 'int8'
+    assert result['customer_id'].dtype == 'int16'
+    assert result['price'].dtype == 'float64'
+    assert isinstance(result['payment_method'].dtype, pd.CategoricalDtype)
+    assert result.memory_usage(deep=True).sum() < data.memory_usage(deep=True).sum()
+    pd.testing.assert_frame_equal(result.astype(data.dtypes.to_dict()), data)
+
+def test_validate_arrow_table_rejects_invalid_values(sales_data):
+    """
+    Testa se a validação de tabelas Arrow converte os tipos conforme o esquema e rejeita
+    valores não positivos com um `SchemaError`.
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se a conversão ou o erro não ocorrerem como esperado.
+    """
+    pyarrow = pytest.importorskip('pyarrow')
+    extractor = DataExtractor()
+
+    validated = extractor.validate_arrow_table(pyarrow.Table.from_pandas(sales_data))
+    assert validated.schema.field('order_date').type == pyarrow.timestamp('ns')
+
+    sales_data.loc[1, 'quantity'] = 0
+    with pytest.raises(pa.errors.SchemaError, match="A coluna 'quantity' possui valores não positivos ou nulos."):
+        extractor.validate_arrow_table(pyarrow.Table.from_pandas(sales_data))
+
+@pytest.mark.parametrize('file_format', ['csv', 'json', 'parquet'])
+def test_projection_and_filters(tmp_path, sales_data, file_format):
+    """
+    Testa a projeção de colunas e os predicados em todos os formatos, verificando que apenas as
+    linhas que atendem aos predicados e as colunas projetadas são retornadas, tanto na leitura
+    completa quanto na leitura em blocos.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+        file_format (str): Formato de arquivo testado.
+
+    Raises:
+        AssertionError: Se as linhas ou colunas retornadas não corresponderem ao esperado.
+    """
+    sales_data['order_date'] = pd.to_datetime(sales_data['order_date'])
+    file_path = tmp_path / f'vendas.{file_format}'
+    if file_format == 'csv':
+        sales_data.to_csv(file_path, index=False)
+    elif file_format == 'json':
+        sales_data.to_json(file_path, orient='records', lines=True, date_format='iso')
+    else:
+        fastparquet.write(str(file_path), sales_data, row_group_offsets=1)
+
+    extractor = DataExtractor(
+        columns=['payment_method', 'price'],
+        filters=[('order_date', '>=', '2023-01-02'), ('store_location', 'in', ['Houston', 'Los Angeles'])]
+    )
+    expected = pd.DataFrame({'payment_method': ['Debit Card'], 'price': [20.8]})
+
+    pd.testing.assert_frame_equal(extractor.read_file(str(file_path), file_format), expected)
+    pd.testing.assert_frame_equal(
+        pd.concat(extractor.iter_chunks(str(tmp_path), file_format, chunksize=1), ignore_index=True),
+        expected
+    )
+
+def test_projection_rejects_unknown_column():
+    """
+    Testa se a classe `DataExtractor` rejeita projeções com colunas fora do esquema.
+
+    Raises:
+        AssertionError: Se o `ValueError` não for levantado.
+    """
+    with pytest.raises(ValueError, match='Colunas não pertencentes ao esquema'):
+        DataExtractor(columns=['payment_method', 'discount'])
+
+def test_json_epoch_dates_are_read_as_milliseconds(sales_data, tmp_path):
+    """
+    Testa se as datas gravadas pelo `DataFrame.to_json` (milissegundos desde a época Unix) são
+    lidas com os mesmos valores de 'order_date' do CSV.
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+        tmp_path (Path): Diretório temporário do pytest.
+
+    Raises:
+        AssertionError: Se as datas lidas do JSON forem diferentes das originais.
+    """
+    sales_data['order_date'] = pd.to_datetime(sales_data['order_date'])
+    sales_data.to_json(tmp_path / 'vendas.json', orient='records', lines=True)
+
+    result = DataExtractor().read_json_data(str(tmp_path))
+
+    pd.testing.assert_series_equal(result['order_date'], sales_data['order_date'])
+
+@pytest.mark.parametrize('file_format', ['csv', 'json'])
+def test_parser_engines_return_the_same_frames(sales_data, tmp_path, file_format):
+    """
+    Testa se os motores de leitura 'c' e 'pyarrow' retornam os mesmos DataFrames, com os tipos do
+    esquema, tanto na leitura completa quanto na leitura em blocos.
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+        tmp_path (Path): Diretório temporário do pytest.
+        file_format (str): Formato de arquivo testado.
+
+    Raises:
+        AssertionError: Se os DataFrames lidos pelos dois motores forem diferentes.
+    """
+    pytest.importorskip('pyarrow')
+    sales_data['order_date'] = pd.to_datetime(sales_data['order_date'])
+    sales_data['price'] = [100.0, 20.8, 362.8]
+    file_path = tmp_path / f'vendas.{file_format}'
+    if file_format == 'csv':
+        sales_data.to_csv(file_path, index=False)
+    else:
+        sales_data.to_json(file_path, orient='records', lines=True)
+
+    c_extractor = DataExtractor(parser_engine='c')
+    arrow_extractor = DataExtractor(parser_engine='pyarrow')
+
+    pd.testing.assert_frame_equal(arrow_extractor.read_file(str(file_path), file_format), sales_data)
+    pd.testing.assert_frame_equal(c_extractor.read_file(str(file_path), file_format), sales_data)
+    for c_chunk, arrow_chunk in zip(c_extractor.iter_chunks(str(tmp_path), file_format, chunksize=2),
+                                    arrow_extractor.iter_chunks(str(tmp_path), file_format, chunksize=2),
+                                    strict=True):
+        pd.testing.assert_frame_equal(arrow_chunk, c_chunk)
+
+@pytest.mark.parametrize('parser_engine', ['c', 'pyarrow'])
+def test_type_invalid_csv_raises_schema_error(sales_data, tmp_path, parser_engine):
+    """
+    Testa se um valor de tipo inválido, que falha já na leitura com os tipos do esquema, é relatado
+    como `SchemaError` com o nome do arquivo pelos dois motores, na leitura completa e em blocos.
+
+    Parameters:
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+        tmp_path (Path): Diretório temporário do pytest.
+        parser_engine (str): Motor de leitura testado.
+
+    Raises:
+        AssertionError: Se o erro levantado não for um `SchemaError` com o nome do arquivo.
+    """
+    if parser_engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    sales_data['price'] = sales_data['price'].astype(object)
+    sales_data.loc[1, 'price'] = 'abc'
+    sales_data.to_csv(tmp_path / 'vendas.csv', index=False)
+    extractor = DataExtractor(parser_engine=parser_engine)
+
+    with pytest.raises(pa.errors.SchemaError, match='vendas.csv'):
+        extractor.read_file(str(tmp_path / 'vendas.csv'), 'csv')
+    with pytest.raises(pa.errors.SchemaError, match='vendas.csv'):
+        list(extractor.iter_chunks(str(tmp_path), 'csv', chunksize=2))
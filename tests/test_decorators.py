@@ -0,0 +1,90 @@
+import json
+import pstats
+import sys
+
+import pytest  # type: ignore
+from loguru import logger  # type: ignore
+
+from decorators.decorators import (configure_logging, enable_profiling,
+                                   log_decorator, profile_decorator)
+
+
+@pytest.fixture
+def restore_logging(monkeypatch):
+    """
+    Restaura, ao final do teste, o destino padrão dos logs (`stderr`) e as mensagens dos decoradores.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture do pytest que restaura o estado do módulo.
+    """
+    monkeypatch.setattr('decorators.decorators._decorator_logs', True)
+    yield
+    logger.remove()
+    logger.add(sys.stderr)
+
+def test_configure_logging_json_without_decorator_logs(tmp_path, restore_logging):
+    """
+    Testa se, com os logs dos decoradores desativados e o formato JSON, apenas as falhas são
+    gravadas, uma mensagem JSON por linha e sem códigos de cor.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        restore_logging (None): Fixture que restaura a configuração padrão dos logs.
+
+    Raises:
+        AssertionError: Se o arquivo de log não tiver apenas a mensagem de falha.
+    """
+    log_path = tmp_path / 'app.log'
+    configure_logging(log_path=str(log_path), log_format='json', decorator_logs=False)
+
+    @log_decorator
+    def divide(a: int, b: int) -> float:
+        return a / b
+
+    divide(1, 1)
+    with pytest.raises(ZeroDivisionError):
+        divide(1, 0)
+    logger.complete()
+
+    records = [json.loads(line)['record'] for line in log_path.read_text(encoding='utf-8').splitlines()]
+    assert [record['level']['name'] for record in records] == ['ERROR']
+    assert 'divide' in records[0]['message']
+    assert '\x1b[' not in log_path.read_text(encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        configure_logging(log_path=str(log_path), log_format='xml')
+
+def test_profile_decorator_writes_stage_reports(tmp_path):
+    """
+    Testa se, com o modo de perfilamento ativo, o `profile_decorator` grava o arquivo `.prof` da
+    etapa externa e os relatórios de alocação de todas as etapas, inclusive a aninhada, e se nada
+    é gravado com o modo desativado.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se os arquivos gravados não corresponderem ao esperado.
+    """
+    @profile_decorator
+    def inner_stage() -> list[int]:
+        return list(range(10_000))
+
+    @profile_decorator
+    def outer_stage() -> int:
+        return len(inner_stage())
+
+    enable_profiling(str(tmp_path / 'profile'))
+    try:
+        assert outer_stage() == 10_000
+    finally:
+        enable_profiling(None)
+
+    profile_dir = tmp_path / 'profile'
+    assert len(list(profile_dir.glob('outer_stage-*.prof'))) == 1
+    assert len(list(profile_dir.glob('inner_stage-*.prof'))) == 0
+    assert len(list(profile_dir.glob('*.alloc.txt'))) == 2
+    assert pstats.Stats(str(next(profile_dir.glob('outer_stage-*.prof')))).total_calls > 0
+
+    outer_stage()
+    assert len(list(profile_dir.iterdir())) == 3
@@ -4,6 +4,7 @@ import pandas as pd  # type: ignore
 import pytest  # type: ignore
 
 from funcs.extract import extract_and_consolidate  # type: ignore
+from funcs.extract import extract_and_consolidate_arrow, extract_chunks
 
 
 @patch('funcs.extract.DataExtractor')
@@ -84,3 +85,159 @@ def test_extract_and_consolidate(MockDataExtractor):
     })
 
     pd.testing.assert_frame_equal(result, expected_data)
+
+@patch('funcs.extract.DataExtractor')
+def test_extract_and_consolidate_parallel(MockDataExtractor):
+    """
+    Testa a função `extract_and_consolidate` no modo paralelo, verificando que a ordem de
+    consolidação (CSV, JSON e Parquet) é preservada mesmo quando as leituras ocorrem simultaneamente.
+
+    Parameters:
+        MockDataExtractor (MagicMock): Mock da classe `DataExtractor` para simular a leitura de dados.
+
+    Raises:
+        AssertionError: Se a saída da função não corresponder ao DataFrame esperado.
+    """
+    mock_extractor = MockDataExtractor.return_value
+    mock_extractor.read_csv_data.return_value = pd.DataFrame({'order_id': [1, 2]})
+    mock_extractor.read_json_data.return_value = pd.DataFrame({'order_id': [3]})
+    mock_extractor.read_parquet_data.return_value = pd.DataFrame({'order_id': [4]})
+
+    result = extract_and_consolidate('fake_path', parallel=True, max_workers=2)
+
+    mock_extractor.read_csv_data.assert_called_once_with(input_path='fake_path')
+    mock_extractor.read_json_data.assert_called_once_with(input_path='fake_path')
+    mock_extractor.read_parquet_data.assert_called_once_with(input_path='fake_path')
+
+    pd.testing.assert_frame_equal(result, pd.DataFrame({'order_id': [1, 2, 3, 4]}))
+
+@patch('funcs.extract.DataExtractor')
+def test_extract_and_consolidate_parallel_propagates_errors(MockDataExtractor):
+    """
+    Testa se, no modo paralelo, a exceção levantada por um dos leitores é relançada
+    sem alterações pela função `extract_and_consolidate`.
+
+    Parameters:
+        MockDataExtractor (MagicMock): Mock da classe `DataExtractor` para simular a leitura de dados.
+
+    Raises:
+        AssertionError: Se a exceção esperada não for levantada.
+    """
+    mock_extractor = MockDataExtractor.return_value
+    mock_extractor.read_csv_data.return_value = pd.DataFrame({'order_id': [1]})
+    mock_extractor.read_json_data.side_effect = FileNotFoundError('Arquivo JSON ausente.')
+    mock_extractor.read_parquet_data.return_value = pd.DataFrame({'order_id': [2]})
+
+    with pytest.raises(FileNotFoundError, match='Arquivo JSON ausente.'):
+        extract_and_consolidate('fake_path', parallel=True)
+
+def test_extract_and_consolidate_partitioned(tmp_path):
+    """
+    Testa a função `extract_and_consolidate` no modo particionado, com vários arquivos em
+    subdiretórios no estilo Hive (`year=/month=`).
+
+    São validados os seguintes aspectos:
+
+    - Todos os arquivos dos formatos presentes são lidos, mesmo com mais de um arquivo por formato.
+    - Os valores de partição são adicionados como colunas.
+    - O filtro de partições descarta arquivos sem que eles precisem ser lidos.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se os dados consolidados não corresponderem ao esperado.
+    """
+    base_data = pd.DataFrame({
+        'order_id': [1, 2],
+        'customer_id': [202, 448],
+        'order_date': ['2023-01-01', '2023-01-02'],
+        'product_id': [1484, 1027],
+        'quantity': [5, 4],
+        'price': [99.68, 20.8],
+        'payment_method': ['Cash', 'Debit Card'],
+        'store_location': ['Los Angeles', 'Houston']
+    })
+
+    for month in ['01', '02']:
+        partition_dir = tmp_path / 'year=2023' / f'month={month}'
+        partition_dir.mkdir(parents=True)
+        base_data.to_csv(partition_dir / 'part-0.csv', index=False)
+        base_data.to_csv(partition_dir / 'part-1.csv', index=False)
+    base_data.to_json(tmp_path / 'year=2023' / 'month=01' / 'part-0.json', orient='records', lines=True)
+
+    result = extract_and_consolidate(str(tmp_path), partitioned=True)
+
+    assert len(result) == 10
+    assert set(result['year']) == {'2023'}
+    assert sorted(result['month'].value_counts().to_dict().items()) == [('01', 6), ('02', 4)]
+
+    filtered = extract_and_consolidate(str(tmp_path), partitioned=True, partition_filter={'month': ['02']})
+
+    assert len(filtered) == 4
+    assert set(filtered['month']) == {'02'}
+
+def test_extract_chunks(tmp_path):
+    """
+    Testa a função `extract_chunks`, verificando que os arquivos são lidos em blocos de tamanho
+    limitado e que a concatenação dos blocos reproduz o resultado de `extract_and_consolidate`.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se algum bloco exceder o tamanho máximo ou se os dados divergirem.
+    """
+    base_data = pd.DataFrame({
+        'order_id': [1, 2, 3, 4, 5],
+        'customer_id': [202, 448, 370, 206, 171],
+        'order_date': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04', '2023-01-05']),
+        'product_id': [1484, 1027, 1713, 1038, 1120],
+        'quantity': [5, 4, 6, 7, 1],
+        'price': [99.68, 20.8, 362.8, 214.82, 10.5],
+        'payment_method': ['Cash', 'Debit Card', 'Credit Card', 'Credit Card', 'PayPal'],
+        'store_location': ['Los Angeles', 'Houston', 'New York', 'Houston', 'Chicago']
+    })
+    base_data.to_csv(tmp_path / 'vendas.csv', index=False)
+    base_data.to_json(tmp_path / 'vendas.json', orient='records', lines=True)
+    base_data.to_parquet(tmp_path / 'vendas.parquet', index=False)
+
+    chunks = list(extract_chunks(str(tmp_path), chunksize=2))
+
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True),
+        extract_and_consolidate(str(tmp_path))
+    )
+
+def test_extract_and_consolidate_arrow(tmp_path):
+    """
+    Testa a função `extract_and_consolidate_arrow`, verificando que a tabela Arrow consolidada
+    contém os mesmos dados retornados por `extract_and_consolidate`.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se os dados da tabela Arrow divergirem dos dados do pandas.
+    """
+    pytest.importorskip('pyarrow')
+
+    base_data = pd.DataFrame({
+        'order_id': [1, 2],
+        'customer_id': [202, 448],
+        'order_date': pd.to_datetime(['2023-01-01', '2023-01-02']),
+        'product_id': [1484, 1027],
+        'quantity': [5, 4],
+        'price': [99.68, 20.8],
+        'payment_method': ['Cash', 'Debit Card'],
+        'store_location': ['Los Angeles', 'Houston']
+    })
+    base_data.to_csv(tmp_path / 'vendas.csv', index=False)
+    base_data.to_json(tmp_path / 'vendas.json', orient='records', lines=True)
+    base_data.to_parquet(tmp_path / 'vendas.parquet', index=False)
+
+    result = extract_and_consolidate_arrow(str(tmp_path))
+
+    assert result.num_rows == 6
+    pd.testing.assert_frame_equal(result.to_pandas(), extract_and_consolidate(str(tmp_path)))
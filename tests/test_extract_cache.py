@@ -0,0 +1,102 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from classes.data_extractor import DataExtractor
+from classes.extract_cache import ExtractCache
+
+
+@pytest.fixture
+def sales_file(tmp_path) -> str:
+    """
+    Cria um arquivo CSV de vendas válido de acordo com o esquema da classe `DataExtractor`.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Returns:
+        str: Caminho do arquivo CSV criado.
+    """
+    file_path = tmp_path / 'vendas.csv'
+    pd.DataFrame({
+        'order_id': [1, 2],
+        'customer_id': [202, 448],
+        'order_date': ['2023-01-01', '2023-01-02'],
+        'product_id': [1484, 1027],
+        'quantity': [5, 4],
+        'price': [99.68, 20.8],
+        'payment_method': ['Cash', 'Debit Card'],
+        'store_location': ['Los Angeles', 'Houston']
+    }).to_csv(file_path, index=False)
+    return str(file_path)
+
+def test_cache_hit_skips_parsing(tmp_path, sales_file):
+    """
+    Testa se, na segunda leitura de um arquivo inalterado, o extrato validado é carregado do
+    cache sem que o arquivo seja analisado novamente.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_file (str): Caminho do arquivo CSV de vendas.
+
+    Raises:
+        AssertionError: Se o arquivo for analisado novamente ou se os dados divergirem.
+    """
+    cache = ExtractCache(str(tmp_path / 'cache'))
+    first = DataExtractor(cache=cache).read_file(sales_file, 'csv')
+
+    with patch.object(DataExtractor, '_read_file', side_effect=AssertionError('Arquivo analisado novamente.')):
+        second = DataExtractor(cache=cache).read_file(sales_file, 'csv')
+
+    pd.testing.assert_frame_equal(second, first)
+
+def test_cache_eviction_and_invalidate(tmp_path):
+    """
+    Testa a remoção LRU quando o limite de tamanho é excedido e a invalidação explícita do cache.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se os extratos mantidos ou removidos não corresponderem ao esperado.
+    """
+    cache = ExtractCache(str(tmp_path / 'cache'))
+    data = pd.DataFrame({'price': [1.0] * 100})
+
+    cache.put('antigo', data)
+    os.utime(cache._path('antigo'), (0, 0))
+    cache.put('recente', data)
+
+    cache.max_bytes = os.path.getsize(cache._path('recente'))
+    cache.evict()
+
+    assert cache.get('antigo') is None
+    pd.testing.assert_frame_equal(cache.get('recente'), data)
+
+    assert cache.invalidate() == 1
+    assert cache.get('recente') is None
+
+def test_cache_key_only_rehashes_modified_files(tmp_path, sales_file):
+    """
+    Testa se a chave de um arquivo inalterado é montada sem recalcular o hash do conteúdo, também
+    em uma nova instância do cache, e se o hash é recalculado quando o arquivo é modificado.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_file (str): Caminho do arquivo CSV de vendas.
+
+    Raises:
+        AssertionError: Se o hash for recalculado sem necessidade ou se a chave não mudar.
+    """
+    key = ExtractCache(str(tmp_path / 'cache')).make_key(sales_file)
+
+    cache = ExtractCache(str(tmp_path / 'cache'))
+    with patch('classes.extract_cache.compute_file_hash', side_effect=AssertionError('Hash recalculado.')):
+        assert cache.make_key(sales_file) == key
+
+    with open(sales_file, 'a', encoding='utf-8') as file:
+        file.write('3,101,2023-01-03,1001,1,10.0,Cash,Houston\n')
+
+    assert cache.make_key(sales_file) != key
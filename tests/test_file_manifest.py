@@ -0,0 +1,115 @@
+import os
+
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from classes.file_manifest import FileManifest
+from funcs.extract import extract_changed_files
+from funcs.transform import transform_incremental
+
+
+@pytest.fixture
+def sales_data() -> pd.DataFrame:
+    """
+    Cria um DataFrame de vendas válido de acordo com o esquema da classe `DataExtractor`.
+
+    Returns:
+        pd.DataFrame: DataFrame com duas vendas.
+    """
+    return pd.DataFrame({
+        'order_id': [1, 2],
+        'customer_id': [202, 448],
+        'order_date': ['2023-01-01', '2023-01-02'],
+        'product_id': [1484, 1027],
+        'quantity': [5, 4],
+        'price': [100.5, 50.25],
+        'payment_method': ['Cash', 'Debit Card'],
+        'store_location': ['Los Angeles', 'Houston']
+    })
+
+def test_incremental_run_only_reads_changed_files(tmp_path, sales_data):
+    """
+    Testa a extração incremental, verificando que apenas arquivos novos ou modificados são lidos
+    e que os totais consideram os parciais de todos os arquivos registrados no manifesto.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se os arquivos lidos ou os totais não corresponderem ao esperado.
+    """
+    data_dir = tmp_path / 'raw'
+    data_dir.mkdir()
+    manifest_path = str(tmp_path / 'manifest.json')
+    sales_data.to_csv(data_dir / 'vendas_1.csv', index=False)
+
+    manifest = FileManifest(manifest_path)
+    changed = extract_changed_files(str(data_dir), manifest)
+    transform_incremental(changed, manifest)
+    manifest.save()
+
+    assert list(changed) == [str(data_dir / 'vendas_1.csv')]
+
+    sales_data.to_json(data_dir / 'vendas_2.json', orient='records', lines=True)
+
+    manifest = FileManifest(manifest_path)
+    changed = extract_changed_files(str(data_dir), manifest)
+    result = transform_incremental(changed, manifest)
+
+    assert list(changed) == [str(data_dir / 'vendas_2.json')]
+    pd.testing.assert_frame_equal(result, pd.DataFrame({
+        'payment_method': ['Cash', 'Debit Card'],
+        'price': [201.0, 100.5]
+    }))
+
+def test_manifest_detects_touched_and_removed_files(tmp_path, sales_data):
+    """
+    Testa se o manifesto ignora arquivos com conteúdo inalterado (apenas com a data de modificação
+    alterada) e remove os arquivos que deixaram de existir.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se as alterações não forem detectadas corretamente.
+    """
+    file_path = str(tmp_path / 'vendas.csv')
+    sales_data.to_csv(file_path, index=False)
+
+    manifest = FileManifest(str(tmp_path / 'manifest.json'))
+    assert manifest.has_changed(file_path)
+    manifest.update(file_path, len(sales_data), pd.DataFrame({'payment_method': ['Cash'], 'price': [1.0]}))
+
+    os.utime(file_path, (0, 0))
+    assert not manifest.has_changed(file_path)
+
+    assert manifest.remove_missing([]) == [os.path.normpath(file_path)]
+    assert manifest.partials() == []
+
+def test_incremental_transform_does_not_record_failed_files(tmp_path, sales_data):
+    """
+    Testa se um arquivo cuja agregação falha não é registrado no manifesto, para que seja
+    processado novamente na próxima execução, em vez de ficar registrado com um parcial vazio.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se o arquivo com falha for registrado no manifesto.
+    """
+    valid_path, broken_path = str(tmp_path / 'vendas_1.csv'), str(tmp_path / 'vendas_2.csv')
+    sales_data.to_csv(valid_path, index=False)
+    sales_data.to_csv(broken_path, index=False)
+
+    manifest = FileManifest(str(tmp_path / 'manifest.json'))
+    changed = {valid_path: sales_data, broken_path: sales_data.drop(columns='price')}
+
+    with pytest.raises(KeyError, match='price'):
+        transform_incremental(changed, manifest)
+
+    assert os.path.normpath(valid_path) in manifest.entries
+    assert os.path.normpath(broken_path) not in manifest.entries
+    assert manifest.has_changed(broken_path)
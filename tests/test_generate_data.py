@@ -0,0 +1,73 @@
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from benchmarks.run_benchmarks import compare_with_baseline, run_benchmark
+from funcs.extract import extract_and_consolidate
+from funcs.generate_data import generate_scaled_data
+
+
+def test_generate_scaled_data_writes_chunked_files(tmp_path):
+    """
+    Testa se o gerador parametrizado grava o número de linhas e de arquivos pedidos, em blocos,
+    com IDs contínuos e dados válidos, e se a fração de linhas inválidas é respeitada.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se os arquivos gerados não corresponderem aos parâmetros.
+    """
+    clean_dir = tmp_path / 'clean'
+    generate_scaled_data(str(clean_dir), 2_500, n_files=2, chunksize=1_000, store_cardinality=8)
+
+    assert len(list(clean_dir.glob('*.csv'))) == len(list(clean_dir.glob('*.parquet'))) == 2
+    data = extract_and_consolidate(str(clean_dir), partitioned=True)
+    assert len(data) == 3 * 2_500
+    assert sorted(data['order_id'].unique()) == list(range(1, 2_501))
+    assert data['store_location'].nunique() == 8
+
+    dirty_dir = tmp_path / 'dirty'
+    dirty_rows = generate_scaled_data(str(dirty_dir), 5_000, chunksize=1_000, dirty_ratio=0.1, formats=('csv',))
+    csv_data = pd.read_csv(next(dirty_dir.glob('*.csv')))
+    assert (csv_data['price'] < 0).sum() == dirty_rows['csv'] == pytest.approx(500, rel=0.2)
+
+def test_generate_scaled_data_spreads_rows_across_files(tmp_path):
+    """
+    Testa se as linhas são distribuídas entre todos os arquivos quando `n_rows` não é múltiplo de
+    `n_files`, sem arquivos vazios, e se mais arquivos do que linhas é rejeitado.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se algum arquivo faltar ou se os tamanhos não corresponderem ao esperado.
+    """
+    generate_scaled_data(str(tmp_path), 5, n_files=4, formats=('csv',))
+
+    files = sorted(tmp_path.glob('*.csv'))
+    assert [len(pd.read_csv(file_path)) for file_path in files] == [2, 1, 1, 1]
+    assert pd.concat(pd.read_csv(file_path) for file_path in files)['order_id'].tolist() == [1, 2, 3, 4, 5]
+
+    with pytest.raises(ValueError, match='arquivos'):
+        generate_scaled_data(str(tmp_path), 3, n_files=4)
+
+def test_benchmark_reports_stages_and_regressions(tmp_path):
+    """
+    Testa se o benchmark mede todas as etapas e se a comparação com a referência aponta apenas
+    as etapas com queda de vazão acima da tolerância.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se as etapas ou as regressões não corresponderem ao esperado.
+    """
+    results = run_benchmark(str(tmp_path), 500)
+
+    assert list(results['stages']) == ['generate', 'parse', 'validate', 'extract', 'transform', 'load']
+    assert all(metrics['rows_per_second'] > 0 for metrics in results['stages'].values())
+
+    baseline = {'stages': {stage: dict(metrics) for stage, metrics in results['stages'].items()}}
+    baseline['stages']['load']['rows_per_second'] *= 2
+    regressions = compare_with_baseline(results, baseline, tolerance=0.2)
+    assert len(regressions) == 1 and regressions[0].startswith('load')
@@ -0,0 +1,72 @@
+import json
+
+import pandas as pd  # type: ignore
+
+from decorators.decorators import time_decorador
+from decorators.metrics import METRICS, MetricsRegistry
+from funcs.extract import extract_and_consolidate
+
+
+def test_time_decorador_records_stage_metrics(tmp_path):
+    """
+    Testa se o `time_decorador` acumula as métricas da etapa (execuções, falhas, linhas e duração)
+    e se o `flush` grava o resumo JSON e o arquivo do Prometheus.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se os contadores ou os arquivos gravados não corresponderem ao esperado.
+    """
+    @time_decorador
+    def double_rows(data: pd.DataFrame) -> pd.DataFrame:
+        if data.empty:
+            raise ValueError('vazio')
+        return pd.concat([data, data])
+
+    METRICS.reset()
+    double_rows(pd.DataFrame({'price': [1.0, 2.0]}))
+    double_rows(pd.DataFrame({'price': [3.0]}))
+    try:
+        double_rows(pd.DataFrame())
+    except ValueError:
+        pass
+
+    counters = METRICS.summary()['stages']['double_rows']
+    assert (counters['calls'], counters['failures']) == (3, 1)
+    assert (counters['rows_in'], counters['rows_out']) == (3, 6)
+    assert counters['duration_seconds'] > 0
+
+    json_path, prom_path = METRICS.flush(str(tmp_path))
+    with open(json_path, encoding='utf-8') as file:
+        assert json.load(file)['stages']['double_rows']['calls'] == 3
+    with open(prom_path, encoding='utf-8') as file:
+        assert 'pipeline_stage_calls_total{stage="double_rows"} 3' in file.read()
+
+def test_extraction_records_bytes_read(tmp_path):
+    """
+    Testa se a leitura dos arquivos de entrada registra os bytes e o número de arquivos lidos.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se os contadores de leitura não corresponderem aos arquivos lidos.
+    """
+    sales_data = pd.DataFrame({
+        'order_id': [1], 'customer_id': [202], 'order_date': ['2023-01-01'], 'product_id': [1484],
+        'quantity': [5], 'price': [99.68], 'payment_method': ['Cash'], 'store_location': ['Houston']
+    })
+    sales_data.to_csv(tmp_path / 'vendas.csv', index=False)
+    sales_data.to_json(tmp_path / 'vendas.json', orient='records', lines=True)
+    sales_data.to_parquet(tmp_path / 'vendas.parquet', index=False)
+    expected_bytes = sum(path.stat().st_size for path in tmp_path.iterdir())
+
+    METRICS.reset()
+    extract_and_consolidate(str(tmp_path))
+
+    counters = METRICS.summary()['stages']
+    assert counters['read_file']['files_read'] == 3
+    assert counters['read_file']['bytes_read'] == expected_bytes
+    assert counters['extract_and_consolidate']['rows_out'] == 3
+    assert MetricsRegistry().summary()['stages'] == {}
@@ -0,0 +1,159 @@
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from classes.file_manifest import FileManifest
+from classes.order_index import OrderIdIndex
+from funcs.extract import deduplicate_orders, extract_changed_files
+from funcs.transform import transform_incremental
+
+
+@pytest.fixture
+def sales_data() -> pd.DataFrame:
+    """
+    Cria um DataFrame de vendas válido de acordo com o esquema da classe `DataExtractor`.
+
+    Returns:
+        pd.DataFrame: DataFrame com três vendas.
+    """
+    return pd.DataFrame({
+        'order_id': [1, 2, 3],
+        'customer_id': [202, 448, 370],
+        'order_date': ['2023-01-01', '2023-01-02', '2023-01-03'],
+        'product_id': [1484, 1027, 1713],
+        'quantity': [5, 4, 6],
+        'price': [99.68, 20.8, 362.8],
+        'payment_method': ['Cash', 'Debit Card', 'Credit Card'],
+        'store_location': ['Los Angeles', 'Houston', 'New York']
+    })
+
+def test_deduplicate_orders_policies():
+    """
+    Testa as políticas de conflito de `deduplicate_orders` e o compartilhamento do `OrderIdIndex`
+    entre blocos.
+    """
+    data = pd.DataFrame({'order_id': [10, 11, 10, 12], 'price': [1.0, 2.0, 3.0, 4.0]})
+
+    assert deduplicate_orders(data, 'first')['price'].tolist() == [1.0, 2.0, 4.0]
+    assert deduplicate_orders(data, 'last')['price'].tolist() == [2.0, 3.0, 4.0]
+    with pytest.raises(ValueError, match='repetido'):
+        deduplicate_orders(data, 'error')
+
+    index = OrderIdIndex()
+    first_chunk = deduplicate_orders(data.iloc[:2], 'first', index)
+    second_chunk = deduplicate_orders(data.iloc[2:], 'first', index)
+    assert first_chunk['order_id'].tolist() == [10, 11]
+    assert second_chunk['order_id'].tolist() == [12]
+
+    restored = OrderIdIndex.deserialize(index.serialize())
+    np.testing.assert_array_equal(restored.contains(np.array([9, 10, 11, 12, 13])), [False, True, True, True, False])
+
+    with pytest.raises(ValueError):
+        deduplicate_orders(data, 'last', index)
+
+def test_order_index_switches_to_sorted_ids_for_sparse_ranges():
+    """
+    Testa se IDs muito distantes são guardados em um array ordenado, em vez de um bitmap sobre todo
+    o intervalo, e se o índice volta ao bitmap quando o intervalo fica denso.
+    """
+    index = OrderIdIndex()
+    index.add(np.array([1, 2 ** 40]))
+
+    assert index.bits.size == 0
+    np.testing.assert_array_equal(index.contains(np.array([0, 1, 2, 2 ** 40, 2 ** 40 + 1])),
+                                  [False, True, False, True, False])
+
+    dense = OrderIdIndex()
+    dense.add(np.arange(100, 200))
+    dense.merge(index)
+    assert len(dense) == 102
+    assert dense.keep_mask(np.array([150, 2 ** 40, 7])).tolist() == [False, False, True]
+
+    restored = OrderIdIndex.deserialize(dense.serialize())
+    np.testing.assert_array_equal(restored.contains(np.array([7, 99, 150, 2 ** 40])), [True, False, True, True])
+
+    refilled = OrderIdIndex()
+    refilled.add(np.array([0, 2 ** 24]))
+    assert refilled.ids is not None
+    refilled.add(np.arange(0, 2 ** 24, 64))
+    assert refilled.ids is None and len(refilled) == 2 ** 18 + 1
+
+def test_order_index_grows_geometrically_and_keeps_count():
+    """
+    Testa se IDs sequenciais lidos em blocos realocam o bitmap apenas um número logarítmico de
+    vezes e se a contagem mantida a cada inserção corresponde aos bits marcados, inclusive com IDs
+    repetidos e após `merge`.
+    """
+    index = OrderIdIndex()
+    sizes = set()
+    for start in range(0, 1_000_000, 1_000):
+        index.keep_mask(np.arange(start, start + 1_000))
+        sizes.add(index.bits.size)
+
+    assert len(index) == 1_000_000
+    assert len(sizes) <= 12
+    assert index.bits.size < 2 * 1_000_000 // 8 + 1
+
+    rng = np.random.default_rng(3)
+    other = OrderIdIndex()
+    other.add(rng.integers(500_000, 2_000_000, size=50_000))
+    other.add(rng.integers(500_000, 2_000_000, size=50_000))
+    assert len(other) == int(np.unpackbits(other.bits).sum())
+
+    index.merge(other)
+    assert len(index) == int(np.unpackbits(index.bits).sum())
+    assert len(OrderIdIndex.deserialize(index.serialize())) == len(index)
+
+def test_incremental_deduplication_ignores_own_previous_ids(tmp_path, sales_data):
+    """
+    Testa a deduplicação incremental: um arquivo novo perde os IDs já registrados por outro arquivo,
+    mas um arquivo modificado não é comparado com os seus próprios IDs da execução anterior.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+
+    Raises:
+        AssertionError: Se as linhas mantidas não corresponderem ao esperado.
+    """
+    data_dir = tmp_path / 'raw'
+    data_dir.mkdir()
+    manifest_path = str(tmp_path / 'manifest.json')
+    sales_data.iloc[:2].to_csv(data_dir / 'vendas_1.csv', index=False)
+
+    manifest = FileManifest(manifest_path)
+    for file_path, data in extract_changed_files(str(data_dir), manifest, deduplicate='first').items():
+        manifest.update(file_path, len(data), data[['payment_method', 'price']])
+    manifest.save()
+
+    sales_data.iloc[:2].assign(price=[1.5, 2.5]).to_csv(data_dir / 'vendas_1.csv', index=False)
+    sales_data.iloc[1:].to_json(data_dir / 'vendas_2.json', orient='records', lines=True)
+
+    manifest = FileManifest(manifest_path)
+    changed = extract_changed_files(str(data_dir), manifest, deduplicate='first')
+
+    assert changed[str(data_dir / 'vendas_1.csv')]['order_id'].tolist() == [1, 2]
+    assert changed[str(data_dir / 'vendas_2.json')]['order_id'].tolist() == [3]
+
+def test_incremental_transform_skips_files_emptied_by_deduplication(tmp_path, sales_data, capsys):
+    """
+    Testa se um arquivo cujos pedidos já foram todos registrados por outro arquivo é registrado no
+    manifesto sem passar por `transform_data`, que trataria o DataFrame vazio como inválido.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+        sales_data (pd.DataFrame): DataFrame de vendas válido.
+        capsys (pytest.CaptureFixture): Captura da saída padrão fornecida pelo pytest.
+    """
+    data_dir = tmp_path / 'raw'
+    data_dir.mkdir()
+    sales_data.to_csv(data_dir / 'vendas_1.csv', index=False)
+    sales_data.iloc[:2].to_json(data_dir / 'vendas_2.json', orient='records', lines=True)
+
+    manifest = FileManifest(str(tmp_path / 'manifest.json'))
+    changed = extract_changed_files(str(data_dir), manifest, deduplicate='first')
+    totals = transform_incremental(changed, manifest)
+
+    assert changed[str(data_dir / 'vendas_2.json')].empty
+    assert 'inválidos' not in capsys.readouterr().out
+    assert totals['price'].sum() == pytest.approx(sales_data['price'].sum())
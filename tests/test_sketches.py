@@ -0,0 +1,75 @@
+import numpy as np  # type: ignore
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+
+from classes.file_manifest import FileManifest
+from classes.sketches import HyperLogLog, TDigest
+from funcs.extract import extract_changed_files
+from funcs.transform import summarize_sketches, transform_incremental
+
+
+def test_sketches_merge_across_chunks():
+    """
+    Testa se os sketches HyperLogLog e t-digest, construídos em blocos, serializados e combinados,
+    produzem estimativas próximas dos valores exatos.
+    """
+    rng = np.random.default_rng(42)
+    customers = rng.integers(0, 50_000, size=200_000)
+    prices = rng.lognormal(mean=4, sigma=1, size=200_000)
+
+    distinct = HyperLogLog()
+    price_digest = TDigest()
+    for customer_chunk, price_chunk in zip(np.array_split(customers, 10), np.array_split(prices, 10)):
+        chunk_distinct, chunk_digest = HyperLogLog(), TDigest()
+        chunk_distinct.add(customer_chunk)
+        chunk_digest.add(price_chunk)
+        distinct.merge(HyperLogLog.deserialize(chunk_distinct.serialize()))
+        price_digest.merge(TDigest.deserialize(chunk_digest.serialize()))
+
+    assert distinct.estimate() == pytest.approx(len(np.unique(customers)), rel=0.03)
+    for quantile in (0.5, 0.95, 0.99):
+        assert price_digest.quantile(quantile) == pytest.approx(np.quantile(prices, quantile), rel=0.02)
+
+    with pytest.raises(ValueError):
+        distinct.merge(HyperLogLog(precision=10))
+
+def test_incremental_run_merges_serialized_sketches(tmp_path):
+    """
+    Testa se uma execução incremental combina os sketches registrados no manifesto com os dos
+    arquivos novos, sem reler os arquivos já processados.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+
+    Raises:
+        AssertionError: Se as estimativas não considerarem todos os arquivos.
+    """
+    data_dir = tmp_path / 'raw'
+    data_dir.mkdir()
+    manifest_path = str(tmp_path / 'manifest.json')
+    sales_data = pd.DataFrame({
+        'order_id': range(1, 101),
+        'customer_id': range(1, 101),
+        'order_date': '2023-01-01',
+        'product_id': 1,
+        'quantity': 1,
+        'price': np.arange(1, 101) + 0.5,
+        'payment_method': 'Cash',
+        'store_location': 'Houston'
+    })
+    sales_data.iloc[:50].to_csv(data_dir / 'vendas_1.csv', index=False)
+
+    manifest = FileManifest(manifest_path)
+    transform_incremental(extract_changed_files(str(data_dir), manifest), manifest, sketches=True)
+    manifest.save()
+
+    sales_data.iloc[50:].to_csv(data_dir / 'vendas_2.csv', index=False)
+
+    manifest = FileManifest(manifest_path)
+    changed = extract_changed_files(str(data_dir), manifest)
+    result = summarize_sketches(transform_incremental(changed, manifest, sketches=True))
+
+    assert list(changed) == [str(data_dir / 'vendas_2.csv')]
+    assert result['unique_customers'].tolist() == [100]
+    assert result['price_p50'].iloc[0] == pytest.approx(51.0, abs=1.0)
+    assert result['price_p99'].iloc[0] == pytest.approx(100.0, abs=1.5)
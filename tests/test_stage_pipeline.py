@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pandas as pd  # type: ignore
+import pytest  # type: ignore
+from sqlalchemy import create_engine  # type: ignore
+
+from app.pipeline import PARTIALS_TABLE, build_stage_pipeline
+from classes.stage_pipeline import StagePipeline
+from funcs.transform import merge_partial_aggregates, transform_data
+
+
+def test_stage_pipeline_applies_backpressure():
+    """
+    Testa se as etapas entregam os resultados na ordem da fonte e se as filas limitadas impedem
+    a fonte de avançar enquanto a etapa seguinte está bloqueada.
+    """
+    produced: list[int] = []
+    release = threading.Event()
+
+    def source():
+        for item in range(100):
+            produced.append(item)
+            yield item
+
+    def slow_stage(item: int) -> int:
+        release.wait(timeout=5)
+        return item * 2
+
+    stages = StagePipeline(maxsize=2).add_stage('slow', slow_stage).add_stage('odd', lambda item: item + 1)
+    results: list[int] = []
+    consumer = threading.Thread(target=lambda: results.extend(stages.run(source())))
+    consumer.start()
+
+    time.sleep(0.3)
+    # Com a primeira etapa bloqueada, apenas o item em processamento e os da fila foram lidos.
+    assert len(produced) <= 1 + 2 + 1
+    release.set()
+    consumer.join(timeout=5)
+
+    assert results == [item * 2 + 1 for item in range(100)]
+
+def test_stage_pipeline_propagates_errors():
+    """
+    Testa se a exceção de uma etapa é relançada para quem consome os resultados.
+    """
+    def fail_on_three(item: int) -> int:
+        if item == 3:
+            raise ValueError('bloco inválido')
+        return item
+
+    stages = StagePipeline(maxsize=1).add_stage('validate', fail_on_three)
+
+    with pytest.raises(ValueError, match='bloco inválido'):
+        list(stages.run(range(10)))
+
+def test_build_stage_pipeline_loads_each_partial(tmp_path):
+    """
+    Testa se a pipeline em estágios grava o parcial de cada bloco no banco em uma etapa própria,
+    apenas quando `partials_table` é informado, e se os parciais entregues somam o mesmo total de
+    `transform_data`.
+    """
+    data = pd.DataFrame({
+        'payment_method': ['Cash', 'Pix', 'Cash', 'Credit Card', 'Pix', 'Cash'],
+        'price': [10.0, 5.5, 2.5, 100.0, 4.5, 7.0]
+    })
+    engine = create_engine(f"sqlite:///{tmp_path / 'vendas.db'}")
+    assert [name for name, _ in build_stage_pipeline(engine=engine).stages] == ['transform']
+    stages = build_stage_pipeline(queue_size=1, partials_table=PARTIALS_TABLE, engine=engine)
+
+    totals = merge_partial_aggregates(stages.run(data.iloc[start:start + 2] for start in range(0, len(data), 2)))
+
+    assert [name for name, _ in stages.stages] == ['transform', 'load_partial']
+    pd.testing.assert_frame_equal(totals, transform_data(data.copy()))
+    partials = pd.read_sql(f'SELECT * FROM {PARTIALS_TABLE}', engine)
+    assert len(partials) == 6
+    assert partials['price'].sum() == pytest.approx(data['price'].sum())
@@ -1,7 +1,14 @@
 import pandas as pd  # type: ignore
 import pytest  # type: ignore
 
-from funcs.transform import transform_data
+from classes.multi_aggregator import MultiAggregator
+from funcs.extract import extract_and_consolidate
+from funcs.generate_data import generate_scaled_data
+from funcs.transform import (build_daily_cube, merge_partial_aggregates,
+                             rollup_cube, summarize_sketches,
+                             transform_arrow_table, transform_chunks,
+                             transform_data, transform_multi,
+                             transform_parallel)
 
 
 def test_transform_data_success():
@@ -59,3 +66,149 @@ def test_transform_data_unexpected_exception():
     expected_data = pd.DataFrame()
 
     pd.testing.assert_frame_equal(result, expected_data)
+
+def test_transform_chunks_matches_transform_data():
+    """
+    Testa a função `transform_chunks`, verificando que a soma dos resultados parciais de cada
+    bloco é igual ao resultado de `transform_data` aplicado ao DataFrame completo.
+    """
+    input_data = pd.DataFrame({
+        'payment_method': ['Credit Card', 'Cash', 'Credit Card', 'Debit Card', 'Cash'],
+        'price': [100.0, 50.0, 150.0, 200.0, 50.0]
+    })
+    chunks = [input_data.iloc[start:start + 2] for start in range(0, len(input_data), 2)]
+
+    result = transform_chunks(iter(chunks))
+
+    pd.testing.assert_frame_equal(result, transform_data(input_data.copy()))
+
+def test_merge_partial_aggregates_empty():
+    """
+    Testa a função `merge_partial_aggregates` sem resultados parciais, esperando que um
+    DataFrame vazio seja retornado.
+    """
+    result = merge_partial_aggregates([])
+
+    pd.testing.assert_frame_equal(result, pd.DataFrame())
+
+def test_transform_data_categorical_payment_method():
+    """
+    Testa a função `transform_data` com a coluna 'payment_method' do tipo `category`,
+    verificando que apenas as categorias presentes nos dados aparecem no resultado.
+    """
+    input_data = pd.DataFrame({
+        'payment_method': pd.Categorical(['Cash', 'Cash', 'PayPal'], categories=['Cash', 'Credit Card', 'PayPal']),
+        'price': [100.0, 50.0, 150.0]
+    })
+
+    result = transform_data(input_data)
+
+    assert result['payment_method'].tolist() == ['Cash', 'PayPal']
+    assert result['price'].tolist() == [150.0, 150.0]
+
+def test_transform_arrow_table_matches_transform_data():
+    """
+    Testa a função `transform_arrow_table`, verificando que a agregação com os kernels do Arrow
+    produz o mesmo resultado de `transform_data`.
+    """
+    pyarrow = pytest.importorskip('pyarrow')
+
+    input_data = pd.DataFrame({
+        'payment_method': ['Credit Card', 'Cash', 'Credit Card', 'Debit Card', 'Cash'],
+        'price': [100.0, 50.0, 150.0, 200.0, 50.0]
+    })
+
+    result = transform_arrow_table(pyarrow.Table.from_pandas(input_data))
+
+    pd.testing.assert_frame_equal(result, transform_data(input_data.copy()))
+
+def test_transform_multi_chunks_match_full_pass():
+    """
+    Testa a função `transform_multi`, verificando se os agregados calculados em blocos são iguais
+    aos calculados sobre o DataFrame completo e aos obtidos com `groupby` do pandas.
+    """
+    data = pd.DataFrame({
+        'store_location': ['A', 'B', 'A', 'C', 'B', 'A'],
+        'product_id': [1, 2, 1, 3, 2, 2],
+        'quantity': [1, 2, 3, 1, 5, 2],
+        'price': [10.5, 20.0, 10.5, 7.25, 20.0, 3.0]
+    })
+    specs = {
+        'revenue_by_store': {'by': ['store_location'], 'measures': {'revenue': ['sum'], 'price': ['mean', 'max']}},
+        'quantity_by_product': {'by': ['product_id'], 'measures': {'quantity': ['sum', 'count', 'min']}},
+        'quantity_by_store': {'by': ['store_location'], 'measures': {'quantity': ['mean'], 'price': ['max']}}
+    }
+
+    aggregator = MultiAggregator(specs)
+    aggregator.update(data)
+    assert list(aggregator.states) == [('store_location',), ('product_id',)]
+
+    full = transform_multi(data, specs)
+    chunked = transform_multi((data.iloc[i:i + 2] for i in range(0, len(data), 2)), specs)
+
+    expected_store = data.assign(revenue=data['quantity'] * data['price']).groupby('store_location').agg(
+        revenue_sum=('revenue', 'sum'), price_mean=('price', 'mean'), price_max=('price', 'max')).reset_index()
+    expected_product = data.groupby('product_id').agg(
+        quantity_sum=('quantity', 'sum'), quantity_count=('quantity', 'count'),
+        quantity_min=('quantity', 'min')).reset_index()
+    expected_quantity_store = data.groupby('store_location').agg(
+        quantity_mean=('quantity', 'mean'), price_max=('price', 'max')).reset_index()
+
+    for result in (full, chunked):
+        pd.testing.assert_frame_equal(result['revenue_by_store'], expected_store)
+        pd.testing.assert_frame_equal(result['quantity_by_product'], expected_product)
+        pd.testing.assert_frame_equal(result['quantity_by_store'], expected_quantity_store)
+
+    with pytest.raises(ValueError):
+        transform_multi(data, {'invalid': {'by': ['store_location'], 'measures': {'price': ['median']}}})
+
+def test_rollup_cube_derives_coarser_grains_from_daily_cube():
+    """
+    Testa as funções `build_daily_cube` e `rollup_cube`, verificando se os totais semanais e
+    mensais derivados do cubo diário são iguais aos calculados diretamente sobre os dados.
+    """
+    data = pd.DataFrame({
+        'order_date': pd.to_datetime(['2023-01-30', '2023-01-31', '2023-02-01', '2023-02-06', '2023-02-06']),
+        'payment_method': ['Cash', 'Cash', 'Cash', 'PayPal', 'PayPal'],
+        'store_location': ['Houston', 'Houston', 'Houston', 'Miami', 'Miami'],
+        'quantity': [1, 2, 3, 4, 5],
+        'price': [10.0, 20.0, 30.0, 40.0, 50.0]
+    })
+
+    daily = pd.concat([build_daily_cube(data.iloc[:2]), build_daily_cube(data.iloc[2:])], ignore_index=True)
+    cube = rollup_cube(daily)
+
+    weekly = cube[cube['grain'] == 'week']
+    assert weekly['period_start'].dt.strftime('%Y-%m-%d').tolist() == ['2023-01-30', '2023-02-06']
+    assert weekly['price_sum'].tolist() == [60.0, 90.0]
+    assert weekly['price_count'].tolist() == [3, 2]
+
+    monthly = cube[cube['grain'] == 'month']
+    assert monthly['period_start'].dt.strftime('%Y-%m-%d').tolist() == ['2023-01-01', '2023-02-01', '2023-02-01']
+    assert monthly['revenue_sum'].tolist() == [50.0, 90.0, 410.0]
+    assert len(cube[cube['grain'] == 'day']) == 4
+
+def test_transform_parallel_matches_transform_data(tmp_path):
+    """
+    Testa se a extração e a agregação de cada arquivo em um pool de processos retornam o mesmo
+    resultado de `extract_and_consolidate` seguida de `transform_data`, com um arquivo por formato
+    e no modo particionado, com vários arquivos por formato.
+
+    Parameters:
+        tmp_path (pathlib.Path): Diretório temporário fornecido pelo pytest.
+    """
+    single_dir, partitioned_dir = tmp_path / 'single', tmp_path / 'partitioned'
+    generate_scaled_data(str(single_dir), n_rows=3_000)
+    generate_scaled_data(str(partitioned_dir), n_rows=3_000, n_files=2, seed=7)
+
+    expected = transform_data(extract_and_consolidate(str(single_dir)))
+    pd.testing.assert_frame_equal(transform_parallel(str(single_dir), max_workers=3), expected)
+    pd.testing.assert_frame_equal(transform_parallel(str(single_dir), max_workers=1), expected)
+
+    expected = transform_data(extract_and_consolidate(str(partitioned_dir), partitioned=True))
+    result = transform_parallel(str(partitioned_dir), max_workers=2, partitioned=True, sketches=True)
+    pd.testing.assert_frame_equal(result[['payment_method', 'price']], expected)
+    assert summarize_sketches(result)['unique_customers'].between(300, 500).all()
+
+    with pytest.raises(FileNotFoundError):
+        transform_parallel(str(partitioned_dir))